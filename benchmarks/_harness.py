@@ -0,0 +1,146 @@
+"""Shared helpers for the tool benchmarks: emulator/server subprocesses, result parsing, stats."""
+
+import asyncio
+import json
+import math
+import os
+import socket
+import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+PYTHONPATH = os.pathsep.join(p for p in (str(ROOT / "src"), os.environ.get("PYTHONPATH", "")) if p)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def bench_env(gateway_url: str, data_dir: Path) -> dict[str, str]:
+    """Environment pointing the server at the emulator, with client-side throttles lifted.
+
+    Logs go to `data_dir/logs` at WARNING so per-call INFO lines do not dominate timings.
+    """
+    return {
+        "OPENCLAW_GATEWAY_URL": gateway_url,
+        "OPENCLAW_GATEWAY_TOKEN": "",
+        "OPENCLAW_MOLTBOOK_URL": f"{gateway_url}/api/v1",
+        "MOLTBOOK_API_KEY": "bench",
+        "OPENCLAW_MOLTBOOK_REQUESTS_PER_MINUTE": "1000000",
+        "OPENCLAW_DATA_DIR": str(data_dir / "data"),
+        "OPENCLAW_LOG_DIR": str(data_dir / "logs"),
+        "OPENCLAW_LOG_LEVEL": "WARNING",
+        "PYTHONPATH": PYTHONPATH,
+    }
+
+
+async def _wait_http(url: str, proc: asyncio.subprocess.Process, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if proc.returncode is not None:
+                raise RuntimeError(f"process exited with {proc.returncode} before serving {url}")
+            try:
+                await client.get(url, timeout=1.0)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not come up in {timeout}s")
+
+
+@asynccontextmanager
+async def subprocess_server(
+    args: list[str], probe_url: str, env: dict[str, str] | None = None
+) -> AsyncIterator[asyncio.subprocess.Process]:
+    """Start `python <args>`, wait until `probe_url` answers, terminate on exit."""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, *args, env={**os.environ, **(env or {})}, stdout=asyncio.subprocess.DEVNULL
+    )
+    try:
+        await _wait_http(probe_url, proc)
+        yield proc
+    finally:
+        if proc.returncode is None:
+            proc.terminate()
+            try:
+                await asyncio.wait_for(proc.wait(), 10)
+            except TimeoutError:
+                proc.kill()
+
+
+@asynccontextmanager
+async def emulator(profile: Path | None = None) -> AsyncIterator[str]:
+    """Gateway + Moltbook emulator in its own process; yields its base URL."""
+    port = free_port()
+    args = ["-m", "openclaw_molt_mcp.emulator", "--port", str(port)]
+    if profile:
+        args += ["--profile", str(profile)]
+    url = f"http://127.0.0.1:{port}"
+    async with subprocess_server(args, f"{url}/__emulator/stats", {"PYTHONPATH": PYTHONPATH}):
+        yield url
+
+
+@asynccontextmanager
+async def mcp_http_server(env: dict[str, str]) -> AsyncIterator[tuple[str, asyncio.subprocess.Process]]:
+    """`openclaw_molt_mcp.server:app` under uvicorn in its own process; yields (MCP URL, process)."""
+    port = free_port()
+    args = ["-m", "uvicorn", "openclaw_molt_mcp.server:app", "--port", str(port), "--log-level", "warning"]
+    base = f"http://127.0.0.1:{port}"
+    async with subprocess_server(args, f"{base}/mcp", env) as proc:
+        yield f"{base}/mcp", proc
+
+
+def tool_payload(result: Any) -> dict[str, Any]:
+    """Dialogic dict from a CallToolResult (structured data, else the JSON text content)."""
+    data = getattr(result, "data", None)
+    if isinstance(data, dict):
+        return data
+    for part in getattr(result, "content", None) or []:
+        text = getattr(part, "text", None)
+        if isinstance(text, str) and text.startswith("{"):
+            try:
+                return json.loads(text)
+            except ValueError:
+                break
+    return {}
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: list[float], errors: int, wall: float) -> dict[str, Any]:
+    """ops/s and p50/p95/p99 (ms) for one measured run."""
+    ordered = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "ops_per_s": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+    }
+
+
+def rss_mb(pid: int) -> float | None:
+    """Resident set size of a process in MB (Linux /proc; None elsewhere)."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
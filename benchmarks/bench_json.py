@@ -0,0 +1,140 @@
+"""JSON encode/decode throughput for the payloads the server handles most.
+
+Synthesizes a `sessions_list` response, a Moltbook feed and a batch of structured log
+lines, then times `jsoncodec.dumpb`/`loads` with every available backend.
+
+    python benchmarks/bench_json.py                 # table on stdout
+    python benchmarks/bench_json.py --json out.json # also write results
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from openclaw_molt_mcp import jsoncodec
+
+
+def sessions_list(n: int = 1000) -> dict[str, Any]:
+    rnd = random.Random(1)  # noqa: S311 (synthetic payload)
+    return {
+        "sessions": [
+            {
+                "sessionKey": f"agent:main:{rnd.choice(['whatsapp', 'telegram', 'discord'])}:{i}",
+                "kind": rnd.choice(["main", "group", "dm"]),
+                "updatedAt": 1760000000000 + i * 1000,
+                "model": "anthropic/claude-sonnet",
+                "tokens": {"input": rnd.randint(0, 200000), "output": rnd.randint(0, 20000)},
+                "label": f"Session {i} – café ✓",  # noqa: RUF001 (non-ASCII on purpose)
+                "lastMessage": "lorem ipsum dolor sit amet " * rnd.randint(1, 8),
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def feed(n: int = 200) -> dict[str, Any]:
+    rnd = random.Random(2)  # noqa: S311 (synthetic payload)
+    return {
+        "success": True,
+        "posts": [
+            {
+                "id": f"post-{i:06d}",
+                "title": f"Post {i}",
+                "content": "Agents talking to agents. " * rnd.randint(5, 60),
+                "author": {"name": f"molty{i % 37}", "karma": rnd.randint(0, 5000)},
+                "submolt": {"name": rnd.choice(["general", "aithoughts", "tools"])},
+                "upvotes": rnd.randint(0, 900),
+                "comment_count": rnd.randint(0, 120),
+                "created_at": "2026-10-01T12:00:00Z",
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def log_lines(n: int = 10000) -> list[dict[str, Any]]:
+    rnd = random.Random(3)  # noqa: S311 (synthetic payload)
+    return [
+        {
+            "ts": "2026-10-01T12:00:00.123",
+            "level": rnd.choice(["INFO", "INFO", "WARNING", "ERROR"]),
+            "logger": "openclaw_molt_mcp.gateway_client",
+            "message": f"tools_invoke sessions_list took {rnd.random() * 900:.1f}ms",
+            "tool": "clawd_sessions",
+            "operation": "list",
+        }
+        for _ in range(n)
+    ]
+
+
+def _rate(fn, size: int, min_seconds: float) -> dict[str, float]:
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            break
+    return {"ops_per_s": round(runs / elapsed, 1), "mb_per_s": round(size * runs / elapsed / 1e6, 1)}
+
+
+def run(min_seconds: float) -> list[dict[str, Any]]:
+    payloads = {"sessions_list": sessions_list(), "feed": feed(), "log_lines": log_lines()}
+    backends = ["json"] + (["orjson"] if jsoncodec.orjson is not None else [])
+    previous = jsoncodec.backend
+    results = []
+    try:
+        for backend in backends:
+            jsoncodec.use_backend(backend)
+            for name, payload in payloads.items():
+                if name == "log_lines":
+                    # One record per call, as the log formatter and tailer see them.
+                    lines = [jsoncodec.dumpb(p) for p in payload]
+                    size = sum(len(line) for line in lines)
+                    encode = lambda payload=payload: [jsoncodec.dumpb(p) for p in payload]  # noqa: E731
+                    decode = lambda lines=lines: [jsoncodec.loads(line) for line in lines]  # noqa: E731
+                else:
+                    raw = jsoncodec.dumpb(payload)
+                    size = len(raw)
+                    encode = lambda payload=payload: jsoncodec.dumpb(payload)  # noqa: E731
+                    decode = lambda raw=raw: jsoncodec.loads(raw)  # noqa: E731
+                results.append(
+                    {
+                        "backend": backend,
+                        "payload": name,
+                        "bytes": size,
+                        "encode": _rate(encode, size, min_seconds),
+                        "decode": _rate(decode, size, min_seconds),
+                    }
+                )
+    finally:
+        jsoncodec.use_backend(previous)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="minimum time per measurement")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+    results = run(args.seconds)
+    print(
+        f"{'backend':<8} {'payload':<14} {'bytes':>10} {'enc MB/s':>9} {'dec MB/s':>9} {'enc op/s':>9} {'dec op/s':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['backend']:<8} {r['payload']:<14} {r['bytes']:>10} {r['encode']['mb_per_s']:>9} "
+            f"{r['decode']['mb_per_s']:>9} {r['encode']['ops_per_s']:>9} {r['decode']['ops_per_s']:>9}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps({"benchmark": "json", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
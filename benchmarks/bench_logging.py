@@ -0,0 +1,133 @@
+"""Logging throughput through the server's real handler setup (`logging_config.setup_logging`).
+
+Logs typical records (tool call lines with extras, the same inside a trace span, errors with a
+traceback, the per-call `clawd_skills invoked` line, filtered DEBUG calls) to a rotating file
+in a temporary log dir, with stderr sent to /dev/null, and reports records per second (best of
+`--repeat` runs, since file I/O makes single runs noisy). `format_only` runs fresh records
+through the installed formatters the way the handlers do (stderr once, file twice: the
+rotating handler formats each record for its size check), without I/O.
+
+    python benchmarks/bench_logging.py                 # table on stdout
+    python benchmarks/bench_logging.py --json out.json # also write results
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.logging_config import setup_logging
+from openclaw_molt_mcp.tracing import span
+
+gateway = logging.getLogger("openclaw_molt_mcp.gateway_client")
+skills = logging.getLogger("openclaw_molt_mcp.tools.skills")
+
+
+def _info() -> None:
+    gateway.info("tools_invoke %s took %.1fms", "sessions_list", 41.7, extra={"tool": "sessions_list"})
+
+
+def _info_in_span() -> None:
+    with span("tools/call clawd_sessions", kind="server"):
+        _info()
+
+
+def _error() -> None:
+    try:
+        raise TimeoutError("gateway timed out")
+    except TimeoutError as e:
+        gateway.error(
+            "Gateway request failed: %s",
+            e,
+            extra={"tool": "clawd_sessions", "operation": "list", "error_type": type(e).__name__},
+            exc_info=True,
+        )
+
+
+def _noisy() -> None:
+    skills.info("clawd_skills invoked", extra={"tool": "clawd_skills", "operation": "list"})
+
+
+def _debug_filtered() -> None:
+    gateway.debug("response body %s", "x" * 200)
+
+
+def _format_only() -> None:
+    record = gateway.makeRecord(
+        gateway.name,
+        logging.INFO,
+        __file__,
+        1,
+        "tools_invoke %s took %.1fms",
+        ("sessions_list", 41.7),
+        None,
+        extra={"tool": "sessions_list"},
+    )
+    stream_fmt, file_fmt = (h.formatter for h in logging.getLogger().handlers)
+    stream_fmt.format(record)
+    file_fmt.format(record)
+    file_fmt.format(record)
+
+
+SCENARIOS = {
+    "info": _info,
+    "info_in_span": _info_in_span,
+    "error_exc": _error,
+    "noisy_info": _noisy,
+    "debug_filtered": _debug_filtered,
+    "format_only": _format_only,
+}
+
+
+def _rate(fn, min_seconds: float, batch: int = 1000) -> float:
+    runs, start = 0, time.perf_counter()
+    while True:
+        for _ in range(batch):
+            fn()
+        runs += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return round(runs / elapsed, 1)
+
+
+def run(min_seconds: float, repeat: int = 5) -> list[dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        stderr, sys.stderr = sys.stderr, devnull
+        try:
+            setup_logging(Settings(log_dir=Path(tmp), log_level="INFO", log_max_bytes=50 * 1024 * 1024))
+            for name, fn in SCENARIOS.items():
+                best = max(_rate(fn, min_seconds) for _ in range(repeat))
+                results.append({"scenario": name, "records_per_s": best})
+        finally:
+            sys.stderr = stderr
+            for handler in list(logging.getLogger().handlers):
+                handler.close()
+                logging.getLogger().removeHandler(handler)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=0.5, help="minimum time per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per scenario (best is reported)")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+    results = run(args.seconds, args.repeat)
+    print(f"{'scenario':<16} {'records/s':>10}")
+    for r in results:
+        print(f"{r['scenario']:<16} {r['records_per_s']:>10}")
+    if args.json:
+        args.json.write_text(json.dumps({"benchmark": "logging", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
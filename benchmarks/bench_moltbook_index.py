@@ -0,0 +1,108 @@
+"""Query latency of the local Moltbook index (`moltbook_index.MoltbookIndex`) at 100k posts.
+
+Builds an index over synthetic posts whose words follow a Zipf distribution (so common terms
+have long posting lists, as in real feeds), then times `search` for a single common term,
+multi-term queries mixing common and mid-frequency terms, a rare term and a fuzzy query.
+Reports p50/p95/max per query kind; `--max-p95-ms` (default 10) exits 1 when any exact query
+kind is slower at p95, so the script can guard the latency target.
+
+    python benchmarks/bench_moltbook_index.py                  # 100k posts, table on stdout
+    python benchmarks/bench_moltbook_index.py --posts 20000 --json out.json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from openclaw_molt_mcp.moltbook_index import MoltbookIndex
+
+VOCABULARY = 20_000
+
+
+def build(posts: int) -> tuple[MoltbookIndex, float]:
+    rnd = random.Random(7)  # noqa: S311 (synthetic corpus)
+    words = [f"w{i}" for i in range(VOCABULARY)]
+    # Zipf: word i is drawn with probability ~ 1 / (i + 1)
+    cum_weights = list(itertools.accumulate(1 / (i + 1) for i in range(VOCABULARY)))
+    index = MoltbookIndex(max_docs=posts)
+    start = time.perf_counter()
+    for i in range(posts):
+        title = rnd.choices(words, cum_weights=cum_weights, k=6)
+        body = rnd.choices(words, cum_weights=cum_weights, k=rnd.randint(20, 120))
+        index.add({"id": f"p{i}", "kind": "post", "title": " ".join(title), "content": " ".join(title + body)})
+    return index, time.perf_counter() - start
+
+
+QUERIES: dict[str, tuple[list[str], bool]] = {
+    "common_1": (["w0", "w1", "w2", "w3"], False),
+    "terms_2": (["w0 w40", "w1 w75", "w3 w120", "w5 w300"], False),
+    "terms_3": (["w0 w1 w50", "w2 w7 w90", "w1 w4 w200", "w0 w9 w400"], False),
+    "rare_1": (["w15000", "w17000", "w19000", "w12000"], False),
+    "fuzzy_2": (["w0 w1234x", "w2 w4321x"], True),
+}
+
+
+def run(index: MoltbookIndex, repeat: int, limit: int) -> list[dict[str, Any]]:
+    results = []
+    for kind, (queries, fuzzy) in QUERIES.items():
+        # The first call per query may build per-term caches; report it separately.
+        cold = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, limit=limit, fuzzy=fuzzy)
+            cold.append((time.perf_counter() - start) * 1000)
+        samples = []
+        for _ in range(repeat):
+            for query in queries:
+                start = time.perf_counter()
+                index.search(query, limit=limit, fuzzy=fuzzy)
+                samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        results.append(
+            {
+                "query": kind,
+                "fuzzy": fuzzy,
+                "first_ms": round(max(cold), 2),
+                "p50_ms": round(statistics.median(samples), 3),
+                "p95_ms": round(samples[int(0.95 * (len(samples) - 1))], 3),
+                "max_ms": round(samples[-1], 3),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=25, help="timed runs per query")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--max-p95-ms", type=float, default=10.0, help="fail when an exact query kind is slower")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    index, build_s = build(args.posts)
+    print(f"indexed {len(index)} posts, {index.stats()['terms']} terms in {build_s:.1f}s")
+    results = run(index, args.repeat, args.limit)
+    print(f"{'query':<10} {'first ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for r in results:
+        print(f"{r['query']:<10} {r['first_ms']:>9} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['max_ms']:>8}")
+    if args.json:
+        payload = {"benchmark": "moltbook_index", "posts": args.posts, "build_s": round(build_s, 2), "results": results}
+        args.json.write_text(json.dumps(payload, indent=2))
+    slow = [r for r in results if not r["fuzzy"] and r["p95_ms"] > args.max_p95_ms]
+    for r in slow:
+        print(f"{r['query']}: p95 {r['p95_ms']} ms > {args.max_p95_ms} ms")
+    if slow:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Peak memory of buffered vs streamed parsing for a large `sessions_history` response.
+
+Serves a synthetic Tools Invoke response (default 50 MB, generated lazily so the server side
+holds only one chunk) through an in-process httpx transport, then compares:
+
+- `tools_invoke`: reads the whole body and decodes it at once.
+- `tools_invoke_items(limit=50)`: streams and stops after 50 messages.
+- `open_tool_stream`, consuming every item without keeping them (bounded full scan).
+
+    python benchmarks/bench_stream_memory.py [--mb 50] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.gateway_client import GatewayClient
+
+CHUNK = 65536
+
+
+def _message(i: int) -> bytes:
+    return json.dumps(
+        {
+            "id": f"m{i:08d}",
+            "role": "assistant" if i % 2 else "user",
+            "timestamp": 1760000000 + i,
+            "content": "lorem ipsum " * 40,
+        }
+    ).encode()
+
+
+class SyntheticBody(httpx.AsyncByteStream):
+    """`{"ok":true,"result":{"messages":[...]}}` of about `size` bytes, produced chunk by chunk."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    async def __aiter__(self):
+        yield b'{"ok":true,"result":{"messages":['
+        sent, i, pending = 0, 0, []
+        while sent < self.size:
+            item = (b"," if i else b"") + _message(i)
+            pending.append(item)
+            sent += len(item)
+            i += 1
+            if sum(map(len, pending)) >= CHUNK:
+                yield b"".join(pending)
+                pending = []
+        yield b"".join(pending) + b"]}}"
+
+
+def _client(size: int) -> GatewayClient:
+    client = GatewayClient(Settings())
+    client._client = httpx.AsyncClient(
+        base_url=client.settings.gateway_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=SyntheticBody(size))),
+    )
+    return client
+
+
+async def _buffered(client: GatewayClient) -> dict[str, Any]:
+    result = await client.tools_invoke("sessions_history", action="json")
+    return {"items": len(result["data"]["messages"])}
+
+
+async def _limited(client: GatewayClient) -> dict[str, Any]:
+    result = await client.tools_invoke_items("sessions_history", action="json", limit=50)
+    return {"items": len(result["data"]["messages"]), "bytes_read": result["stream"]["bytes_read"]}
+
+
+async def _full_scan(client: GatewayClient) -> dict[str, Any]:
+    count = 0
+    async with client.open_tool_stream("sessions_history", action="json") as stream:
+        async for _ in stream:
+            count += 1
+    return {"items": count, "bytes_read": stream.bytes_read}
+
+
+async def measure(name: str, fn, size: int) -> dict[str, Any]:
+    client = _client(size)
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        out = await fn(client)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await client.close()
+    return {"mode": name, "peak_mb": round(peak / 1e6, 1), "seconds": round(elapsed, 2), **out}
+
+
+async def run(size: int) -> list[dict[str, Any]]:
+    return [
+        await measure("buffered", _buffered, size),
+        await measure("stream_limit_50", _limited, size),
+        await measure("stream_full_scan", _full_scan, size),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=50.0, help="response size in MB")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+    results = asyncio.run(run(int(args.mb * 1e6)))
+    print(f"{'mode':<18} {'peak MB':>8} {'seconds':>8} {'items':>8} {'bytes read':>11}")
+    for r in results:
+        print(f"{r['mode']:<18} {r['peak_mb']:>8} {r['seconds']:>8} {r['items']:>8} {r.get('bytes_read', '-'):>11}")
+    if args.json:
+        args.json.write_text(json.dumps({"benchmark": "stream_memory", "mb": args.mb, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Throughput and latency of every `clawd_*` tool against the Gateway + Moltbook emulator.
+
+Each scenario is one tool call with fixed arguments. For every transport and concurrency
+level the scenario runs `--calls` times with that many calls in flight, and the script reports
+ops/s, p50/p95/p99 latency and errors:
+
+- `inprocess`: FastMCP `Client(transport=mcp)` in this process, as in `tests/conftest.py`.
+- `http`: the server's ASGI app (`openclaw_molt_mcp.server:app`) under uvicorn in a separate
+  process, driven over HTTP Streamable.
+
+The emulator runs in its own process (`--profile` sets its latency/error profile).
+`clawd_openclaw_disconnect` (uninstalls OpenClaw) and `clawd_bastion` (provisions configs,
+calls an external API) are not benchmarked.
+
+    python benchmarks/bench_tools.py --json results.json
+    python benchmarks/bench_tools.py --baseline benchmarks/baseline_tools.json --fail-on-regression
+    python benchmarks/bench_tools.py --save-baseline benchmarks/baseline_tools.json
+
+Results record the host and the git commit of `src/` they were measured on. A baseline is only
+meaningful on the host (and roughly the commit) it was captured on; comparing across either
+prints a warning, and the committed `benchmarks/baseline_tools.json` is a reference, not a gate.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _harness import bench_env, emulator, latency_summary, mcp_http_server, tool_payload
+
+SCENARIOS: dict[str, tuple[str, dict[str, Any]]] = {
+    "sessions.list": ("clawd_sessions", {"operation": "list"}),
+    "sessions.history": ("clawd_sessions", {"operation": "history", "args": {"limit": 50}}),
+    "sessions.history_stream": ("clawd_sessions", {"operation": "history", "stream": True, "limit": 20}),
+    "sessions.send": (
+        "clawd_sessions",
+        {"operation": "send", "args": {"sessionKey": "agent:bench", "message": "benchmark"}},
+    ),
+    "channels.list_channels": ("clawd_channels", {"operation": "list_channels"}),
+    "channels.get_recent_messages": ("clawd_channels", {"operation": "get_recent_messages", "channel": "telegram"}),
+    "channels.unified_inbox": ("clawd_channels", {"operation": "unified_inbox", "limit": 20}),
+    "routing.get_routing_rules": ("clawd_routing", {"operation": "get_routing_rules"}),
+    "agent.send_message": (
+        "clawd_agent",
+        {"operation": "send_message", "message": "ping", "session_key": "agent:bench"},
+    ),
+    "agent.wake": ("clawd_agent", {"operation": "wake", "message": "tick"}),
+    "gateway.status": ("clawd_gateway", {"operation": "status"}),
+    "voice.tts": ("clawd_voice", {"operation": "tts", "text": "hello from the benchmark"}),
+    "moltbook.feed": ("clawd_moltbook", {"operation": "feed", "limit": 20}),
+    "moltbook.search": ("clawd_moltbook", {"operation": "search", "query": "agent"}),
+    "skills.list": ("clawd_skills", {"operation": "list"}),
+    "security.recommendations": ("clawd_security", {"operation": "recommendations"}),
+}
+
+
+def _workspace(root: Path) -> Path:
+    """Small skills workspace for clawd_skills."""
+    for name in ("weather", "calendar", "notes"):
+        skill = root / "workspace" / "skills" / name
+        skill.mkdir(parents=True, exist_ok=True)
+        (skill / "SKILL.md").write_text(f"# {name}\n\nBenchmark skill.\n", encoding="utf-8")
+    return root / "workspace"
+
+
+async def _measure(client: Any, tool: str, args: dict[str, Any], calls: int, concurrency: int) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(calls))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, args, raise_on_error=False)
+                ok = tool_payload(result).get("success", not getattr(result, "is_error", False))
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latency_summary(latencies, errors, time.perf_counter() - started)
+
+
+async def _run_scenarios(
+    client: Any, transport: str, args: argparse.Namespace, workspace: Path
+) -> list[dict[str, Any]]:
+    results = []
+    selected = {k: v for k, v in SCENARIOS.items() if not args.only or any(o in k for o in args.only)}
+    for name, (tool, tool_args) in selected.items():
+        if tool == "clawd_skills":
+            tool_args = {**tool_args, "workspace_path": str(workspace)}
+        await _measure(client, tool, tool_args, min(args.calls, 10), 1)  # warm-up
+        for concurrency in args.concurrency:
+            stats = await _measure(client, tool, tool_args, args.calls, concurrency)
+            results.append({"transport": transport, "scenario": name, "concurrency": concurrency, **stats})
+            print(
+                f"{transport:<9} {name:<30} c={concurrency:<3} {stats['ops_per_s']:>8} ops/s  "
+                f"p50 {stats['p50_ms']:>7}  p95 {stats['p95_ms']:>7}  p99 {stats['p99_ms']:>7} ms  "
+                f"errors {stats['errors']}",
+                flush=True,
+            )
+    return results
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    from fastmcp import Client
+
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="openclaw-bench-") as tmp:
+        workspace = _workspace(Path(tmp))
+        async with emulator(args.profile) as gateway_url:
+            env = bench_env(gateway_url, Path(tmp))
+            if "inprocess" in args.transports:
+                os.environ.update(env)
+                from openclaw_molt_mcp.server import mcp
+
+                async with Client(transport=mcp) as client:
+                    results += await _run_scenarios(client, "inprocess", args, workspace)
+            if "http" in args.transports:
+                async with mcp_http_server(env) as (url, _proc), Client(url) as client:
+                    results += await _run_scenarios(client, "http", args, workspace)
+    return results
+
+
+def _git(*args: str) -> str:
+    root = Path(__file__).resolve().parents[1]
+    cmd = ["git", *args]
+    return subprocess.run(cmd, cwd=root, capture_output=True, text=True, check=True).stdout.strip()  # noqa: S603 (fixed git args)
+
+
+def source_revision() -> str | None:
+    """Short git commit of the checkout, with `-dirty` when `src/` has uncommitted changes."""
+    try:
+        commit = _git("rev-parse", "--short", "HEAD")
+        dirty = _git("status", "--porcelain", "--", "src")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def compare(results: list[dict[str, Any]], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Regressions vs baseline: ops/s lower or p95 higher than `tolerance` (fraction) allows."""
+    known = {(r["transport"], r["scenario"], r["concurrency"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        base = known.get((r["transport"], r["scenario"], r["concurrency"]))
+        if not base:
+            continue
+        label = f"{r['transport']} {r['scenario']} c={r['concurrency']}"
+        if r["ops_per_s"] < base["ops_per_s"] * (1 - tolerance):
+            regressions.append(f"{label}: {r['ops_per_s']} ops/s vs baseline {base['ops_per_s']}")
+        if r["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {r['p95_ms']} ms vs baseline {base['p95_ms']}")
+        if r["errors"] > base["errors"]:
+            regressions.append(f"{label}: {r['errors']} errors vs baseline {base['errors']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transports", nargs="+", choices=["inprocess", "http"], default=["inprocess", "http"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--calls", type=int, default=200, help="calls per scenario and concurrency level")
+    parser.add_argument("--only", nargs="+", help="run scenarios whose name contains any of these")
+    parser.add_argument("--profile", type=Path, help="emulator profile JSON")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression fraction (default 0.25)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--save-baseline", type=Path, help="write results as the new baseline")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    report = {
+        "benchmark": "tools",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "host": platform.node(),
+        "commit": source_revision(),
+        "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "calls": args.calls,
+        "results": results,
+    }
+    for path in (args.json, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        for key in ("host", "commit"):
+            if baseline.get(key) != report[key]:
+                print(f"WARNING baseline {key} {baseline.get(key)!r} differs from this run ({report[key]!r})")
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if not regressions:
+            print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Multi-client load generator against the HTTP Streamable transport.
+
+Opens N independent MCP sessions (one FastMCP `Client` each) against the server's HTTP app
+and has every session issue tool calls from a weighted mix back to back for `--duration`
+seconds. For each step in `--sessions` (e.g. `10 50 200`) it reports:
+
+- session setup cost (connect + initialize, p50/p95) and failed setups,
+- throughput (ops/s), p50/p95/p99 latency and error rate,
+- server RSS sampled every `--sample-interval` seconds (Linux `/proc`).
+
+Throughput that stops growing with more sessions while p95 keeps climbing marks where one
+process saturates. By default the script starts the emulator and the server
+(`openclaw_molt_mcp.server:app` under uvicorn) itself; `--url` targets a running server
+instead (pass `--server-pid` to sample its memory).
+
+    python benchmarks/load_http.py --sessions 10 50 100 --duration 20
+    python benchmarks/load_http.py --mix sessions.list=3 moltbook.feed=1 --json load.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _harness import bench_env, emulator, latency_summary, mcp_http_server, percentile, rss_mb, tool_payload
+from bench_tools import SCENARIOS, _workspace
+
+DEFAULT_MIX = {
+    "sessions.list": 3,
+    "sessions.history": 3,
+    "channels.get_recent_messages": 2,
+    "moltbook.feed": 2,
+    "agent.send_message": 1,
+    "routing.get_routing_rules": 1,
+    "skills.list": 1,
+}
+
+
+def parse_mix(items: list[str] | None) -> dict[str, float]:
+    if not items:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for item in items:
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario {name!r}; choose from: {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def _session(
+    url: str, mix: dict[str, float], workspace: Path, deadline: float, seed: int, out: dict[str, Any]
+) -> None:
+    from fastmcp import Client
+
+    rng = random.Random(seed)  # noqa: S311 (tool mix, not crypto)
+    names, weights = list(mix), list(mix.values())
+    started = time.perf_counter()
+    try:
+        client = Client(url)
+        await client.__aenter__()
+    except Exception:
+        out["setup_failures"] += 1
+        return
+    out["setup"].append(time.perf_counter() - started)
+    try:
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            tool, args = SCENARIOS[name]
+            if tool == "clawd_skills":
+                args = {**args, "workspace_path": str(workspace)}
+            t0 = time.perf_counter()
+            try:
+                result = await client.call_tool(tool, args, raise_on_error=False)
+                ok = tool_payload(result).get("success", not getattr(result, "is_error", False))
+            except Exception:
+                ok = False
+            out["latencies"].append(time.perf_counter() - t0)
+            out["errors"] += not ok
+            out["per_tool"][name] = out["per_tool"].get(name, 0) + 1
+    finally:
+        with contextlib.suppress(Exception):
+            await client.__aexit__(None, None, None)
+
+
+async def _sample_memory(pid: int | None, interval: float, start: float, samples: list[dict[str, float]]) -> None:
+    while pid is not None:
+        rss = rss_mb(pid)
+        if rss is not None:
+            samples.append({"t": round(time.perf_counter() - start, 1), "rss_mb": rss})
+        await asyncio.sleep(interval)
+
+
+async def run_step(
+    url: str, pid: int | None, sessions: int, args: argparse.Namespace, mix: dict[str, float], workspace: Path
+) -> dict[str, Any]:
+    out: dict[str, Any] = {"setup": [], "setup_failures": 0, "latencies": [], "errors": 0, "per_tool": {}}
+    memory: list[dict[str, float]] = []
+    start = time.perf_counter()
+    sampler = asyncio.create_task(_sample_memory(pid, args.sample_interval, start, memory))
+    deadline = start + args.ramp + args.duration
+
+    async def staggered(i: int) -> None:
+        await asyncio.sleep(args.ramp * i / max(1, sessions))
+        await _session(url, mix, workspace, deadline, args.seed + i, out)
+
+    await asyncio.gather(*(staggered(i) for i in range(sessions)))
+    wall = time.perf_counter() - start
+    sampler.cancel()
+    setup = sorted(out["setup"])
+    calls = len(out["latencies"])
+    return {
+        "sessions": sessions,
+        "setup_p50_ms": round(percentile(setup, 50) * 1000, 1),
+        "setup_p95_ms": round(percentile(setup, 95) * 1000, 1),
+        "setup_failures": out["setup_failures"],
+        **latency_summary(out["latencies"], out["errors"], wall),
+        "error_rate": round(out["errors"] / calls, 4) if calls else 0.0,
+        "per_tool": out["per_tool"],
+        "rss_mb_start": memory[0]["rss_mb"] if memory else None,
+        "rss_mb_peak": max((m["rss_mb"] for m in memory), default=None),
+        "memory": memory,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    mix = parse_mix(args.mix)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="openclaw-load-") as tmp:
+        workspace = _workspace(Path(tmp))
+
+        async def steps(url: str, pid: int | None) -> None:
+            for sessions in args.sessions:
+                step = await run_step(url, pid, sessions, args, mix, workspace)
+                results.append(step)
+                print(
+                    f"sessions {sessions:>4}: {step['ops_per_s']:>7} ops/s  "
+                    f"p50 {step['p50_ms']:>8}  p95 {step['p95_ms']:>8}  p99 {step['p99_ms']:>8} ms  "
+                    f"errors {step['error_rate']:.2%}  setup p95 {step['setup_p95_ms']} ms "
+                    f"({step['setup_failures']} failed)  rss {step['rss_mb_start']} -> {step['rss_mb_peak']} MB",
+                    flush=True,
+                )
+
+        if args.url:
+            await steps(args.url, args.server_pid)
+        else:
+            async with emulator(args.profile) as gateway_url:
+                async with mcp_http_server(bench_env(gateway_url, Path(tmp))) as (url, proc):
+                    await steps(url, proc.pid)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sessions", nargs="+", type=int, default=[10, 50, 100], help="concurrent MCP sessions per step"
+    )
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds of load per step after ramp-up")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds over which sessions are opened")
+    parser.add_argument("--mix", nargs="+", help="scenario=weight pairs (scenarios from bench_tools.py)")
+    parser.add_argument("--url", help="MCP endpoint of a running server (default: start one)")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, for memory samples")
+    parser.add_argument("--profile", type=Path, help="emulator profile JSON")
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        args.json.write_text(
+            json.dumps({"benchmark": "load_http", "mix": parse_mix(args.mix), "results": results}, indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
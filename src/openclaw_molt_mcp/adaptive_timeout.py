@@ -0,0 +1,150 @@
+"""Adaptive per-endpoint request timeouts derived from observed latency.
+
+Each (upstream, endpoint) pair keeps a rolling window of successful request latencies.
+Once enough samples exist, the read deadline is `percentile * multiplier`, clamped to
+[floor, ceiling]; until then the ceiling applies. A request that times out is recorded at
+its deadline, so an upstream that genuinely slows down widens its own deadline over time
+instead of timing out forever.
+"""
+
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from openclaw_molt_mcp.config import Settings
+
+T = TypeVar("T")
+
+WINDOW_SIZE = 200
+_ID_SEGMENT = re.compile(r"/(posts|comments|agents|users)/[^/]+")
+
+
+def endpoint_key(path: str) -> str:
+    """Collapse resource ids in a REST path so `/posts/abc/upvote` and `/posts/xyz/upvote` share stats."""
+    return _ID_SEGMENT.sub(lambda m: f"/{m.group(1)}/{{id}}", path.split("?", 1)[0])
+
+
+class LatencyWindow:
+    """Fixed-size window of latencies in seconds."""
+
+    def __init__(self, size: int = WINDOW_SIZE) -> None:
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class AdaptiveTimeoutPolicy:
+    """Per-(upstream, endpoint) deadlines from rolling latency percentiles."""
+
+    def __init__(
+        self,
+        floor: float = 1.0,
+        ceiling: float = 30.0,
+        multiplier: float = 4.0,
+        percentile: float = 0.99,
+        min_samples: int = 20,
+        connect_ceiling: float = 5.0,
+    ) -> None:
+        self.floor = floor
+        self.ceiling = ceiling
+        self.multiplier = multiplier
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.connect_ceiling = connect_ceiling
+        self._windows: dict[tuple[str, str], LatencyWindow] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AdaptiveTimeoutPolicy":
+        return cls(
+            floor=settings.timeout_floor,
+            ceiling=settings.timeout_ceiling,
+            multiplier=settings.timeout_multiplier,
+            percentile=settings.timeout_percentile,
+            min_samples=settings.timeout_min_samples,
+            connect_ceiling=settings.timeout_connect_ceiling,
+        )
+
+    def read_deadline(
+        self, upstream: str, endpoint: str, floor: float | None = None, ceiling: float | None = None
+    ) -> float:
+        """Read deadline in seconds; `floor`/`ceiling` override the policy bounds for this call."""
+        lo = self.floor if floor is None else floor
+        hi = self.ceiling if ceiling is None else ceiling
+        window = self._windows.get((upstream, endpoint))
+        if window is None or len(window.samples) < self.min_samples:
+            return hi
+        return max(lo, min(hi, window.percentile(self.percentile) * self.multiplier))
+
+    def timeout_for(
+        self, upstream: str, endpoint: str, floor: float | None = None, ceiling: float | None = None
+    ) -> httpx.Timeout:
+        """httpx.Timeout with adaptive read/write/pool deadlines and a bounded connect deadline."""
+        read = self.read_deadline(upstream, endpoint, floor, ceiling)
+        return httpx.Timeout(read, connect=min(read, self.connect_ceiling))
+
+    def observe(self, upstream: str, endpoint: str, seconds: float) -> None:
+        window = self._windows.get((upstream, endpoint))
+        if window is None:
+            window = self._windows[(upstream, endpoint)] = LatencyWindow()
+        window.add(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current deadline and latency stats per endpoint (for health/debug output)."""
+        out: dict[str, dict[str, Any]] = {}
+        for (upstream, endpoint), window in self._windows.items():
+            out[f"{upstream} {endpoint}"] = {
+                "samples": len(window.samples),
+                "p50_ms": round(window.percentile(0.5) * 1000, 1),
+                "p99_ms": round(window.percentile(0.99) * 1000, 1),
+                "read_timeout_s": round(self.read_deadline(upstream, endpoint), 2),
+            }
+        return out
+
+    def reset(self) -> None:
+        self._windows.clear()
+
+
+_policy: AdaptiveTimeoutPolicy | None = None
+
+
+def get_timeout_policy(settings: Settings | None = None) -> AdaptiveTimeoutPolicy:
+    """Process-wide policy; latency history outlives the per-call HTTP clients."""
+    global _policy
+    if _policy is None:
+        _policy = AdaptiveTimeoutPolicy.from_settings(settings or Settings())
+    return _policy
+
+
+def reset_timeout_policy() -> None:
+    """Drop the shared policy (tests, config reload)."""
+    global _policy
+    _policy = None
+
+
+async def timed_call(  # noqa: UP047 (mypy targets 3.11)
+    policy: AdaptiveTimeoutPolicy,
+    upstream: str,
+    endpoint: str,
+    call: Callable[[httpx.Timeout], Awaitable[T]],
+    floor: float | None = None,
+    ceiling: float | None = None,
+) -> T:
+    """Run `call(timeout)` under the adaptive deadline and record the observed latency."""
+    timeout = policy.timeout_for(upstream, endpoint, floor, ceiling)
+    start = time.perf_counter()
+    try:
+        result = await call(timeout)
+    except httpx.TimeoutException:
+        policy.observe(upstream, endpoint, timeout.read or policy.ceiling)
+        raise
+    policy.observe(upstream, endpoint, time.perf_counter() - start)
+    return result
@@ -0,0 +1,137 @@
+"""Relay partial agent output while a /hooks/agent turn is in flight.
+
+`/hooks/agent` only returns once the whole turn is done. `stream_agent_turn` runs that call in
+the background and polls `sessions_history` for the same session, yielding the assistant text
+produced since the turn started. The MCP tool forwards these updates as progress
+notifications and the webapp as server-sent events, so users see output long before the turn
+completes.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from openclaw_molt_mcp.gateway_client import GatewayClient
+
+HISTORY_LIMIT = 20
+_MESSAGE_KEYS = ("messages", "history", "transcript", "items")
+
+
+def history_messages(payload: Any) -> list[dict[str, Any]]:
+    """Message list from a sessions_history result (tolerates the common envelope shapes)."""
+    if isinstance(payload, list):
+        return [m for m in payload if isinstance(m, dict)]
+    if not isinstance(payload, dict):
+        return []
+    for key in _MESSAGE_KEYS:
+        if isinstance(payload.get(key), list):
+            return history_messages(payload[key])
+    if "details" in payload:
+        return history_messages(payload["details"])
+    return []
+
+
+def message_text(message: dict[str, Any]) -> str:
+    """Plain text of one transcript message (string content or a list of text parts)."""
+    content = message.get("content", message.get("text", ""))
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = [p.get("text", "") for p in content if isinstance(p, dict) and p.get("type", "text") == "text"]
+        return "".join(p for p in parts if isinstance(p, str))
+    return ""
+
+
+def _message_id(message: dict[str, Any]) -> Any:
+    return message.get("id") or message.get("timestamp") or message
+
+
+def assistant_text_since(messages: list[dict[str, Any]], anchor: Any) -> str:
+    """Assistant text in `messages` after the one identified by `anchor` (all of it if not found)."""
+    start = 0
+    if anchor is not None:
+        for i in range(len(messages) - 1, -1, -1):
+            if _message_id(messages[i]) == anchor:
+                start = i + 1
+                break
+    texts = [message_text(m) for m in messages[start:] if m.get("role") == "assistant"]
+    return "\n\n".join(t for t in texts if t)
+
+
+async def _fetch_history(client: GatewayClient, session_key: str) -> list[dict[str, Any]] | None:
+    result = await client.tools_invoke(
+        tool="sessions_history",
+        action="json",
+        args={"limit": HISTORY_LIMIT},
+        session_key=session_key,
+    )
+    if not result.get("success"):
+        return None
+    return history_messages(result.get("data"))
+
+
+async def stream_agent_turn(
+    client: GatewayClient,
+    message: str,
+    session_key: str = "main",
+    deliver: bool = False,
+    channel: str | None = None,
+    to: str | None = None,
+    thinking: str | None = None,
+    timeout_seconds: float | None = None,
+    poll_interval: float = 0.5,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Run one agent turn, yielding `partial` events and finally a `result` event.
+
+    `partial` events carry the full assistant text so far (`text`) and what is new since the
+    previous event (`delta`; the full text again if the transcript was rewritten). The final
+    `result` event carries the dialogic `/hooks/agent` result. If history is unavailable the
+    turn still runs and only the `result` event is produced. Closing the iterator early
+    cancels the Gateway request.
+    """
+    started = time.perf_counter()
+    baseline = await _fetch_history(client, session_key)
+    polling = baseline is not None
+    anchor = _message_id(baseline[-1]) if baseline else None
+    turn = asyncio.create_task(
+        client.hooks_agent(
+            message=message,
+            session_key=session_key,
+            deliver=deliver,
+            channel=channel,
+            to=to,
+            thinking=thinking,
+            timeout_seconds=timeout_seconds,
+        )
+    )
+    emitted = ""
+    try:
+        while True:
+            done, _ = await asyncio.wait({turn}, timeout=poll_interval)
+            if polling:
+                messages = await _fetch_history(client, session_key)
+                text = assistant_text_since(messages, anchor) if messages is not None else ""
+                if text and text != emitted:
+                    delta = text[len(emitted) :] if text.startswith(emitted) else text
+                    emitted = text
+                    yield {
+                        "type": "partial",
+                        "text": text,
+                        "delta": delta,
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                    }
+            if done:
+                break
+        yield {
+            "type": "result",
+            "result": turn.result(),
+            "text": emitted,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    finally:
+        if not turn.done():
+            turn.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await turn
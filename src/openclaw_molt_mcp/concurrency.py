@@ -0,0 +1,56 @@
+"""Bounded-concurrency fan-out helpers shared by bulk tool operations."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_CONCURRENCY = 32
+
+
+async def gather_bounded(  # noqa: UP047 (mypy targets 3.11)
+    items: Sequence[T],
+    fn: Callable[[T], Awaitable[dict[str, Any]]],
+    limit: int = 5,
+) -> list[dict[str, Any]]:
+    """Run `fn` over `items` with at most `limit` in flight; results keep input order.
+
+    `fn` returns a dialogic dict (`success`, `message`, `data`/`error`). Each result gets
+    `elapsed_ms`; an exception raised by `fn` becomes a failed result instead of aborting
+    the other items.
+    """
+    semaphore = asyncio.Semaphore(max(1, min(limit, MAX_CONCURRENCY)))
+
+    async def run(item: T) -> dict[str, Any]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = dict(await fn(item))
+            except Exception as e:
+                logger.error(
+                    "Bulk item failed: %s",
+                    e,
+                    extra={"tool": "concurrency", "operation": "gather_bounded", "error_type": type(e).__name__},
+                    exc_info=True,
+                )
+                result = {"success": False, "message": f"Failed: {e!s}", "error": str(e)}
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            return result
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def summarize(results: list[dict[str, Any]], started: float) -> dict[str, Any]:
+    """Counts and wall time for a bulk `data` payload."""
+    succeeded = sum(1 for r in results if r.get("success"))
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
@@ -1,6 +1,7 @@
 """Configuration for openclaw-molt-mcp."""
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +33,86 @@ class Settings(BaseSettings):
         default="https://www.moltbook.com/api/v1",
         description="Moltbook API base URL (use www to preserve Authorization header)",
     )
+    moltbook_requests_per_minute: int = Field(
+        default=100,
+        description="Client-side Moltbook request budget per minute (API limit: 100/min)",
+    )
+    moltbook_comment_interval: float = Field(
+        default=20.0,
+        description="Minimum seconds between Moltbook comments (API limit: 1 per 20 sec)",
+    )
+    moltbook_post_interval: float = Field(
+        default=1800.0,
+        description="Minimum seconds between Moltbook posts (API limit: 1 per 30 min)",
+    )
+    retry_max_attempts: int = Field(
+        default=3,
+        description="Max attempts per upstream request (1 disables retries)",
+    )
+    retry_backoff_base: float = Field(
+        default=0.2,
+        description="Base seconds for full-jitter exponential backoff between retries",
+    )
+    retry_backoff_max: float = Field(
+        default=5.0,
+        description="Upper bound in seconds for a single backoff sleep",
+    )
+    retry_after_max: float = Field(
+        default=30.0,
+        description="Longest Retry-After (seconds) honored on 429/503 before giving up",
+    )
+    breaker_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive upstream failures that open the circuit breaker",
+    )
+    breaker_reset_timeout: float = Field(
+        default=30.0,
+        description="Seconds an open circuit fails fast before letting a half-open probe through",
+    )
+    timeout_floor: float = Field(
+        default=1.0,
+        description="Lowest adaptive read timeout in seconds for any upstream endpoint",
+    )
+    timeout_ceiling: float = Field(
+        default=30.0,
+        description="Highest adaptive read timeout in seconds (used until enough latency samples exist)",
+    )
+    timeout_multiplier: float = Field(
+        default=4.0,
+        description="Adaptive read timeout = observed latency percentile x multiplier",
+    )
+    timeout_percentile: float = Field(
+        default=0.99,
+        description="Latency percentile (0-1) the adaptive timeout is derived from",
+    )
+    timeout_min_samples: int = Field(
+        default=20,
+        description="Samples per endpoint before the adaptive timeout replaces the ceiling",
+    )
+    timeout_connect_ceiling: float = Field(
+        default=5.0,
+        description="Highest connect timeout in seconds",
+    )
+    jobs_max_concurrent: int = Field(
+        default=8,
+        description="Background jobs (async run_agent) running at once; others queue",
+    )
+    jobs_max_pending: int = Field(
+        default=256,
+        description="Max queued + running background jobs before new submissions are rejected",
+    )
+    jobs_max_retained: int = Field(
+        default=500,
+        description="Max jobs kept in the registry (oldest finished jobs are evicted first)",
+    )
+    jobs_ttl_seconds: float = Field(
+        default=3600.0,
+        description="Seconds a finished job's result is kept",
+    )
+    agent_stream_poll_interval: float = Field(
+        default=0.5,
+        description="Seconds between sessions_history polls while streaming an agent turn",
+    )
     openclaw_path: str = Field(
         default="openclaw",
         description="Path to openclaw CLI binary",
@@ -44,6 +125,14 @@ class Settings(BaseSettings):
         default_factory=lambda: Path.home() / ".openclaw-molt-mcp" / "logs",
         description="Log directory. Set OPENCLAW_LOG_DIR to override.",
     )
+    data_dir: Path = Field(
+        default_factory=lambda: Path.home() / ".openclaw-molt-mcp" / "data",
+        description="Local data directory (transcript store). Set OPENCLAW_DATA_DIR to override.",
+    )
+    archive_codec: Literal["auto", "zstd", "gzip"] = Field(
+        default="auto",
+        description="Transcript archive compression (auto: zstd if 'zstandard' is installed, else gzip)",
+    )
     log_level: str = Field(
         default="INFO",
         description="Log level: DEBUG, INFO, WARNING, ERROR",
@@ -56,3 +145,63 @@ class Settings(BaseSettings):
         default=3,
         description="Number of backup log files to keep",
     )
+    record_calls: bool = Field(
+        default=False,
+        description="Record every MCP tool call (redacted) to record_path as NDJSON for replay",
+    )
+    record_path: Path | None = Field(
+        default=None,
+        description="Call recording file (default: <log_dir>/calls.ndjson)",
+    )
+    record_redact_text: bool = Field(
+        default=True,
+        description="Replace message/content/text argument values with a length marker when recording",
+    )
+    profile_tools: str = Field(
+        default="",
+        description=(
+            "Comma-separated tools to cProfile at startup ('*' = all); empty = off (toggle at runtime via clawd_admin)"
+        ),
+    )
+    profile_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction (0-1) of calls to profiled tools that are actually profiled",
+    )
+    profile_dir: Path | None = Field(
+        default=None,
+        description="Profile output directory (default: <log_dir>/profiles)",
+    )
+    profile_max_files: int = Field(
+        default=50,
+        description="Profiles kept in profile_dir; the oldest are deleted beyond this",
+    )
+    trace_export: bool = Field(
+        default=False,
+        description="Append finished traces (tool call -> upstream spans) as OTLP/JSON lines to trace_export_path",
+    )
+    trace_export_path: Path | None = Field(
+        default=None,
+        description="Trace export file (default: <log_dir>/traces.otlp.jsonl)",
+    )
+    slow_call_ms: float = Field(
+        default=2000.0,
+        description=(
+            "Tool calls / API requests / upstream requests at least this slow go to the slow-call journal (0 = off)"
+        ),
+    )
+    slow_call_buffer: int = Field(
+        default=200,
+        description="Slow-call entries kept in memory per process",
+    )
+    slow_call_path: Path | None = Field(
+        default=None,
+        description="Slow-call journal file (default: <log_dir>/slow-calls.jsonl; rotated like the log file)",
+    )
+    log_sampling: str = Field(
+        default="openclaw_molt_mcp.tools=10",
+        description="Per-logger cap on INFO/DEBUG records per second, 'logger=rate,...' (prefix match; empty = off)",
+    )
+    log_level_ttl_seconds: float = Field(
+        default=900.0,
+        description="Default lifetime of a runtime log level override (clawd_admin set_log_level) before it reverts",
+    )
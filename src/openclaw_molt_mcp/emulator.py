@@ -0,0 +1,537 @@
+"""Local stand-in for the OpenClaw Gateway and the Moltbook v1 API (ASGI).
+
+One Starlette app serves both upstreams so benchmarks and resilience tests run offline:
+
+- Gateway: `POST /tools/invoke` (sessions_list / sessions_history / sessions_send, channels,
+  routing, tts), `POST /hooks/wake`, `POST /hooks/agent`.
+- Moltbook under `/api/v1`: feed, search, posts, comments, upvotes, DM inbox.
+- `GET /__emulator/stats` (per-endpoint counters) and `POST /__emulator/reset`.
+
+Behaviour comes from an `EmulatorProfile` (JSON file or defaults): per-endpoint latency
+distributions, error rates, per-upstream rate limits (429 with Retry-After) and payload sizes.
+State (transcripts, channel messages, posts) lives in memory and is generated deterministically
+from `seed`.
+
+    python -m openclaw_molt_mcp.emulator --port 18789 --profile profile.json
+    OPENCLAW_GATEWAY_URL=http://127.0.0.1:18789 OPENCLAW_MOLTBOOK_URL=http://127.0.0.1:18789/api/v1
+
+Endpoint names used for overrides: `<tool>` or `<tool>.<action>` for Tools Invoke (e.g.
+`sessions_list`, `channels.get_recent_messages`), `hooks.wake`, `hooks.agent`, and
+`<METHOD> <path>` for Moltbook with ids replaced by `{id}` (e.g. `GET /feed`,
+`POST /posts/{id}/comments`).
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import random
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+
+from openclaw_molt_mcp.adaptive_timeout import endpoint_key
+from openclaw_molt_mcp.jsoncodec import dumpb, loads
+
+WORDS = (
+    "agent",
+    "claw",
+    "molt",
+    "session",
+    "channel",
+    "route",
+    "reply",
+    "voice",
+    "skill",
+    "gateway",
+    "lobster",
+    "shell",
+)
+
+
+class LatencyProfile(BaseModel):
+    """Response delay distribution in milliseconds."""
+
+    distribution: Literal["fixed", "uniform", "normal", "lognormal", "exponential"] = "fixed"
+    mean_ms: float = 0.0
+    # uniform: half-width; normal/lognormal: standard deviation (long right tail for lognormal).
+    spread_ms: float = 0.0
+    max_ms: float = 60000.0
+
+    def sample(self, rng: random.Random) -> float:
+        """One delay in seconds."""
+        mean, spread = self.mean_ms, self.spread_ms
+        if self.distribution == "uniform":
+            ms = rng.uniform(mean - spread, mean + spread)
+        elif self.distribution == "normal":
+            ms = rng.gauss(mean, spread)
+        elif self.distribution == "lognormal":
+            # Parameters of the underlying normal giving this mean and standard deviation.
+            sigma = math.sqrt(math.log1p((spread / mean) ** 2)) if mean > 0 else 0.0
+            ms = rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma) if mean > 0 else 0.0
+        elif self.distribution == "exponential":
+            ms = rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+        else:
+            ms = mean
+        return max(0.0, min(ms, self.max_ms)) / 1000.0
+
+
+class EndpointProfile(BaseModel):
+    """Latency and failure injection for one endpoint."""
+
+    latency: LatencyProfile = Field(default_factory=LatencyProfile)
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    error_status: int = 500
+
+
+class RateLimitProfile(BaseModel):
+    """Sliding-window request limit; excess requests get 429 with Retry-After."""
+
+    requests: int = 0  # 0 = unlimited
+    per_seconds: float = 60.0
+
+
+class UpstreamProfile(BaseModel):
+    default: EndpointProfile = Field(default_factory=EndpointProfile)
+    endpoints: dict[str, EndpointProfile] = Field(default_factory=dict)
+    rate_limit: RateLimitProfile = Field(default_factory=RateLimitProfile)
+
+    def endpoint(self, name: str) -> EndpointProfile:
+        """Override for `name`, else for its tool (`tool.action` -> `tool`), else the default."""
+        if name in self.endpoints:
+            return self.endpoints[name]
+        return self.endpoints.get(name.split(".", 1)[0], self.default)
+
+
+class PayloadProfile(BaseModel):
+    """Sizes of generated data."""
+
+    sessions: int = 20
+    history_messages: int = 200
+    message_chars: int = 200
+    channels: list[str] = Field(default_factory=lambda: ["whatsapp", "telegram", "discord", "slack"])
+    channel_messages: int = 50
+    feed_posts: int = 100
+    post_chars: int = 400
+    dm_messages: int = 5
+
+
+class EmulatorProfile(BaseModel):
+    seed: int = 0
+    gateway_token: str | None = None
+    gateway: UpstreamProfile = Field(default_factory=UpstreamProfile)
+    moltbook: UpstreamProfile = Field(default_factory=UpstreamProfile)
+    payload: PayloadProfile = Field(default_factory=PayloadProfile)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "EmulatorProfile":
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.endpoints: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"requests": 0, "errors": 0, "rate_limited": 0, "bytes_out": 0, "delay_s": 0.0}
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        out = {name: dict(v, delay_s=round(v["delay_s"], 3)) for name, v in sorted(self.endpoints.items())}
+        return {"endpoints": out, "requests": sum(v["requests"] for v in out.values())}
+
+
+class EmulatorState:
+    """In-memory upstream data plus counters and rate-limit windows."""
+
+    def __init__(self, profile: EmulatorProfile) -> None:
+        self.profile = profile
+        self.reset()
+
+    def reset(self) -> None:
+        self.rng = random.Random(self.profile.seed)  # noqa: S311 (simulated latency, not crypto)
+        self.stats = _Stats()
+        self.windows: dict[str, deque[float]] = defaultdict(deque)
+        self.ids = itertools.count(1)
+        self.transcripts: dict[str, list[dict[str, Any]]] = {}
+        self.channel_log: dict[str, list[dict[str, Any]]] = {}
+        self.posts: list[dict[str, Any]] | None = None
+        self.routing_rules = [{"channel": c, "sessionKey": f"agent:main:{c}"} for c in self.profile.payload.channels]
+        self.clock = 1_760_000_000.0
+
+    # -- generated data ------------------------------------------------------
+
+    def text(self, chars: int) -> str:
+        words: list[str] = []
+        size = 0
+        while size < chars:
+            word = self.rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        return " ".join(words)[:chars]
+
+    def _tick(self) -> float:
+        self.clock += 1.0
+        return self.clock
+
+    def message(self, role: str, content: str) -> dict[str, Any]:
+        return {"id": f"msg-{next(self.ids)}", "role": role, "content": content, "timestamp": self._tick()}
+
+    def session_keys(self) -> list[str]:
+        keys = ["main", *(f"agent:main:{c}" for c in self.profile.payload.channels)]
+        keys += [f"agent:worker-{i}" for i in range(max(0, self.profile.payload.sessions - len(keys)))]
+        keys = keys[: max(1, self.profile.payload.sessions)]
+        return keys + [k for k in self.transcripts if k not in keys]
+
+    def transcript(self, session_key: str) -> list[dict[str, Any]]:
+        if session_key not in self.transcripts:
+            size = self.profile.payload.message_chars
+            self.transcripts[session_key] = [
+                self.message("user" if i % 2 == 0 else "assistant", self.text(size))
+                for i in range(self.profile.payload.history_messages)
+            ]
+        return self.transcripts[session_key]
+
+    def channel_messages(self, channel: str) -> list[dict[str, Any]]:
+        """Messages of a channel, oldest first."""
+        if channel not in self.channel_log:
+            self.channel_log[channel] = [
+                {
+                    **self.message("user", self.text(self.profile.payload.message_chars)),
+                    "channel": channel,
+                    "from": f"+1555{i:07d}",
+                }
+                for i in range(self.profile.payload.channel_messages)
+            ]
+        return self.channel_log[channel]
+
+    def feed(self) -> list[dict[str, Any]]:
+        """Moltbook posts, newest first."""
+        if self.posts is None:
+            self.posts = [
+                self.post(self.text(self.profile.payload.post_chars)) for _ in range(self.profile.payload.feed_posts)
+            ]
+            self.posts.reverse()
+        return self.posts
+
+    def post(self, content: str) -> dict[str, Any]:
+        n = next(self.ids)
+        return {
+            "id": f"post-{n}",
+            "title": content[:60],
+            "content": content,
+            "author": {"name": f"molty{n % 17}"},
+            "submolt": {"name": self.rng.choice(["general", "aithoughts", "tools"])},
+            "upvotes": self.rng.randint(0, 500),
+            "comment_count": 0,
+            "comments": [],
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self._tick())),
+        }
+
+    # -- behaviour -----------------------------------------------------------
+
+    def rate_limited(self, upstream: str, limit: RateLimitProfile) -> float | None:
+        """Seconds until a slot frees up if the window is full, else record the request."""
+        if limit.requests <= 0:
+            return None
+        now = time.monotonic()
+        window = self.windows[upstream]
+        while window and now - window[0] >= limit.per_seconds:
+            window.popleft()
+        if len(window) >= limit.requests:
+            return limit.per_seconds - (now - window[0])
+        window.append(now)
+        return None
+
+
+def _json(data: Any, status: int = 200, headers: dict[str, str] | None = None) -> Response:
+    return Response(dumpb(data), status_code=status, media_type="application/json", headers=headers)
+
+
+async def _respond(
+    state: EmulatorState, upstream: str, name: str, handler: Callable[[], tuple[int, dict[str, Any]]]
+) -> Response:
+    """Apply rate limit, latency and error injection around `handler()` and count the call."""
+    stats = state.stats.endpoints[f"{upstream} {name}"]
+    stats["requests"] += 1
+    profile: UpstreamProfile = getattr(state.profile, upstream)
+    wait = state.rate_limited(upstream, profile.rate_limit)
+    if wait is not None:
+        stats["rate_limited"] += 1
+        return _json(
+            {"ok": False, "error": {"type": "rate_limited", "message": "Too many requests"}},
+            429,
+            {"Retry-After": str(max(1, math.ceil(wait)))},
+        )
+    endpoint = profile.endpoint(name)
+    delay = endpoint.latency.sample(state.rng)
+    stats["delay_s"] += delay
+    if delay:
+        await asyncio.sleep(delay)
+    if endpoint.error_rate and state.rng.random() < endpoint.error_rate:
+        stats["errors"] += 1
+        return _json({"ok": False, "error": {"type": "injected", "message": "Injected failure"}}, endpoint.error_status)
+    status, data = handler()
+    response = _json(data, status)
+    stats["bytes_out"] += len(response.body)
+    return response
+
+
+async def _body(request: Request) -> dict[str, Any]:
+    raw = await request.body()
+    if not raw:
+        return {}
+    try:
+        body = loads(raw)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _limit(args: dict[str, Any], default: int) -> int:
+    try:
+        return max(0, int(args.get("limit", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _tool_result(
+    state: EmulatorState, tool: str, action: str | None, args: dict[str, Any], session_key: str
+) -> tuple[int, dict[str, Any]]:
+    """Tools Invoke semantics: `(status, {"ok": ..., "result" | "error": ...})`."""
+    p = state.profile.payload
+    if tool == "sessions_list":
+        sessions = [
+            {
+                "sessionKey": key,
+                "kind": "main" if key == "main" else "agent",
+                "updatedAt": int(state.clock * 1000),
+                "messages": len(state.transcripts.get(key, ())) or p.history_messages,
+            }
+            for key in state.session_keys()
+        ]
+        return 200, {"ok": True, "result": {"sessions": sessions[: _limit(args, len(sessions))]}}
+    if tool == "sessions_history":
+        messages = state.transcript(session_key)
+        limit = _limit(args, len(messages))
+        return 200, {"ok": True, "result": {"messages": messages[-limit:] if limit else []}}
+    if tool == "sessions_send":
+        target = str(args.get("sessionKey") or session_key)
+        message = state.message("user", str(args.get("message", "")))
+        state.transcript(target).append(message)
+        return 200, {"ok": True, "result": {"status": "sent", "sessionKey": target, "messageId": message["id"]}}
+    if tool == "channels":
+        channel = str(args.get("channel") or (p.channels[0] if p.channels else "default"))
+        if action == "list_channels":
+            return 200, {"ok": True, "result": {"channels": [{"name": c, "enabled": True} for c in p.channels]}}
+        if action == "get_channel_config":
+            return 200, {
+                "ok": True,
+                "result": {"channel": channel, "enabled": channel in p.channels, "dmPolicy": "pairing"},
+            }
+        if action == "get_recent_messages":
+            messages = state.channel_messages(channel)
+            limit = _limit(args, 20)
+            return 200, {"ok": True, "result": {"messages": list(reversed(messages[-limit:])) if limit else []}}
+        if action == "send_message":
+            message = {
+                **state.message("assistant", str(args.get("message", ""))),
+                "channel": channel,
+                "to": args.get("to"),
+            }
+            state.channel_messages(channel).append(message)
+            return 200, {"ok": True, "result": {"status": "sent", "messageId": message["id"]}}
+    if tool == "routing":
+        if action == "get_routing_rules":
+            return 200, {"ok": True, "result": {"rules": state.routing_rules}}
+        if action == "update_routing":
+            rules = args.get("rules")
+            if isinstance(rules, list):
+                state.routing_rules = rules
+            return 200, {"ok": True, "result": {"updated": True, "rules": len(state.routing_rules)}}
+        if action in ("test_routing", "get_session_by_channel"):
+            channel = str(args.get("channel", ""))
+            match = next((r for r in state.routing_rules if r.get("channel") == channel), None)
+            return 200, {
+                "ok": True,
+                "result": {"channel": channel, "sessionKey": match["sessionKey"] if match else "main"},
+            }
+    if tool == "tts":
+        text = str(args.get("text", ""))
+        return 200, {
+            "ok": True,
+            "result": {"media": f"MEDIA:/tmp/openclaw-emulator/tts-{next(state.ids)}.mp3", "chars": len(text)},
+        }
+    name = f"{tool}.{action}" if action else tool
+    return 404, {"ok": False, "error": {"type": "not_found", "message": f"Tool not available: {name}"}}
+
+
+def _authorized(state: EmulatorState, request: Request) -> bool:
+    token = state.profile.gateway_token
+    return not token or request.headers.get("authorization") == f"Bearer {token}"
+
+
+def _unauthorized() -> Response:
+    return _json({"ok": False, "error": {"type": "unauthorized", "message": "Invalid token"}}, 401)
+
+
+async def tools_invoke(request: Request) -> Response:
+    state: EmulatorState = request.app.state.emulator
+    if not _authorized(state, request):
+        return _unauthorized()
+    body = await _body(request)
+    tool = str(body.get("tool", ""))
+    action = body.get("action")
+    action = str(action) if action and action != "json" else None
+    raw_args = body.get("args")
+    args: dict[str, Any] = raw_args if isinstance(raw_args, dict) else {}
+    session_key = str(body.get("sessionKey") or "main")
+    name = f"{tool}.{action}" if action else tool
+    return await _respond(state, "gateway", name, lambda: _tool_result(state, tool, action, args, session_key))
+
+
+async def hooks_wake(request: Request) -> Response:
+    state: EmulatorState = request.app.state.emulator
+    if not _authorized(state, request):
+        return _unauthorized()
+    body = await _body(request)
+    return await _respond(state, "gateway", "hooks.wake", lambda: (200, {"ok": True, "mode": body.get("mode", "now")}))
+
+
+async def hooks_agent(request: Request) -> Response:
+    """Append the message and a generated assistant reply to the session transcript."""
+    state: EmulatorState = request.app.state.emulator
+    if not _authorized(state, request):
+        return _unauthorized()
+    body = await _body(request)
+    session_key = str(body.get("sessionKey") or "main")
+
+    def run() -> tuple[int, dict[str, Any]]:
+        transcript = state.transcript(session_key)
+        transcript.append(state.message("user", str(body.get("message", ""))))
+        reply = state.message("assistant", state.text(state.profile.payload.message_chars))
+        transcript.append(reply)
+        return 200, {
+            "ok": True,
+            "runId": f"run-{next(state.ids)}",
+            "sessionKey": session_key,
+            "reply": reply["content"],
+        }
+
+    return await _respond(state, "gateway", "hooks.agent", run)
+
+
+def _moltbook_result(
+    state: EmulatorState, method: str, path: str, request: Request, body: dict[str, Any]
+) -> tuple[int, dict[str, Any]]:
+    parts = [p for p in path.split("/") if p]
+    posts = state.feed()
+    if method == "GET" and parts == ["feed"]:
+        limit = _limit(dict(request.query_params), 25)
+        return 200, {"success": True, "posts": posts[:limit]}
+    if method == "GET" and parts == ["search"]:
+        q = request.query_params.get("q", "").lower()
+        return 200, {"success": True, "results": [p for p in posts if q in p["content"].lower()][:25]}
+    if method == "GET" and parts == ["agents", "dm", "inbox"]:
+        messages = [state.message("user", state.text(80)) for _ in range(state.profile.payload.dm_messages)]
+        return 200, {"success": True, "messages": messages}
+    if method == "POST" and parts == ["posts"]:
+        created = state.post(str(body.get("content", "")))
+        posts.insert(0, created)
+        return 201, {"success": True, "post": created}
+    if len(parts) >= 2 and parts[0] == "posts":
+        post = next((p for p in posts if p["id"] == parts[1]), None)
+        if post is None:
+            return 404, {"success": False, "error": "Post not found"}
+        if method == "GET" and len(parts) == 2:
+            return 200, {"success": True, "post": post}
+        if method == "POST" and parts[2:] == ["upvote"]:
+            post["upvotes"] += 1
+            return 200, {"success": True, "upvotes": post["upvotes"]}
+        if method == "POST" and parts[2:] == ["comments"]:
+            comment = {"id": f"comment-{next(state.ids)}", "content": str(body.get("content", ""))}
+            post["comments"].append(comment)
+            post["comment_count"] += 1
+            return 201, {"success": True, "comment": comment}
+    return 404, {"success": False, "error": f"Not found: {method} /{path}"}
+
+
+async def moltbook(request: Request) -> Response:
+    state: EmulatorState = request.app.state.emulator
+    path = request.path_params["path"]
+    body = await _body(request) if request.method == "POST" else {}
+    name = f"{request.method} {endpoint_key('/' + path)}"
+    return await _respond(state, "moltbook", name, lambda: _moltbook_result(state, request.method, path, request, body))
+
+
+async def stats(request: Request) -> Response:
+    return _json(request.app.state.emulator.stats.snapshot())
+
+
+async def reset(request: Request) -> Response:
+    request.app.state.emulator.reset()
+    return _json({"ok": True})
+
+
+def create_app(profile: EmulatorProfile | None = None) -> Starlette:
+    """ASGI app emulating the Gateway at `/` and Moltbook at `/api/v1`."""
+    app = Starlette(
+        routes=[
+            Route("/tools/invoke", tools_invoke, methods=["POST"]),
+            Route("/hooks/wake", hooks_wake, methods=["POST"]),
+            Route("/hooks/agent", hooks_agent, methods=["POST"]),
+            Route("/__emulator/stats", stats, methods=["GET"]),
+            Route("/__emulator/reset", reset, methods=["POST"]),
+            Mount("/api/v1", routes=[Route("/{path:path}", moltbook, methods=["GET", "POST"])]),
+        ]
+    )
+    app.state.emulator = EmulatorState(profile or EmulatorProfile())
+    return app
+
+
+@asynccontextmanager
+async def run_emulator(
+    profile: EmulatorProfile | None = None, host: str = "127.0.0.1", port: int = 0
+) -> AsyncIterator[str]:
+    """Serve the emulator with uvicorn in the current event loop; yields its base URL."""
+    import uvicorn
+
+    config = uvicorn.Config(create_app(profile), host=host, port=port, log_level="warning", lifespan="off")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if task.done():
+                task.result()
+            await asyncio.sleep(0.01)
+        bound = server.servers[0].sockets[0].getsockname()[1]
+        yield f"http://{host}:{bound}"
+    finally:
+        server.should_exit = True
+        await task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenClaw Gateway + Moltbook emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18789)
+    parser.add_argument("--profile", type=Path, help="EmulatorProfile JSON file")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    profile = EmulatorProfile.load(args.profile) if args.profile else EmulatorProfile()
+    print(f"Gateway:  OPENCLAW_GATEWAY_URL=http://{args.host}:{args.port}")
+    print(f"Moltbook: OPENCLAW_MOLTBOOK_URL=http://{args.host}:{args.port}/api/v1")
+    uvicorn.run(create_app(profile), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
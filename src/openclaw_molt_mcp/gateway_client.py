@@ -1,14 +1,41 @@
 """HTTP client for OpenClaw Gateway Tools Invoke and Webhooks API."""
 
 import logging
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
 import httpx
 
+from openclaw_molt_mcp.adaptive_timeout import get_timeout_policy, timed_call
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.json_stream import JSONItemStream
+from openclaw_molt_mcp.jsoncodec import response_json
+from openclaw_molt_mcp.resilience import CircuitOpenError, RetryPolicy, get_breaker, send_with_resilience
+from openclaw_molt_mcp.tracing import TracingClient, span
 
 logger = logging.getLogger(__name__)
 
+# Extra seconds on top of a caller's agent timeout so the Gateway can report its own timeout.
+AGENT_TIMEOUT_GRACE = 5.0
+
+# Bytes per read when streaming a response body.
+STREAM_CHUNK_SIZE = 65536
+
+# Read-only Gateway tools/actions: safe to retry after a timeout or 5xx.
+IDEMPOTENT_TOOLS = frozenset({"sessions_list", "sessions_history"})
+IDEMPOTENT_ACTIONS = frozenset(
+    {
+        "list_channels",
+        "get_channel_config",
+        "get_recent_messages",
+        "get_routing_rules",
+        "test_routing",
+        "get_session_by_channel",
+    }
+)
+
 
 def _dialogic_success(message: str, data: Any | None = None) -> dict[str, Any]:
     """Return dialogic success response (conversational + structured)."""
@@ -26,12 +53,27 @@ def _dialogic_error(message: str, error: str | None = None) -> dict[str, Any]:
     return result
 
 
+def _circuit_open(e: CircuitOpenError) -> dict[str, Any]:
+    """Dialogic error for a call rejected by an open circuit breaker."""
+    return _dialogic_error(
+        f"Gateway marked unavailable after repeated failures; retrying in {e.retry_in:.0f}s.",
+        error="circuit_open",
+    )
+
+
+def _is_idempotent(tool: str, action: str | None) -> bool:
+    return tool in IDEMPOTENT_TOOLS or (action is not None and action in IDEMPOTENT_ACTIONS)
+
+
 class GatewayClient:
     """Client for OpenClaw Gateway HTTP API."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or Settings()
         self._client: httpx.AsyncClient | None = None
+        self.breaker = get_breaker(f"gateway:{self.settings.gateway_url}", self.settings)
+        self.retry_policy = RetryPolicy.from_settings(self.settings)
+        self.timeouts = get_timeout_policy(self.settings)
 
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -41,13 +83,51 @@ class GatewayClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = TracingClient(
+                "gateway",
                 base_url=self.settings.gateway_url,
                 headers=self._headers(),
-                timeout=30.0,
+                timeout=self.settings.timeout_ceiling,
             )
         return self._client
 
+    async def _post(
+        self,
+        path: str,
+        body: dict[str, Any],
+        idempotent: bool = False,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """POST through the retry policy and circuit breaker; raises like raise_for_status.
+
+        Each attempt gets an adaptive deadline tracked per `endpoint` (default: the path),
+        unless the caller passes an explicit `timeout` in seconds. With `stream=True` the
+        body is not read (the deadline covers the response headers); the caller must close
+        the response.
+        """
+        client = await self._get_client()
+        endpoint = endpoint or path
+
+        def post(t: httpx.Timeout) -> Awaitable[httpx.Response]:
+            if stream:
+                return client.send(client.build_request("POST", path, json=body, timeout=t), stream=True)
+            return client.post(path, json=body, timeout=t)
+
+        def send() -> Awaitable[httpx.Response]:
+            if timeout is not None:
+                return post(httpx.Timeout(timeout, connect=min(timeout, self.timeouts.connect_ceiling)))
+            return timed_call(self.timeouts, "gateway", endpoint, post)
+
+        try:
+            with span(f"gateway {endpoint}", endpoint=endpoint, idempotent=idempotent):
+                return await send_with_resilience(send, self.breaker, self.retry_policy, idempotent)
+        except httpx.HTTPStatusError as e:
+            if stream:
+                await e.response.aclose()
+            raise
+
     async def tools_invoke(
         self,
         tool: str,
@@ -61,16 +141,21 @@ class GatewayClient:
             body["action"] = action
 
         try:
-            client = await self._get_client()
-            resp = await client.post("/tools/invoke", json=body)
-            resp.raise_for_status()
-            data = resp.json()
+            resp = await self._post(
+                "/tools/invoke",
+                body,
+                idempotent=_is_idempotent(tool, action),
+                endpoint=f"{tool}.{action}" if action else tool,
+            )
+            data = response_json(resp)
             if data.get("ok"):
                 return _dialogic_success("Tool invoked successfully.", data.get("result"))
             return _dialogic_error(
                 data.get("error", {}).get("message", "Tool invocation failed"),
                 error=str(data.get("error", {})),
             )
+        except CircuitOpenError as e:
+            return _circuit_open(e)
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Gateway HTTP error: %s",
@@ -99,13 +184,115 @@ class GatewayClient:
             )
             return _dialogic_error("Could not reach Gateway. Is OpenClaw running?", error=str(e))
 
+    @asynccontextmanager
+    async def open_tool_stream(
+        self,
+        tool: str,
+        action: str | None = None,
+        args: dict[str, Any] | None = None,
+        session_key: str = "main",
+    ) -> AsyncIterator[JSONItemStream]:
+        """POST /tools/invoke and parse the response body incrementally.
+
+        Yields a JSONItemStream; iterate it for the items of the result list. Leaving the
+        block closes the connection, so breaking out early skips the rest of the body.
+        Raises like `_post` (and ValueError for a malformed body while iterating).
+        """
+        body: dict[str, Any] = {"tool": tool, "args": args or {}, "sessionKey": session_key}
+        if action:
+            body["action"] = action
+        resp = await self._post(
+            "/tools/invoke",
+            body,
+            idempotent=_is_idempotent(tool, action),
+            endpoint=f"{tool}.{action}" if action else tool,
+            stream=True,
+        )
+        try:
+            yield JSONItemStream(resp.aiter_bytes(STREAM_CHUNK_SIZE))
+        finally:
+            await resp.aclose()
+
+    async def tools_invoke_items(
+        self,
+        tool: str,
+        action: str | None = None,
+        args: dict[str, Any] | None = None,
+        session_key: str = "main",
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Like `tools_invoke`, but streams the response and keeps at most `limit` items.
+
+        `data` has the same shape as `tools_invoke` (the list truncated to `limit`); the
+        result gains `stream` = {items, stopped_early, bytes_read}.
+        """
+        items: list[Any] = []
+        try:
+            async with self.open_tool_stream(tool, action, args, session_key) as stream:
+                async for item in stream:
+                    items.append(item)
+                    if limit is not None and len(items) >= limit:
+                        break
+            if not stream.ok:
+                error = stream.envelope.get("error") or {}
+                message = error.get("message") if isinstance(error, dict) else None
+                return _dialogic_error(message or "Tool invocation failed", error=str(error))
+            result = _dialogic_success("Tool invoked successfully.", stream.data(items))
+            result["stream"] = {
+                "items": len(items),
+                "stopped_early": not stream.complete,
+                "bytes_read": stream.bytes_read,
+            }
+            return result
+        except CircuitOpenError as e:
+            return _circuit_open(e)
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Gateway HTTP error: %s",
+                e,
+                extra={
+                    "tool": "gateway_client",
+                    "operation": "tools_invoke_items",
+                    "error_type": "HTTPStatusError",
+                },
+                exc_info=True,
+            )
+            return _dialogic_error(
+                f"Gateway returned {e.response.status_code}",
+                error=str(e),
+            )
+        except httpx.RequestError as e:
+            logger.error(
+                "Gateway request error: %s",
+                e,
+                extra={
+                    "tool": "gateway_client",
+                    "operation": "tools_invoke_items",
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+            return _dialogic_error("Could not reach Gateway. Is OpenClaw running?", error=str(e))
+        except ValueError as e:
+            logger.error(
+                "Gateway response parse error: %s",
+                e,
+                extra={
+                    "tool": "gateway_client",
+                    "operation": "tools_invoke_items",
+                    "error_type": "ValueError",
+                },
+                exc_info=True,
+            )
+            return _dialogic_error("Gateway returned malformed JSON.", error=str(e))
+
     async def hooks_wake(self, text: str, mode: str = "now") -> dict[str, Any]:
         """Trigger wake via POST /hooks/wake."""
         try:
-            client = await self._get_client()
-            resp = await client.post("/hooks/wake", json={"text": text, "mode": mode})
-            resp.raise_for_status()
+            await self._post("/hooks/wake", {"text": text, "mode": mode})
             return _dialogic_success("Wake triggered successfully.")
+        except CircuitOpenError as e:
+            return _circuit_open(e)
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Wake HTTP error: %s",
@@ -138,8 +325,14 @@ class GatewayClient:
         deliver: bool = True,
         channel: str | None = None,
         to: str | None = None,
+        thinking: str | None = None,
+        timeout_seconds: float | None = None,
     ) -> dict[str, Any]:
-        """Send message to agent via POST /hooks/agent."""
+        """Send message to agent via POST /hooks/agent.
+
+        `thinking` and `timeout_seconds` are forwarded as `thinking`/`timeoutSeconds`; with a
+        timeout the HTTP read deadline is the run timeout plus AGENT_TIMEOUT_GRACE seconds.
+        """
         body: dict[str, Any] = {
             "message": message,
             "sessionKey": session_key,
@@ -149,13 +342,21 @@ class GatewayClient:
             body["channel"] = channel
         if to:
             body["to"] = to
+        if thinking:
+            body["thinking"] = thinking
+        if timeout_seconds:
+            body["timeoutSeconds"] = timeout_seconds
 
         try:
-            client = await self._get_client()
-            resp = await client.post("/hooks/agent", json=body)
-            resp.raise_for_status()
-            data = resp.json()
+            resp = await self._post(
+                "/hooks/agent",
+                body,
+                timeout=timeout_seconds + AGENT_TIMEOUT_GRACE if timeout_seconds else None,
+            )
+            data = response_json(resp)
             return _dialogic_success("Agent hook triggered successfully.", data)
+        except CircuitOpenError as e:
+            return _circuit_open(e)
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Agent hook HTTP error: %s",
@@ -182,7 +383,12 @@ class GatewayClient:
             return _dialogic_error("Could not reach Gateway.", error=str(e))
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Close HTTP client.
+
+        Shielded so that closing still completes (and drops in-flight connections) when the
+        caller is being cancelled, e.g. after an MCP cancellation notification.
+        """
         if self._client:
-            await self._client.aclose()
-            self._client = None
+            client, self._client = self._client, None
+            with anyio.CancelScope(shield=True):
+                await client.aclose()
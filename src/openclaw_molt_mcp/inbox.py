@@ -0,0 +1,134 @@
+"""Cross-channel inbox helpers: timestamp normalization, k-way merge and continuation cursors.
+
+Each channel's recent messages arrive newest first. `merge_newest_first` combines the
+per-channel lists with a heap-based k-way merge (O(n log k)) rather than concatenating and
+re-sorting, and stops as soon as a page is full. Cursors are opaque URL-safe strings holding
+the timestamp of the last message returned plus the ids already returned at that timestamp,
+so a following page neither repeats nor skips messages that share a timestamp.
+"""
+
+import base64
+import binascii
+import heapq
+import itertools
+import json
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+TIMESTAMP_FIELDS = ("timestamp", "ts", "date", "created_at", "createdAt", "time")
+ID_FIELDS = ("id", "message_id", "messageId")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation cursor cannot be decoded."""
+
+
+def message_timestamp(message: dict[str, Any]) -> float:
+    """Epoch seconds for a message; accepts seconds, milliseconds or ISO 8601. Unknown -> 0."""
+    for field in TIMESTAMP_FIELDS:
+        value = message.get(field)
+        if value is None or value == "":
+            continue
+        if isinstance(value, (int, float)):
+            return float(value) / 1000.0 if value > 1e12 else float(value)
+        if isinstance(value, str):
+            try:
+                return message_timestamp({field: float(value)})
+            except ValueError:
+                pass
+            try:
+                return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue
+    return 0.0
+
+
+def message_id(message: dict[str, Any]) -> str:
+    """Stable identity for cursor bookkeeping (explicit id, else channel + timestamp + text)."""
+    for field in ID_FIELDS:
+        if message.get(field) is not None:
+            return str(message[field])
+    text = str(message.get("text") or message.get("content") or message.get("body") or "")
+    return f"{message.get('channel', '')}:{message_timestamp(message)}:{text[:64]}"
+
+
+def channel_messages(payload: Any) -> list[dict[str, Any]]:
+    """Message list from a get_recent_messages result (list or {messages: [...]})."""
+    if isinstance(payload, dict):
+        payload = payload.get("messages", payload.get("items", []))
+    if not isinstance(payload, list):
+        return []
+    return [m for m in payload if isinstance(m, dict)]
+
+
+def channel_names(payload: Any) -> list[str]:
+    """Channel names from a list_channels result (strings or objects with name/id/channel)."""
+    if isinstance(payload, dict):
+        payload = payload.get("channels", payload.get("items", []))
+    names: list[str] = []
+    for entry in payload if isinstance(payload, list) else []:
+        if isinstance(entry, str):
+            names.append(entry)
+        elif isinstance(entry, dict):
+            name = entry.get("name") or entry.get("id") or entry.get("channel")
+            if name:
+                names.append(str(name))
+    return list(dict.fromkeys(names))
+
+
+def merge_newest_first(streams: Iterable[list[dict[str, Any]]], limit: int) -> list[dict[str, Any]]:
+    """K-way merge of per-channel lists into one newest-first list of at most `limit` messages.
+
+    Each input is sorted newest first (upstream order is not trusted), then merged with
+    `heapq.merge`; ties keep channel order.
+    """
+    ordered = [sorted(s, key=message_timestamp, reverse=True) for s in streams]
+    merged = heapq.merge(*ordered, key=message_timestamp, reverse=True)
+    return list(itertools.islice(merged, max(0, limit)))
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+    if not isinstance(state, dict):
+        raise InvalidCursorError("Invalid cursor: expected an object")
+    return state
+
+
+def after_cursor(messages: list[dict[str, Any]], before: float, seen: set[str]) -> list[dict[str, Any]]:
+    """Messages strictly older than `before`, plus ones at `before` not returned yet."""
+    out = []
+    for m in messages:
+        ts = message_timestamp(m)
+        if ts < before or (ts == before and message_id(m) not in seen):
+            out.append(m)
+    return out
+
+
+def page_cursor(
+    page: list[dict[str, Any]],
+    channels: list[str],
+    depth: dict[str, int],
+    before: float | None = None,
+    seen: set[str] | None = None,
+) -> str:
+    """Cursor continuing after the last message of `page`.
+
+    `depth` is how many messages have been consumed per channel, so the next page can ask each
+    channel for enough messages even when the upstream has no "before" filter. `before`/`seen`
+    come from the previous cursor and carry over when a page ends on the same timestamp.
+    """
+    last = message_timestamp(page[-1])
+    ids = {message_id(m) for m in page if message_timestamp(m) == last}
+    if before == last and seen:
+        ids |= seen
+    return encode_cursor({"before": last, "seen": sorted(ids), "channels": channels, "depth": depth})
@@ -0,0 +1,196 @@
+"""In-process registry of background jobs (long-running agent turns).
+
+`clawd_agent run_agent` with `async=true` submits the Gateway call here and returns a job id
+immediately; callers poll `job_status`, await `job_result` or `job_cancel` it. A semaphore
+caps how many jobs run at once (the rest wait as `queued`), and finished jobs are evicted
+after a TTL or once more than `max_retained` are kept. A job outlives the tool call that
+submitted it, so it runs in a trace of its own (root span `job <kind>`).
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.tracing import detached_context, span
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = frozenset({SUCCEEDED, FAILED, CANCELLED})
+
+
+class JobLimitError(Exception):
+    """Raised when too many jobs are queued or running to accept another."""
+
+
+@dataclass
+class Job:
+    """One background job and its outcome."""
+
+    id: str
+    kind: str
+    meta: dict[str, Any]
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    def to_dict(self, include_result: bool = False) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "meta": self.meta,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.started_at is not None:
+            end = self.finished_at or time.time()
+            out["elapsed_s"] = round(end - self.started_at, 3)
+        if self.error:
+            out["error"] = self.error
+        if include_result:
+            out["result"] = self.result
+        return out
+
+
+class JobRegistry:
+    """Concurrency-capped job runner with bounded retention."""
+
+    def __init__(
+        self, max_concurrent: int = 8, max_pending: int = 256, max_retained: int = 500, ttl_seconds: float = 3600.0
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self.ttl_seconds = ttl_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "JobRegistry":
+        return cls(
+            max_concurrent=settings.jobs_max_concurrent,
+            max_pending=settings.jobs_max_pending,
+            max_retained=settings.jobs_max_retained,
+            ttl_seconds=settings.jobs_ttl_seconds,
+        )
+
+    def submit(
+        self, kind: str, factory: Callable[[], Awaitable[dict[str, Any]]], meta: dict[str, Any] | None = None
+    ) -> Job:
+        """Schedule `factory()` as a job. Its dialogic result decides succeeded/failed."""
+        self._prune()
+        active = sum(1 for j in self._jobs.values() if j.status not in FINISHED)
+        if active >= self.max_pending:
+            raise JobLimitError(f"{active} jobs already queued or running (limit {self.max_pending}).")
+        job = Job(id=uuid.uuid4().hex, kind=kind, meta=meta or {})
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, factory), name=f"job-{kind}-{job.id}", context=detached_context())
+        return job
+
+    async def _run(self, job: Job, factory: Callable[[], Awaitable[dict[str, Any]]]) -> None:
+        try:
+            async with self._semaphore:
+                job.status = RUNNING
+                job.started_at = time.time()
+                with span(f"job {job.kind}", job_id=job.id, operation=job.kind):
+                    result = await factory()
+            job.result = result
+            job.status = SUCCEEDED if result.get("success") else FAILED
+            if job.status == FAILED:
+                job.error = result.get("error") or result.get("message")
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+        except Exception as e:
+            logger.error(
+                "Job %s failed: %s",
+                job.id,
+                e,
+                extra={"tool": "jobs", "operation": job.kind, "error_type": type(e).__name__},
+                exc_info=True,
+            )
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+
+    def get(self, job_id: str) -> Job | None:
+        self._prune()
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Job | None:
+        """Wait up to `timeout` seconds for a job to finish; returns it either way."""
+        job = self.get(job_id)
+        if job is None or job.task is None or job.status in FINISHED or timeout <= 0:
+            return job
+        await asyncio.wait({job.task}, timeout=timeout)
+        return job
+
+    async def cancel(self, job_id: str) -> Job | None:
+        """Cancel a queued or running job (aborting its upstream request)."""
+        job = self.get(job_id)
+        if job is None or job.task is None or job.status in FINISHED:
+            return job
+        job.task.cancel()
+        await asyncio.wait({job.task}, timeout=5)
+        if job.status not in FINISHED:
+            # Cancelled before the task body ever ran
+            job.status = CANCELLED
+            job.finished_at = time.time()
+        return job
+
+    def list(self) -> list[dict[str, Any]]:
+        self._prune()
+        return [j.to_dict() for j in reversed(self._jobs.values())]
+
+    def counts(self) -> dict[str, int]:
+        out: dict[str, int] = {}
+        for job in self._jobs.values():
+            out[job.status] = out.get(job.status, 0) + 1
+        return out
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        finished = [j for j in self._jobs.values() if j.status in FINISHED]
+        for job in finished:
+            if (job.finished_at or 0) < cutoff:
+                del self._jobs[job.id]
+        overflow = len(self._jobs) - self.max_retained
+        for job in finished:
+            if overflow <= 0:
+                break
+            if job.id in self._jobs:
+                del self._jobs[job.id]
+                overflow -= 1
+
+
+_registry: JobRegistry | None = None
+
+
+def get_job_registry(settings: Settings | None = None) -> JobRegistry:
+    """Process-wide registry (MCP server and webapp API each have their own)."""
+    global _registry
+    if _registry is None:
+        _registry = JobRegistry.from_settings(settings or Settings())
+    return _registry
+
+
+def reset_job_registry() -> None:
+    """Drop the shared registry (tests)."""
+    global _registry
+    _registry = None
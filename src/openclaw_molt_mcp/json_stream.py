@@ -0,0 +1,194 @@
+"""Incremental JSON parsing for large Gateway responses.
+
+`JSONItemStream` reads a Tools Invoke response (`{"ok": ..., "result": ...}`) chunk by chunk
+and yields the elements of the item list inside `result` one at a time: `result` itself when
+it is an array, else the first array under one of `ITEM_KEYS` (e.g. `result.sessions`,
+`result.messages`). Only the current chunk and the item being decoded are held in memory, so a
+caller can stop after `limit` items without downloading or materializing the rest.
+
+Everything else is decoded normally and kept: top-level keys (`ok`, `error`) in `envelope`,
+sibling keys of the item list in `fields`, and a `result` without any list in `result`.
+"""
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Generator
+from typing import Any
+
+from openclaw_molt_mcp.shaping import LIST_KEYS
+
+ITEM_KEYS = ("sessions", *LIST_KEYS)
+# Minimum extra text to buffer before retrying a value that did not fit the buffer.
+MIN_READ = 16384
+
+_WHITESPACE = " \t\n\r"
+_NEED = object()
+_decoder = json.JSONDecoder()
+
+
+class _NeedMore(Exception):
+    """The buffer ends inside the token being parsed."""
+
+
+class _Scanner:
+    """Text buffer with a read position; methods raise _NeedMore until enough text arrived."""
+
+    def __init__(self) -> None:
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.want = 0
+
+    def feed(self, text: str) -> None:
+        if self.pos:
+            self.buf = self.buf[self.pos :]
+            self.want -= self.pos
+            self.pos = 0
+        self.buf += text
+
+    def _more(self, extra: int) -> _NeedMore:
+        self.want = len(self.buf) + extra
+        return _NeedMore()
+
+    def peek(self) -> str:
+        """Next non-whitespace character (not consumed)."""
+        buf, pos = self.buf, self.pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self.pos = pos
+        if pos < len(buf):
+            return buf[pos]
+        if self.eof:
+            raise ValueError("Unexpected end of JSON response")
+        raise self._more(1)
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value at the read position."""
+        self.peek()
+        try:
+            value, end = _decoder.raw_decode(self.buf, self.pos)
+        except json.JSONDecodeError as e:
+            if self.eof:
+                raise ValueError(f"Invalid JSON response: {e}") from e
+            # Grow geometrically so a large value is re-scanned O(log n) times, not per chunk.
+            raise self._more(max(MIN_READ, len(self.buf) - self.pos)) from None
+        if end == len(self.buf) and not self.eof and isinstance(value, (int, float)) and not isinstance(value, bool):
+            raise self._more(1)  # a number may continue in the next chunk
+        self.pos = end
+        return value
+
+
+class JSONItemStream:
+    """Async iterator over the items of a streamed Tools Invoke response body."""
+
+    def __init__(self, chunks: AsyncIterable[bytes], item_keys: tuple[str, ...] = ITEM_KEYS) -> None:
+        self._chunks = chunks
+        self._item_keys = item_keys
+        self._scan = _Scanner()
+        self.envelope: dict[str, Any] = {}
+        self.fields: dict[str, Any] = {}
+        self.container: str | None = None
+        self.has_items = False
+        self.result: Any = None
+        self.complete = False
+        self.bytes_read = 0
+
+    def _read(self, fn: Callable[[], Any]) -> Generator[Any, None, Any]:
+        while True:
+            try:
+                return fn()
+            except _NeedMore:
+                yield _NEED
+
+    def _object(self, on_key: Callable[[str], Generator[Any, None, None]]) -> Generator[Any, None, None]:
+        s = self._scan
+        yield from self._read(lambda: s.expect("{"))
+        while True:
+            c = yield from self._read(s.peek)
+            if c == "}":
+                s.pos += 1
+                return
+            if c == ",":
+                s.pos += 1
+                continue
+            key = yield from self._read(s.value)
+            yield from self._read(lambda: s.expect(":"))
+            yield from on_key(str(key))
+
+    def _array(self) -> Generator[Any, None, None]:
+        s = self._scan
+        self.has_items = True
+        yield from self._read(lambda: s.expect("["))
+        while True:
+            c = yield from self._read(s.peek)
+            if c == "]":
+                s.pos += 1
+                return
+            if c == ",":
+                s.pos += 1
+                continue
+            yield (yield from self._read(s.value))
+
+    def _result_key(self, key: str) -> Generator[Any, None, None]:
+        c = yield from self._read(self._scan.peek)
+        if c == "[" and not self.has_items and key in self._item_keys:
+            self.container = key
+            yield from self._array()
+        else:
+            self.fields[key] = yield from self._read(self._scan.value)
+
+    def _top_key(self, key: str) -> Generator[Any, None, None]:
+        if key != "result":
+            self.envelope[key] = yield from self._read(self._scan.value)
+            return
+        c = yield from self._read(self._scan.peek)
+        if c == "[":
+            yield from self._array()
+        elif c == "{":
+            self.result = self.fields
+            yield from self._object(self._result_key)
+        else:
+            self.result = yield from self._read(self._scan.value)
+
+    def _parse(self) -> Generator[Any, None, None]:
+        yield from self._object(self._top_key)
+        self.complete = True
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        s = self._scan
+        text = codecs.getincrementaldecoder("utf-8")()
+        chunks = aiter(self._chunks)
+        for event in self._parse():
+            if event is not _NEED:
+                yield event
+                continue
+            while not s.eof and len(s.buf) < s.want:
+                try:
+                    chunk = await anext(chunks)
+                except StopAsyncIteration:
+                    s.feed(text.decode(b"", final=True))
+                    s.eof = True
+                    break
+                self.bytes_read += len(chunk)
+                s.feed(text.decode(chunk))
+
+    @property
+    def ok(self) -> bool:
+        """Gateway success flag; a result seen before `ok` (stopped early) counts as success."""
+        if "ok" in self.envelope:
+            return bool(self.envelope["ok"])
+        return self.has_items or self.result is not None
+
+    def data(self, items: list[Any]) -> Any:
+        """`result` rebuilt with `items` in place of the streamed list."""
+        if not self.has_items:
+            return self.result
+        if self.container is None:
+            return items
+        return {**self.fields, self.container: items}
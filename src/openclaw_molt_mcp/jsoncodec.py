@@ -0,0 +1,81 @@
+"""Single JSON codec for hot paths: orjson when installed, stdlib `json` otherwise.
+
+Gateway/Moltbook/Ollama response parsing, structured log lines, log tailing, the transcript
+store/archive and the webapp API responses all go through this module, so the backend is
+chosen in one place. Install the fast backend with `pip install openclaw-molt-mcp[fast]`;
+set OPENCLAW_JSON_BACKEND=json to force the stdlib (e.g. to compare in benchmarks).
+
+Both backends produce compact UTF-8 JSON (no spaces after separators, non-ASCII unescaped)
+and stringify unknown types with `str()`. orjson renders datetimes as ISO 8601 natively.
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
+BACKENDS = ("orjson", "json")
+
+
+def _std_dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str, sort_keys=sort_keys).encode()
+
+
+def _std_loads(data: bytes | bytearray | memoryview | str) -> Any:
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _orjson_dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def _orjson_loads(data: bytes | bytearray | memoryview | str) -> Any:
+    return orjson.loads(data)
+
+
+backend = "json"
+_dumpb = _std_dumpb
+_loads = _std_loads
+
+
+def use_backend(name: str) -> str:
+    """Select `orjson` or `json`; falls back to `json` if orjson is not installed. Returns the backend used."""
+    global backend, _dumpb, _loads
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    if name == "orjson" and orjson is not None:
+        backend, _dumpb, _loads = "orjson", _orjson_dumpb, _orjson_loads
+    else:
+        backend, _dumpb, _loads = "json", _std_dumpb, _std_loads
+    return backend
+
+
+def dumpb(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    return _dumpb(obj, sort_keys)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize to a compact JSON string."""
+    return _dumpb(obj, sort_keys).decode()
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON from bytes or str (raises ValueError on invalid input)."""
+    return _loads(data)
+
+
+def response_json(resp: Any) -> Any:
+    """Parse an httpx response body with the codec (falls back to `resp.json()` for non-bytes bodies)."""
+    content = getattr(resp, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return _loads(content)
+    return resp.json()
+
+
+use_backend(os.environ.get("OPENCLAW_JSON_BACKEND", "orjson"))
@@ -0,0 +1,276 @@
+"""Filtered queries over the structured log (current and rotated files) through a sidecar index.
+
+`LogIndex(log_path).query(level="WARNING", tool="clawd_sessions", since="2026-10-19T14:00")`
+returns matching JSON log lines, newest first, from `openclaw-molt-mcp.log` and its backups
+(`.log.1`, `.log.2`, ...). `<log_dir>/log-index.json` keeps, per log file, minute buckets:
+
+    {"minute": "2026-10-19T14:03", "start": 81234, "end": 90210, "levels": {"INFO": 40, "ERROR": 2},
+     "tools": {"clawd_sessions": [81234, 88001, 12]}, "operations": [...], "error_types": [...]}
+
+`start`/`end` are byte offsets of the bucket's lines, `tools` the range and count of each tool's
+lines. A query skips buckets outside the time range or without a matching level, operation or
+error type, reads only the tool's range when filtering by tool, and checks every line it reads.
+
+Files are identified by a digest of their first line, so a file keeps its entry when rotation
+renames it; each refresh indexes only bytes appended since the last one (complete lines only)
+and drops entries of deleted backups.
+"""
+
+import hashlib
+import os
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from openclaw_molt_mcp.jsoncodec import dumpb, loads
+from openclaw_molt_mcp.serve_logs import _redact_entry
+
+INDEX_FILE = "log-index.json"
+INDEX_VERSION = 1
+LEVEL_RANK = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+MAX_LIMIT = 5000
+CHUNK = 1024 * 1024
+
+
+def log_files(path: Path) -> list[Path]:
+    """The log file and its numbered backups, newest first."""
+    backups = [p for p in path.parent.glob(f"{path.name}.*") if p.suffix[1:].isdigit()]
+    return [path, *sorted(backups, key=lambda p: int(p.suffix[1:]))]
+
+
+def parse_time(value: str | float | None) -> str | None:
+    """ISO-8601 (naive = UTC) or epoch seconds -> the UTC form used by log lines, for string comparison."""
+    if value is None or value == "":
+        return None
+    try:
+        seconds: float | None = float(value)
+    except ValueError:
+        seconds = None
+    try:
+        if seconds is not None:
+            dt = datetime.fromtimestamp(seconds, UTC)
+        else:
+            dt = datetime.fromisoformat(str(value))
+            dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+    except (OverflowError, OSError, ValueError) as e:  # inf, 1e20, nan, garbage
+        raise ValueError(f"invalid time {value!r}: expected ISO-8601 or epoch seconds") from e
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _digest(first_line: bytes) -> str:
+    return hashlib.blake2b(first_line, digest_size=12).hexdigest()
+
+
+def _first_line_digest(fh: BinaryIO) -> str | None:
+    fh.seek(0)
+    first = fh.readline()
+    return _digest(first) if first.endswith(b"\n") else None
+
+
+def _add_line(buckets: list[dict[str, Any]], entry: Any, start: int, end: int) -> None:
+    record = entry if isinstance(entry, dict) else {}
+    ts = record.get("ts")
+    last = buckets[-1] if buckets else None
+    minute = ts[:16] if isinstance(ts, str) else (last["minute"] if last else "")
+    if last is None or last["minute"] != minute:
+        last = {
+            "minute": minute,
+            "start": start,
+            "end": end,
+            "levels": {},
+            "tools": {},
+            "operations": [],
+            "error_types": [],
+        }
+        buckets.append(last)
+    last["end"] = end
+    level = record.get("level") if isinstance(record.get("level"), str) else "RAW"
+    last["levels"][level] = last["levels"].get(level, 0) + 1
+    tool = record.get("tool")
+    if isinstance(tool, str):
+        span = last["tools"].get(tool)
+        if span is None:
+            last["tools"][tool] = [start, end, 1]
+        else:
+            span[1], span[2] = end, span[2] + 1
+    for key, field in (("operation", "operations"), ("error_type", "error_types")):
+        value = record.get(key)
+        if isinstance(value, str) and value not in last[field]:
+            last[field].append(value)
+
+
+class LogIndex:
+    """Sidecar index of one log file and its backups, refreshed incrementally on each query."""
+
+    def __init__(self, log_path: Path | str, index_path: Path | str | None = None) -> None:
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path) if index_path else self.log_path.parent / INDEX_FILE
+        # digest of first line -> {"file", "size", "buckets"}
+        self.files: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            data = loads(self.index_path.read_bytes())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION and isinstance(data.get("files"), dict):
+            self.files = data["files"]
+
+    def _save(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_bytes(dumpb({"version": INDEX_VERSION, "log": self.log_path.name, "files": self.files}))
+        os.replace(tmp, self.index_path)
+
+    def _extend(self, entry: dict[str, Any], fh: BinaryIO, size: int) -> int:
+        """Index complete lines from entry["size"] up to `size`; returns bytes indexed."""
+        offset: int = entry["size"]
+        fh.seek(offset)
+        carry = b""
+        while offset + len(carry) < size:
+            chunk = fh.read(min(CHUNK, size - offset - len(carry)))
+            if not chunk:
+                break
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            pos = 0
+            while pos < cut:
+                nl = data.index(b"\n", pos)
+                line = data[pos:nl].strip()
+                if line:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        record = None
+                    _add_line(entry["buckets"], record, offset + pos, offset + nl + 1)
+                pos = nl + 1
+            offset += cut
+            carry = data[cut:]
+        indexed = offset - int(entry["size"])
+        entry["size"] = offset
+        return indexed
+
+    def refresh(self) -> dict[str, int]:
+        """Index what was appended or rotated since the last refresh."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> dict[str, int]:
+        if not self._loaded:
+            self._load()
+        before = {digest: entry.get("file") for digest, entry in self.files.items()}
+        files: dict[str, dict[str, Any]] = {}
+        indexed = 0
+        for path in log_files(self.log_path):
+            try:
+                with path.open("rb") as fh:
+                    digest = _first_line_digest(fh)
+                    if digest is None:
+                        continue
+                    size = os.fstat(fh.fileno()).st_size
+                    entry = self.files.get(digest)
+                    if entry is None or entry["size"] > size:  # new, or truncated and rewritten
+                        entry = {"size": 0, "buckets": []}
+                    entry["file"] = path.name
+                    if size > entry["size"]:
+                        indexed += self._extend(entry, fh, size)
+            except OSError:
+                continue
+            files[digest] = entry
+        self.files = files
+        if indexed or before != {digest: entry["file"] for digest, entry in files.items()}:
+            self._save()
+        return {"files": len(files), "indexed_bytes": indexed}
+
+    def query(
+        self,
+        level: str | None = None,
+        tool: str | None = None,
+        operation: str | None = None,
+        error_type: str | None = None,
+        since: str | float | None = None,
+        until: str | float | None = None,
+        limit: int = 200,
+    ) -> dict[str, Any]:
+        """Matching lines, newest first. `level` is a minimum (WARNING = WARNING and above)."""
+        if level and level.upper() not in LEVEL_RANK:
+            raise ValueError(f"level must be one of {', '.join(LEVEL_RANK)}")
+        min_rank = LEVEL_RANK[level.upper()] if level else 0
+        since_ts, until_ts = parse_time(since), parse_time(until)
+        limit = max(1, min(MAX_LIMIT, limit))
+        # One match past the limit tells whether the result was actually cut off.
+        wanted = limit + 1
+        entries: list[dict[str, Any]] = []
+        scanned = 0
+        skipped_files = 0
+        with self._lock:
+            stats = self._refresh()
+            for digest, entry in self.files.items():
+                if len(entries) >= wanted:
+                    break
+                try:
+                    fh = (self.log_path.parent / entry["file"]).open("rb")
+                except OSError:
+                    skipped_files += 1
+                    continue
+                with fh:
+                    if _first_line_digest(fh) != digest:  # rotated since the refresh
+                        skipped_files += 1
+                        continue
+                    for bucket in reversed(entry["buckets"]):
+                        if len(entries) >= wanted:
+                            break
+                        minute = bucket["minute"]
+                        if (since_ts and minute < since_ts[:16]) or (until_ts and minute > until_ts[:16]):
+                            continue
+                        if min_rank and not any(LEVEL_RANK.get(lv, 0) >= min_rank for lv in bucket["levels"]):
+                            continue
+                        if operation and operation not in bucket["operations"]:
+                            continue
+                        if error_type and error_type not in bucket["error_types"]:
+                            continue
+                        if tool:
+                            if tool not in bucket["tools"]:
+                                continue
+                            start, end, _count = bucket["tools"][tool]
+                        else:
+                            start, end = bucket["start"], bucket["end"]
+                        fh.seek(start)
+                        data = fh.read(end - start)
+                        scanned += len(data)
+                        for line in reversed(data.splitlines()):
+                            try:
+                                record = loads(line)
+                            except ValueError:
+                                continue
+                            if not isinstance(record, dict):
+                                continue
+                            if min_rank and LEVEL_RANK.get(str(record.get("level")), 0) < min_rank:
+                                continue
+                            if tool and record.get("tool") != tool:
+                                continue
+                            if operation and record.get("operation") != operation:
+                                continue
+                            if error_type and record.get("error_type") != error_type:
+                                continue
+                            ts = record.get("ts")
+                            if since_ts and not (isinstance(ts, str) and ts >= since_ts):
+                                continue
+                            if until_ts and not (isinstance(ts, str) and ts <= until_ts):
+                                continue
+                            entries.append(_redact_entry(record))
+                            if len(entries) >= wanted:
+                                break
+            total = sum(entry["size"] for entry in self.files.values())
+        return {
+            "entries": entries[:limit],
+            "truncated": len(entries) > limit,
+            "files": stats["files"],
+            "skipped_files": skipped_files,
+            "indexed_bytes": total,
+            "scanned_bytes": scanned,
+        }
@@ -0,0 +1,264 @@
+"""Per-logger log levels changed at runtime, reverted automatically after a TTL.
+
+`clawd_admin operation=set_log_level logger_name=openclaw_molt_mcp.gateway_client level=DEBUG`
+(or `POST /api/log-levels` on the webapp API) records an override in `<log_dir>/log-levels.json`:
+
+    {"openclaw_molt_mcp.gateway_client": {"level": "DEBUG", "expires_at": 1760000900.0}}
+
+The MCP server applies the file with `Logger.setLevel` and re-reads it every couple of seconds
+(a stat per interval), so overrides written by another process take effect without a restart.
+Expired overrides are removed and the logger gets its previous level back; overrides still
+valid at startup are applied again. Only the named logger (and its children) pays for the
+extra records, unlike raising OPENCLAW_LOG_LEVEL for the whole process.
+
+The server and the webapp API both edit the file, so every read-modify-write holds an
+advisory lock on `log-levels.lock` and goes through a uniquely named temp file.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumpb, loads
+
+logger = logging.getLogger(__name__)
+
+LEVELS_FILE = "log-levels.json"
+LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+MAX_TTL_SECONDS = 24 * 3600.0
+ROOT = "root"
+
+
+def _logger(name: str) -> logging.Logger:
+    return logging.getLogger(None if name == ROOT else name)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive advisory lock on `path`, shared with other processes (blocks until free)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as fh:
+        if sys.platform == "win32":
+            import msvcrt
+
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+class LogLevelOverrides:
+    """Overrides file plus (with `apply`) the loggers of this process."""
+
+    def __init__(self, path: Path | str, default_ttl: float = 900.0, apply: bool = True, interval: float = 2.0) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_suffix(".lock")
+        self.default_ttl = default_ttl
+        self.apply = apply
+        self.interval = interval
+        # logger -> {"level", "expires_at"} as in the file; what this process has applied
+        self.overrides: dict[str, dict[str, Any]] = {}
+        self._previous: dict[str, int] = {}
+        self._signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, apply: bool = True) -> "LogLevelOverrides":
+        return cls(Path(settings.log_dir) / LEVELS_FILE, default_ttl=settings.log_level_ttl_seconds, apply=apply)
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable %s: %s", self.path, e)
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            name: entry
+            for name, entry in data.items()
+            if isinstance(entry, dict)
+            and entry.get("level") in LEVEL_NAMES
+            and isinstance(entry.get("expires_at"), (int, float))
+        }
+
+    def _write(self, overrides: dict[str, dict[str, Any]]) -> None:
+        """Replace the file atomically (call with the file lock held)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path.parent, prefix=f".{self.path.stem}.", delete=False) as tmp:
+            tmp.write(dumpb(overrides))
+        try:
+            os.replace(tmp.name, self.path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+        self._signature = self._stat()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _apply(self, overrides: dict[str, dict[str, Any]]) -> None:
+        """Make this process's loggers match `overrides` (restoring loggers no longer in it)."""
+        if self.apply:
+            for name in list(self._previous):
+                if name not in overrides:
+                    _logger(name).setLevel(self._previous.pop(name))
+            for name, entry in overrides.items():
+                if name not in self._previous:
+                    self._previous[name] = _logger(name).level
+                _logger(name).setLevel(entry["level"])
+        changed = set(overrides) ^ set(self.overrides)
+        changed |= {n for n in overrides if self.overrides.get(n, {}).get("level") != overrides[n]["level"]}
+        for name in sorted(changed):
+            override = overrides.get(name)
+            logger.info(
+                "Log level of %s %s",
+                name,
+                f"set to {override['level']} until {time.strftime('%H:%M:%S', time.localtime(override['expires_at']))}"
+                if override
+                else "reverted",
+                extra={"tool": "clawd_admin", "operation": "log_level"},
+            )
+        self.overrides = overrides
+
+    def sync(self, now: float | None = None) -> list[str]:
+        """Pick up a changed file and drop expired overrides; returns the loggers that expired."""
+        now = time.time() if now is None else now
+        with self._lock:
+            signature = self._stat()
+            current = self._read() if signature != self._signature else dict(self.overrides)
+            self._signature = signature
+            expired = [name for name, entry in current.items() if entry["expires_at"] <= now]
+            if expired:
+                # Re-read under the file lock: another process may have changed it since.
+                with _file_lock(self.lock_path):
+                    current = self._read()
+                    expired = [name for name, entry in current.items() if entry["expires_at"] <= now]
+                    for name in expired:
+                        del current[name]
+                    if expired:
+                        self._write(current)
+            self._apply(current)
+        return expired
+
+    def set(self, name: str, level: str, ttl_seconds: float | None = None) -> dict[str, Any]:
+        """Override `name` (a logger name, or 'root') at `level` for `ttl_seconds`."""
+        name = name.strip()
+        level = level.upper()
+        if not name:
+            raise ValueError("logger name is required")
+        if level not in LEVEL_NAMES:
+            raise ValueError(f"level must be one of {', '.join(LEVEL_NAMES)}")
+        ttl = self.default_ttl if ttl_seconds is None else ttl_seconds
+        if not 0 < ttl <= MAX_TTL_SECONDS:
+            raise ValueError(f"ttl_seconds must be in (0, {MAX_TTL_SECONDS:.0f}]")
+        entry = {"level": level, "expires_at": round(time.time() + ttl, 3)}
+        with self._lock, _file_lock(self.lock_path):
+            current = self._read()
+            current[name] = entry
+            self._write(current)
+            self._apply(current)
+        return {"logger": name, **entry}
+
+    def clear(self, name: str | None = None) -> list[str]:
+        """Revert `name` now (all overrides if None); returns the loggers reverted."""
+        with self._lock, _file_lock(self.lock_path):
+            current = self._read()
+            removed = [n for n in current if name is None or n == name]
+            for n in removed:
+                del current[n]
+            self._write(current)
+            self._apply(current)
+        return removed
+
+    def status(self, now: float | None = None) -> list[dict[str, Any]]:
+        now = time.time() if now is None else now
+        return [
+            {
+                "logger": name,
+                "level": entry["level"],
+                "expires_at": entry["expires_at"],
+                "remaining_s": round(max(0.0, entry["expires_at"] - now), 1),
+                "effective_level": logging.getLevelName(_logger(name).getEffectiveLevel()) if self.apply else None,
+            }
+            for name, entry in sorted(self.overrides.items())
+        ]
+
+    def start(self) -> None:
+        """Apply the file now and keep it in sync from a daemon thread."""
+        self.sync()
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="log-levels", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sync()
+            except Exception as e:
+                logger.error(
+                    "Log level sync failed: %s",
+                    e,
+                    extra={"tool": "clawd_admin", "operation": "log_level", "error_type": type(e).__name__},
+                    exc_info=True,
+                )
+
+    def stop(self) -> None:
+        """Stop syncing and give every overridden logger its previous level back (file untouched)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            if self.apply:
+                for name, level in self._previous.items():
+                    _logger(name).setLevel(level)
+            self._previous.clear()
+            self.overrides = {}
+
+
+_overrides: LogLevelOverrides | None = None
+
+
+def get_log_levels(settings: Settings | None = None) -> LogLevelOverrides:
+    """Process-wide overrides applied to this process's loggers."""
+    global _overrides
+    if _overrides is None:
+        _overrides = LogLevelOverrides.from_settings(settings or Settings())
+    return _overrides
+
+
+def reset_log_levels() -> None:
+    """Stop syncing and restore logger levels (tests, config reload)."""
+    global _overrides
+    if _overrides is not None:
+        _overrides.stop()
+        _overrides = None
@@ -1,55 +1,190 @@
-"""Structured logging configuration for openclaw-molt-mcp."""
+"""Structured logging configuration for openclaw-molt-mcp.
+
+Modules log through stdlib loggers with `extra=`; every record runs once through a structlog
+processor chain (`PROCESSORS`, built at import) and the resulting event dict is shared by the
+stderr and file handlers:
+
+- `record_to_event`: ts (from `record.created`), level, logger, msg, exc and the
+  tool / operation / error_type extras;
+- `structlog.contextvars.merge_contextvars`: fields bound for the current task, e.g. tool and
+  operation of the MCP call being served (explicit extras win);
+- `add_trace_ids`: trace_id / span_id of the current span.
+
+The file handler renders one JSON object per line, stderr a readable line. `RateSampler`
+caps INFO/DEBUG records per logger (OPENCLAW_LOG_SAMPLING); the next record let through
+carries `sampled_out` with the number dropped.
+"""
 
-import json
 import logging
 import logging.handlers
 import sys
-from datetime import datetime, timezone
+import threading
+import time
 from pathlib import Path
 
+from structlog.contextvars import merge_contextvars
+from structlog.typing import EventDict, WrappedLogger
+
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumps
+from openclaw_molt_mcp.tracing import current_ids
+
+EXTRA_FIELDS = ("tool", "operation", "error_type")
+
+_ts_cache: tuple[int, str] = (-1, "")
+_local_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_ts(created: float) -> str:
+    """UTC ISO-8601 timestamp of `created`; the date/time part is formatted once per second."""
+    global _ts_cache
+    second = int(created)
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f"{prefix}.{int((created - second) * 1_000_000):06d}+00:00"
+
+
+def _local_ts(record: logging.LogRecord) -> str:
+    """`logging.Formatter.formatTime` default output, formatted once per second."""
+    global _local_ts_cache
+    second = int(record.created)
+    cached_second, prefix = _local_ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _local_ts_cache = (second, prefix)
+    return f"{prefix},{int(record.msecs):03d}"
+
+
+def record_to_event(_logger: WrappedLogger, _method: str, event_dict: EventDict) -> EventDict:
+    """Base fields of the stdlib record in `event_dict["_record"]`."""
+    record: logging.LogRecord = event_dict["_record"]
+    event_dict["ts"] = _iso_ts(record.created)
+    event_dict["level"] = record.levelname
+    event_dict["logger"] = record.name
+    event_dict["msg"] = record.getMessage()
+    if record.exc_info:
+        event_dict["exc"] = record.exc_info[1].__class__.__name__ if record.exc_info[1] else None
+    fields = record.__dict__
+    for key in EXTRA_FIELDS:
+        if key in fields:
+            event_dict[key] = fields[key]
+    if "sampled_out" in fields:
+        event_dict["sampled_out"] = fields["sampled_out"]
+    return event_dict
 
 
-def _structured_record(record: logging.LogRecord) -> str:
-    """Format a log record as a single-line JSON object for file output."""
-    payload: dict = {
-        "ts": datetime.now(timezone.utc).isoformat(),
-        "level": record.levelname,
-        "logger": record.name,
-        "msg": record.getMessage(),
-    }
-    if record.exc_info:
-        payload["exc"] = record.exc_info[1].__class__.__name__ if record.exc_info[1] else None
-    if hasattr(record, "tool"):
-        payload["tool"] = record.tool
-    if hasattr(record, "operation"):
-        payload["operation"] = record.operation
-    if hasattr(record, "error_type"):
-        payload["error_type"] = record.error_type
-    return json.dumps(payload, default=str) + "\n"
+def add_trace_ids(_logger: WrappedLogger, _method: str, event_dict: EventDict) -> EventDict:
+    ids = current_ids()
+    if ids:
+        event_dict["trace_id"], event_dict["span_id"] = ids
+    return event_dict
+
+
+PROCESSORS = (record_to_event, merge_contextvars, add_trace_ids)
+
+
+def build_event(record: logging.LogRecord) -> EventDict:
+    """Run `record` through `PROCESSORS` in the current context."""
+    event_dict: EventDict = {"_record": record}
+    method = record.levelname.lower()
+    for processor in PROCESSORS:
+        event_dict = processor(None, method, event_dict)
+    del event_dict["_record"]
+    return event_dict
+
+
+def event_for(record: logging.LogRecord) -> EventDict:
+    """Event dict of `record`, computed once and kept on the record for the other handlers."""
+    event_dict = record.__dict__.get("_event_dict")
+    if event_dict is None:
+        event_dict = record._event_dict = build_event(record)
+    return event_dict
 
 
 class StructuredFileFormatter(logging.Formatter):
     """Formatter that emits one JSON object per line for file handler."""
 
     def format(self, record: logging.LogRecord) -> str:
-        return _structured_record(record).rstrip()
+        # RotatingFileHandler formats each record twice (size check, then write).
+        line = record.__dict__.get("_json_line")
+        if line is None:
+            line = record._json_line = dumps(event_for(record))
+        return line
 
 
 class StructuredStreamFormatter(logging.Formatter):
     """Human-readable format for stderr with optional extra fields."""
 
     def format(self, record: logging.LogRecord) -> str:
-        base = f"{self.formatTime(record)} [{record.levelname}] {record.name}: {record.getMessage()}"
-        if hasattr(record, "tool"):
-            base += f" tool={record.tool}"
-        if hasattr(record, "operation"):
-            base += f" operation={record.operation}"
+        event = event_for(record)
+        base = f"{_local_ts(record)} [{record.levelname}] {record.name}: {event['msg']}"
+        if "tool" in event:
+            base += f" tool={event['tool']}"
+        if "operation" in event:
+            base += f" operation={event['operation']}"
+        if "trace_id" in event:
+            base += f" trace={event['trace_id']}"
         if record.exc_info:
             base += f" exc={record.exc_info[1]!r}"
         return base
 
 
+def parse_sampling(value: str) -> dict[str, float]:
+    """'openclaw_molt_mcp.tools=10,openclaw_molt_mcp.gateway_client=50' -> {logger prefix: records/s}."""
+    rates = {}
+    for item in value.split(","):
+        name, sep, rate = item.partition("=")
+        if sep and name.strip():
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+class RateSampler(logging.Filter):
+    """Lets at most `rate` INFO/DEBUG records per second through for each logger under a configured
+    prefix (most specific prefix wins); WARNING and above always pass. The decision is made once
+    per record, so every handler sharing this filter sees the same records."""
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._rate_of: dict[str, float | None] = {}
+        # logger -> [window second, records let through, records dropped]
+        self._windows: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> float | None:
+        if name not in self._rate_of:
+            matches = [p for p in self.rates if name == p or name.startswith(p + ".")]
+            self._rate_of[name] = self.rates[max(matches, key=len)] if matches else None
+        return self._rate_of[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        cached = record.__dict__.get("_sampled")
+        if cached is not None:
+            return bool(cached)
+        rate = self._rate(record.name)
+        decision = True
+        if rate is not None:
+            second = int(record.created)
+            with self._lock:
+                window = self._windows.setdefault(record.name, [second, 0, 0])
+                if window[0] != second:
+                    window[0], window[1] = second, 0
+                if window[1] < rate:
+                    window[1] += 1
+                    if window[2]:
+                        record.sampled_out, window[2] = window[2], 0
+                else:
+                    window[2] += 1
+                    decision = False
+        record._sampled = decision
+        return decision
+
+
 def setup_logging(settings: Settings | None = None) -> None:
     """Configure structured logging: stderr + rotating file in log_dir."""
     settings = settings or Settings()
@@ -57,14 +192,17 @@ def setup_logging(settings: Settings | None = None) -> None:
     log_dir = Path(settings.log_dir)
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "openclaw-molt-mcp.log"
+    rates = parse_sampling(settings.log_sampling)
+    sampler = RateSampler(rates) if rates else None
 
     root = logging.getLogger()
     root.setLevel(level)
     for h in list(root.handlers):
         root.removeHandler(h)
 
+    # Handlers pass everything the loggers let through, so a runtime override (log_levels)
+    # can lower one logger below the root level.
     stream_handler = logging.StreamHandler(sys.stderr)
-    stream_handler.setLevel(level)
     stream_handler.setFormatter(StructuredStreamFormatter())
     root.addHandler(stream_handler)
 
@@ -74,10 +212,13 @@ def setup_logging(settings: Settings | None = None) -> None:
         backupCount=settings.log_backup_count,
         encoding="utf-8",
     )
-    file_handler.setLevel(level)
     file_handler.setFormatter(StructuredFileFormatter())
     root.addHandler(file_handler)
 
+    if sampler is not None:
+        stream_handler.addFilter(sampler)
+        file_handler.addFilter(sampler)
+
     root.info(
         "Logging configured",
         extra={"tool": "openclaw_molt_mcp", "operation": "startup", "log_file": str(log_file)},
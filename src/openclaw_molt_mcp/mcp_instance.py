@@ -1,13 +1,29 @@
 """Shared FastMCP instance for openclaw-molt-mcp."""
 
 import os
+from collections.abc import AsyncIterator
+from typing import Any
 
 from fastmcp import FastMCP
 from fastmcp.server import create_proxy
+from fastmcp.server.lifespan import lifespan
 
 from openclaw_molt_mcp import __version__
+from openclaw_molt_mcp.log_levels import get_log_levels
 
-mcp = FastMCP(name="openclaw-molt-mcp", version=__version__)
+
+@lifespan
+async def _runtime_log_levels(server: FastMCP[Any]) -> AsyncIterator[dict[str, Any]]:
+    """Sync runtime per-logger levels (clawd_admin set_log_level) only while the server runs."""
+    overrides = get_log_levels()
+    overrides.start()
+    try:
+        yield {}
+    finally:
+        overrides.stop()
+
+
+mcp = FastMCP(name="openclaw-molt-mcp", version=__version__, lifespan=_runtime_log_levels)
 
 # MCP Bridge: ProxyProvider for multi-server federation
 _bridge_proxies = []
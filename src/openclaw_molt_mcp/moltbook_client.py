@@ -5,7 +5,12 @@ from typing import Any
 
 import httpx
 
+from openclaw_molt_mcp.adaptive_timeout import endpoint_key, get_timeout_policy, timed_call
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import response_json
+from openclaw_molt_mcp.rate_limit import RateLimitExceeded, get_moltbook_limiter
+from openclaw_molt_mcp.resilience import CircuitOpenError, RetryPolicy, get_breaker, send_with_resilience
+from openclaw_molt_mcp.tracing import TracingClient, span
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +33,31 @@ def _dialogic_error(message: str, error: str | None = None) -> dict[str, Any]:
     return result
 
 
+def _rate_limited(e: RateLimitExceeded) -> dict[str, Any]:
+    """Dialogic error for a locally enforced rate limit, with a retry hint."""
+    result = _dialogic_error(f"Moltbook {e.bucket} rate limit: retry in {e.retry_after:.0f}s", error="rate_limited")
+    result["retry_after"] = round(e.retry_after, 1)
+    return result
+
+
+def _circuit_open(e: CircuitOpenError) -> dict[str, Any]:
+    """Dialogic error for a call rejected by an open circuit breaker."""
+    return _dialogic_error(
+        f"Moltbook marked unavailable after repeated failures; retrying in {e.retry_in:.0f}s.",
+        error="circuit_open",
+    )
+
+
 class MoltbookClient:
     """Client for Moltbook REST API."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or Settings()
         self._client: httpx.AsyncClient | None = None
+        self.limiter = get_moltbook_limiter(self.settings)
+        self.breaker = get_breaker(f"moltbook:{self.settings.moltbook_url}", self.settings)
+        self.retry_policy = RetryPolicy.from_settings(self.settings)
+        self.timeouts = get_timeout_policy(self.settings)
 
     def _headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -43,20 +67,34 @@ class MoltbookClient:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = TracingClient(
+                "moltbook",
                 base_url=self.settings.moltbook_url,
                 headers=self._headers(),
-                timeout=30.0,
+                timeout=self.settings.timeout_ceiling,
             )
         return self._client
 
     async def get(self, path: str, params: dict[str, str] | None = None) -> dict[str, Any]:
         """GET request to Moltbook API."""
         try:
-            client = await self._get_client()
-            resp = await client.get(path, params=params)
-            resp.raise_for_status()
-            return _dialogic_success("OK", resp.json())
+            with span(f"moltbook GET {endpoint_key(path)}", method="GET", path=path):
+                await self.limiter.acquire("GET", path)
+                client = await self._get_client()
+                resp = await send_with_resilience(
+                    lambda: timed_call(
+                        self.timeouts,
+                        "moltbook",
+                        f"GET {endpoint_key(path)}",
+                        lambda timeout: client.get(path, params=params, timeout=timeout),
+                    ),
+                    self.breaker,
+                    self.retry_policy,
+                    idempotent=True,
+                )
+            return _dialogic_success("OK", response_json(resp))
+        except CircuitOpenError as e:
+            return _circuit_open(e)
         except httpx.HTTPStatusError as e:
             logger.exception("Moltbook HTTP error: %s", e)
             return _dialogic_error(f"Moltbook returned {e.response.status_code}", error=str(e))
@@ -64,14 +102,38 @@ class MoltbookClient:
             logger.exception("Moltbook request error: %s", e)
             return _dialogic_error("Moltbook request failed", error=str(e))
 
-    async def post(self, path: str, json: dict[str, Any] | None = None) -> dict[str, Any]:
-        """POST request to Moltbook API."""
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        max_wait: float = 0.0,
+    ) -> dict[str, Any]:
+        """POST request to Moltbook API.
+
+        Posts and comments are paced by the local limiter; `max_wait` is how long to wait
+        for a slot before returning a rate-limited error (default: fail fast).
+        """
         try:
-            client = await self._get_client()
-            resp = await client.post(path, json=json or {})
-            resp.raise_for_status()
-            data = resp.json() if resp.content else {}
+            with span(f"moltbook POST {endpoint_key(path)}", method="POST", path=path):
+                await self.limiter.acquire("POST", path, max_wait=max_wait)
+                client = await self._get_client()
+                resp = await send_with_resilience(
+                    lambda: timed_call(
+                        self.timeouts,
+                        "moltbook",
+                        f"POST {endpoint_key(path)}",
+                        lambda timeout: client.post(path, json=json or {}, timeout=timeout),
+                    ),
+                    self.breaker,
+                    self.retry_policy,
+                    idempotent=False,
+                )
+            data = response_json(resp) if resp.content else {}
             return _dialogic_success("OK", data)
+        except RateLimitExceeded as e:
+            return _rate_limited(e)
+        except CircuitOpenError as e:
+            return _circuit_open(e)
         except httpx.HTTPStatusError as e:
             logger.error(
                 "Moltbook HTTP error: %s",
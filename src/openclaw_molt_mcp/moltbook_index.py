@@ -0,0 +1,365 @@
+"""Local offline search index over Moltbook posts/comments already fetched by this process.
+
+Every feed, heartbeat and search response is fed into an in-memory inverted index so that
+`clawd_moltbook search` with `scope="local"` can answer without touching the remote `/search`
+endpoint (and without spending rate-limit budget). Ranking is BM25; optional fuzzy matching
+expands unknown query terms to indexed terms sharing enough character trigrams.
+
+Queries do not score every posting: each queried term keeps an impact-ordered view of its
+postings (built on first use, refreshed as documents are added or evicted) and `search`
+walks those views best-first, stopping once no unseen document can still enter the top
+`limit` (a threshold algorithm; results are identical to exhaustive BM25 scoring).
+"""
+
+import heapq
+import itertools
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+TEXT_FIELDS = ("title", "content", "body", "text")
+ID_FIELDS = ("id", "uuid")
+MAX_DOCS = 200_000
+BM25_K1 = 1.2
+BM25_B = 0.75
+FUZZY_MIN_SIMILARITY = 0.4
+FUZZY_MAX_EXPANSIONS = 3
+IMPACT_MAX_PENDING = 1024
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _trigrams(term: str) -> set[str]:
+    """Character trigrams of a padded term (short terms still get at least one gram)."""
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class _Impacts:
+    """Postings of one term grouped by term frequency, each group sorted by document length.
+
+    BM25's per-document contribution `tf / (tf + a + b * dl)` falls as `dl` grows for a fixed
+    `tf`, so each group is already in descending impact order for any average length; merging
+    the groups yields the whole posting list best-first. Documents added after the build go to
+    `pending` and are merged in at query time; removed ones are skipped until the next rebuild.
+    """
+
+    __slots__ = ("groups", "pending", "size")
+
+    def __init__(self, postings: dict[int, int], doc_len: dict[int, int]) -> None:
+        groups: dict[int, list[tuple[int, int]]] = {}
+        for doc, tf in postings.items():
+            groups.setdefault(tf, []).append((doc_len[doc], doc))
+        for entries in groups.values():
+            entries.sort()
+        self.groups = groups
+        self.pending: list[int] = []
+        self.size = len(postings)
+
+    def stale(self, live: int) -> bool:
+        dead = self.size + len(self.pending) - live
+        return len(self.pending) > IMPACT_MAX_PENDING or dead > max(IMPACT_MAX_PENDING, self.size) // 4
+
+    def stream(
+        self, postings: dict[int, int], doc_len: dict[int, int], norm_a: float, norm_b: float
+    ) -> Iterator[tuple[float, int]]:
+        """(impact, doc) pairs in descending impact order, possibly including removed docs."""
+        runs = [self._group(tf, entries, norm_a, norm_b) for tf, entries in self.groups.items()]
+        if self.pending:
+            fresh = [
+                (postings[doc] / (postings[doc] + norm_a + norm_b * doc_len[doc]), doc)
+                for doc in self.pending
+                if doc in postings
+            ]
+            runs.append(iter(sorted(fresh, reverse=True)))
+        return heapq.merge(*runs, reverse=True)
+
+    @staticmethod
+    def _group(tf: int, entries: list[tuple[int, int]], norm_a: float, norm_b: float) -> Iterator[tuple[float, int]]:
+        for dl, doc in entries:
+            yield tf / (tf + norm_a + norm_b * dl), doc
+
+
+def _doc_id(item: dict[str, Any]) -> str | None:
+    for key in ID_FIELDS:
+        value = item.get(key)
+        if value is not None and value != "":
+            return str(value)
+    return None
+
+
+def _doc_text(item: dict[str, Any]) -> str:
+    return " ".join(str(item[f]) for f in TEXT_FIELDS if isinstance(item.get(f), str))
+
+
+def _author(item: dict[str, Any]) -> str | None:
+    author = item.get("author") or item.get("agent")
+    if isinstance(author, dict):
+        author = author.get("name") or author.get("username")
+    return str(author) if author else None
+
+
+def extract_documents(payload: Any, kind: str = "post", parent_id: str | None = None) -> list[dict[str, Any]]:
+    """Walk a Moltbook response and return flat post/comment records.
+
+    Moltbook responses wrap items differently per endpoint (`posts`, `results`, bare lists,
+    nested `comments`); any dict carrying an id and a text field is treated as a document.
+    Items found under a `comments`/`replies` key are recorded as comments of their parent.
+    """
+    docs: list[dict[str, Any]] = []
+    if isinstance(payload, list):
+        for item in payload:
+            docs.extend(extract_documents(item, kind, parent_id))
+        return docs
+    if not isinstance(payload, dict):
+        return docs
+
+    doc_id = _doc_id(payload)
+    text = _doc_text(payload)
+    declared = payload.get("type")
+    this_kind: str = declared if declared in ("post", "comment") else kind
+    if doc_id and text:
+        post_id = payload.get("post_id") or payload.get("postId") or parent_id
+        if this_kind != "comment" and post_id and str(post_id) != doc_id:
+            this_kind = "comment"
+        docs.append(
+            {
+                "id": doc_id,
+                "kind": this_kind,
+                "post_id": str(post_id) if this_kind == "comment" and post_id else None,
+                "title": payload.get("title") if isinstance(payload.get("title"), str) else None,
+                "content": text,
+                "author": _author(payload),
+                "created_at": payload.get("created_at") or payload.get("createdAt"),
+            }
+        )
+    for key, value in payload.items():
+        if isinstance(value, (dict, list)):
+            if key in ("comments", "replies"):
+                docs.extend(extract_documents(value, "comment", doc_id or parent_id))
+            elif key not in ("author", "agent"):
+                docs.extend(extract_documents(value, this_kind, parent_id))
+    return docs
+
+
+class MoltbookIndex:
+    """In-memory BM25 inverted index with trigram vocabulary for fuzzy term expansion."""
+
+    def __init__(self, max_docs: int = MAX_DOCS) -> None:
+        self.max_docs = max_docs
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all indexed documents."""
+        self._keys: OrderedDict[str, int] = OrderedDict()
+        self._docs: dict[int, dict[str, Any]] = {}
+        self._doc_terms: dict[int, dict[str, int]] = {}
+        self._doc_len: dict[int, int] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._trigram_terms: dict[str, set[str]] = {}
+        self._impacts: dict[str, _Impacts] = {}
+        self._total_len = 0
+        self._next_doc = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Insert or replace one record produced by `extract_documents`."""
+        key = f"{record['kind']}:{record['id']}"
+        existing = self._keys.pop(key, None)
+        if existing is not None:
+            self._remove(existing)
+        tokens = _tokenize(record.get("content") or "")
+        if not tokens:
+            return
+        doc = self._next_doc
+        self._next_doc += 1
+        tf: dict[str, int] = {}
+        for tok in tokens:
+            tf[tok] = tf.get(tok, 0) + 1
+        for term, count in tf.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                for gram in _trigrams(term):
+                    self._trigram_terms.setdefault(gram, set()).add(term)
+            postings[doc] = count
+            impacts = self._impacts.get(term)
+            if impacts is not None:
+                impacts.pending.append(doc)
+        self._keys[key] = doc
+        self._docs[doc] = record
+        self._doc_terms[doc] = tf
+        self._doc_len[doc] = len(tokens)
+        self._total_len += len(tokens)
+        while len(self._keys) > self.max_docs:
+            _, oldest = self._keys.popitem(last=False)
+            self._remove(oldest)
+
+    def add_payload(self, payload: Any) -> int:
+        """Index every post/comment found in a raw Moltbook response. Returns number indexed."""
+        docs = extract_documents(payload)
+        for record in docs:
+            self.add(record)
+        return len(docs)
+
+    def _remove(self, doc: int) -> None:
+        for term in self._doc_terms.pop(doc, {}):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc, None)
+            if not postings:
+                del self._postings[term]
+                self._impacts.pop(term, None)
+                for gram in _trigrams(term):
+                    terms = self._trigram_terms.get(gram)
+                    if terms is not None:
+                        terms.discard(term)
+                        if not terms:
+                            del self._trigram_terms[gram]
+        self._total_len -= self._doc_len.pop(doc, 0)
+        self._docs.pop(doc, None)
+
+    def _fuzzy_terms(self, term: str) -> list[str]:
+        """Indexed terms most similar to `term` by trigram Jaccard similarity."""
+        grams = _trigrams(term)
+        overlap: dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._trigram_terms.get(gram, ()):
+                overlap[candidate] = overlap.get(candidate, 0) + 1
+        scored = []
+        for candidate, shared in overlap.items():
+            similarity = shared / (len(grams) + len(_trigrams(candidate)) - shared)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, candidate))
+        return [c for _, c in heapq.nlargest(FUZZY_MAX_EXPANSIONS, scored)]
+
+    def _impacts_for(self, term: str) -> _Impacts:
+        postings = self._postings[term]
+        impacts = self._impacts.get(term)
+        if impacts is None or impacts.stale(len(postings)):
+            impacts = self._impacts[term] = _Impacts(postings, self._doc_len)
+        return impacts
+
+    def search(self, query: str, limit: int = 20, fuzzy: bool = False) -> list[dict[str, Any]]:
+        """Return up to `limit` records ranked by BM25, each with a `score` field."""
+        n_docs = len(self._docs)
+        if not n_docs:
+            return []
+        avgdl = self._total_len / n_docs
+        weights: dict[str, float] = {}
+        for term in set(_tokenize(query)):
+            if term in self._postings:
+                weights[term] = max(weights.get(term, 0.0), 1.0)
+            elif fuzzy:
+                # Expanded terms count slightly less than exact matches
+                for candidate in self._fuzzy_terms(term):
+                    weights[candidate] = max(weights.get(candidate, 0.0), 0.8)
+        if not weights:
+            return []
+
+        doc_len = self._doc_len
+        norm_a = BM25_K1 * (1 - BM25_B)
+        norm_b = BM25_K1 * BM25_B / avgdl
+        idfs: dict[str, float] = {}
+        # One cursor per term: [idf * impact of the head, idf, stream, head doc]
+        cursors: list[list[Any]] = []
+        for term, weight in weights.items():
+            postings = self._postings[term]
+            df = len(postings)
+            idf = idfs[term] = weight * math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) * (BM25_K1 + 1)
+            stream = self._impacts_for(term).stream(postings, doc_len, norm_a, norm_b)
+            head = next(stream, None)
+            if head is not None:
+                cursors.append([idf * head[0], idf, stream, head[1]])
+
+        k = max(1, limit)
+        top: list[tuple[float, int]] = []  # min-heap of (score, -doc): ties keep older documents
+        seen: set[int] = set()
+        while cursors:
+            if len(top) == k and top[0][0] >= sum(c[0] for c in cursors):
+                break  # no unseen document can beat the current k-th score
+            cursor = max(cursors, key=lambda c: c[0])
+            doc = cursor[3]
+            head = next(cursor[2], None)
+            if head is None:
+                cursors.remove(cursor)
+            else:
+                cursor[0], cursor[3] = cursor[1] * head[0], head[1]
+            if doc in seen or doc not in doc_len:
+                continue
+            seen.add(doc)
+            terms = self._doc_terms[doc]
+            dl = doc_len[doc]
+            score = 0.0
+            for term, idf in idfs.items():
+                tf = terms.get(term)
+                if tf:
+                    score += idf * tf / (tf + norm_a + norm_b * dl)
+            if len(top) < k:
+                heapq.heappush(top, (score, -doc))
+            elif (score, -doc) > top[0]:
+                heapq.heapreplace(top, (score, -doc))
+
+        ranked = sorted(top, reverse=True)
+        return [{**self._docs[-neg], "score": round(score, 4)} for score, neg in ranked]
+
+    def stats(self) -> dict[str, Any]:
+        """Document and vocabulary counts."""
+        return {"documents": len(self._docs), "terms": len(self._postings)}
+
+
+_index = MoltbookIndex()
+
+
+def get_index() -> MoltbookIndex:
+    """Process-wide index shared by clawd_moltbook and the webapp API."""
+    return _index
+
+
+def search_local(query: str, limit: int = 20, fuzzy: bool = False) -> dict[str, Any]:
+    """Query the shared index and return a `data` payload with timing."""
+    start = time.perf_counter()
+    results = _index.search(query, limit=limit, fuzzy=fuzzy)
+    return {
+        "query": query,
+        "results": results,
+        "indexed": len(_index),
+        "took_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+def merge_results(local: list[dict[str, Any]], remote_payload: Any, limit: int = 20) -> list[dict[str, Any]]:
+    """Interleave remote search hits with local BM25 hits, deduplicated by id.
+
+    Remote and local scores are not comparable, so the two lists alternate (remote first),
+    each keeping its own order; when one side runs out the other fills the remaining slots.
+    A hit found by both keeps its first position and is marked `source="both"`.
+    """
+    remote = [{**record, "source": "remote"} for record in extract_documents(remote_payload)]
+    local = [{**record, "source": "local"} for record in local]
+    merged: list[dict[str, Any]] = []
+    seen: dict[str, dict[str, Any]] = {}
+    for pair in itertools.zip_longest(remote, local):
+        for entry in pair:
+            if entry is None:
+                continue
+            key = f"{entry['kind']}:{entry['id']}"
+            first = seen.get(key)
+            if first is None:
+                seen[key] = entry
+                merged.append(entry)
+            elif first["source"] != entry["source"]:
+                first["source"] = "both"
+                if entry["source"] == "local":
+                    first["score"] = entry.get("score")
+    return merged[:limit]
@@ -0,0 +1,265 @@
+"""On-demand cProfile of selected tool calls, toggled by env or at runtime.
+
+`enable_profiling(["clawd_sessions"], sample_rate=0.2)` (or OPENCLAW_PROFILE_TOOLS at startup,
+or `clawd_admin` `profiling_enable`) adds `ProfilingMiddleware` to the server; each sampled call
+to a selected tool runs under `cProfile` and is written to the profile directory (default
+`<log_dir>/profiles`) as
+
+    20261019-142501-123456_clawd_sessions_history.prof    # pstats / snakeviz input
+    20261019-142501-123456_clawd_sessions_history.json    # tool, operation, ts, duration_ms, success
+
+`disable_profiling()` removes the middleware again, so when profiling is off tool calls do not
+pass through it at all. cProfile is deterministic and allows one active profiler per thread:
+only one call is profiled at a time (overlapping sampled calls run unprofiled and are counted
+as `skipped_busy`), and the profile also contains whatever other tasks the event loop ran
+during that call.
+"""
+
+import cProfile
+import logging
+import pstats
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumpb, loads
+from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.recorder import result_success
+
+logger = logging.getLogger(__name__)
+
+ALL_TOOLS = "*"
+
+
+def parse_tools(value: str | list[str] | None) -> frozenset[str]:
+    """Tool selection from a comma-separated string or list ('*' selects every tool)."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return frozenset(t.strip() for t in value or [] if t.strip())
+
+
+def _safe(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)[:64]
+
+
+def list_profiles(directory: Path | str, limit: int = 50) -> list[dict[str, Any]]:
+    """Metadata of the newest profiles in `directory` (newest first)."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    entries: list[dict[str, Any]] = []
+    for meta in sorted(directory.glob("*.json"), reverse=True):
+        if len(entries) >= max(0, limit):
+            break
+        try:
+            entry = loads(meta.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if isinstance(entry, dict) and (directory / str(entry.get("file", ""))).is_file():
+            entries.append(entry)
+    return entries
+
+
+def profile_summary(path: Path | str, limit: int = 20, sort: str = "cumulative") -> list[dict[str, Any]]:
+    """Top `limit` functions of a .prof file by `sort` (cumulative or tottime)."""
+    stats = pstats.Stats(str(path))
+    key = {"cumulative": 3, "tottime": 2}.get(sort, 3)
+    raw: dict[tuple[str, int, str], tuple[Any, ...]] = stats.stats  # type: ignore[attr-defined]
+    rows = sorted(raw.items(), key=lambda item: item[1][key], reverse=True)[: max(1, limit)]
+    return [
+        {
+            "function": f"{file}:{line}({name})",
+            "calls": nc,
+            "tottime_ms": round(tt * 1000, 3),
+            "cumtime_ms": round(ct * 1000, 3),
+        }
+        for (file, line, name), (_cc, nc, tt, ct, _callers) in rows
+    ]
+
+
+class ToolProfiler:
+    """Selection, sampling and output of profiled tool calls."""
+
+    def __init__(self, directory: Path, max_files: int = 50) -> None:
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.tools: frozenset[str] = frozenset()
+        self.sample_rate = 1.0
+        self.counts = {"profiled": 0, "skipped_busy": 0, "write_errors": 0}
+        self._lock = threading.Lock()
+        self._busy = False
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ToolProfiler":
+        directory = settings.profile_dir or Path(settings.log_dir) / "profiles"
+        return cls(directory, max_files=settings.profile_max_files)
+
+    def selects(self, tool: str) -> bool:
+        return ALL_TOOLS in self.tools or tool in self.tools
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            if self._busy:
+                self.counts["skipped_busy"] += 1
+                return False
+            self._busy = True
+            return True
+
+    def _release(self) -> None:
+        with self._lock:
+            self._busy = False
+
+    async def run(
+        self,
+        tool: str,
+        operation: str | None,
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+        context: MiddlewareContext[mt.CallToolRequestParams],
+    ) -> ToolResult:
+        """Run `call_next(context)`, profiled if sampled and no other profile is running."""
+        sampled = self.selects(tool) and random.random() < self.sample_rate  # noqa: S311 -- sampling, not security
+        if not sampled or not self._acquire():
+            return await call_next(context)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another profiling tool owns this thread
+            self._release()
+            self.counts["skipped_busy"] += 1
+            return await call_next(context)
+        started = time.time()
+        t0 = time.perf_counter()
+        success = False
+        try:
+            try:
+                result = await call_next(context)
+            finally:
+                profiler.disable()
+            success = result_success(result)
+            return result
+        finally:
+            self._release()
+            self._write(profiler, tool, operation, started, (time.perf_counter() - t0) * 1000, success)
+
+    def _write(
+        self,
+        profiler: cProfile.Profile,
+        tool: str,
+        operation: str | None,
+        started: float,
+        duration_ms: float,
+        success: bool,
+    ) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(started)) + f"-{int(started * 1_000_000) % 1_000_000:06d}"
+        stem = "_".join(_safe(p) for p in (stamp, tool, operation or "call"))
+        filename = f"{stem}.prof"
+        meta = {
+            "file": filename,
+            "tool": tool,
+            "operation": operation,
+            "ts": round(started, 3),
+            "duration_ms": round(duration_ms, 3),
+            "success": success,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self.directory / filename))
+            (self.directory / f"{stem}.json").write_bytes(dumpb(meta))
+            self.counts["profiled"] += 1
+            self._prune()
+        except OSError as e:
+            self.counts["write_errors"] += 1
+            logger.error(
+                "Could not write profile: %s",
+                e,
+                extra={"tool": tool, "operation": "profile", "error_type": type(e).__name__},
+                exc_info=True,
+            )
+
+    def _prune(self) -> None:
+        profiles = sorted(self.directory.glob("*.prof"))
+        for old in profiles[: max(0, len(profiles) - self.max_files)]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".json").unlink(missing_ok=True)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "enabled": _middleware is not None,
+            "tools": sorted(self.tools),
+            "sample_rate": self.sample_rate,
+            "directory": str(self.directory),
+            "max_files": self.max_files,
+            **self.counts,
+        }
+
+
+class ProfilingMiddleware(Middleware):
+    """Hands tool calls to the profiler; only installed while profiling is enabled."""
+
+    def __init__(self, profiler: ToolProfiler) -> None:
+        self.profiler = profiler
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        arguments = context.message.arguments or {}
+        operation = arguments.get("operation")
+        if not isinstance(operation, str):
+            operation = None
+        return await self.profiler.run(context.message.name, operation, call_next, context)
+
+
+_profiler: ToolProfiler | None = None
+_middleware: ProfilingMiddleware | None = None
+
+
+def get_profiler(settings: Settings | None = None) -> ToolProfiler:
+    """Process-wide profiler state (selection and counters survive enable/disable)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ToolProfiler.from_settings(settings or Settings())
+    return _profiler
+
+
+def enable_profiling(
+    tools: str | list[str], sample_rate: float = 1.0, settings: Settings | None = None
+) -> ToolProfiler:
+    """Profile `tools` ('*' = all) at `sample_rate`; installs the middleware if needed."""
+    global _middleware
+    selected = parse_tools(tools)
+    if not selected:
+        raise ValueError("No tools selected for profiling")
+    profiler = get_profiler(settings)
+    profiler.tools = selected
+    profiler.sample_rate = min(1.0, max(0.0, sample_rate))
+    if _middleware is None:
+        _middleware = ProfilingMiddleware(profiler)
+        mcp.add_middleware(_middleware)
+    return profiler
+
+
+def disable_profiling() -> None:
+    """Remove the middleware; calls no longer pass through the profiler."""
+    global _middleware
+    if _middleware is not None:
+        if _middleware in mcp.middleware:
+            mcp.middleware.remove(_middleware)
+        _middleware = None
+    if _profiler is not None:
+        _profiler.tools = frozenset()
+
+
+def reset_profiler() -> None:
+    """Disable profiling and drop the shared profiler (tests, config reload)."""
+    global _profiler
+    disable_profiling()
+    _profiler = None
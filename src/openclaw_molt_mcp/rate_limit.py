@@ -0,0 +1,103 @@
+"""Client-side token buckets mirroring Moltbook API rate limits.
+
+Moltbook allows 100 requests/min, 1 comment per 20 s and 1 post per 30 min per agent.
+Tracking these locally lets bulk operations pace themselves and lets single calls wait
+briefly for a slot, or return a retry hint instead of spending a request on a guaranteed 429.
+"""
+
+import asyncio
+import time
+
+from openclaw_molt_mcp.config import Settings
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a token is not available within the allowed wait."""
+
+    def __init__(self, bucket: str, retry_after: float) -> None:
+        super().__init__(f"{bucket} rate limit reached; retry in {retry_after:.1f}s")
+        self.bucket = bucket
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Async token bucket. Waiters reserve tokens up front, so concurrent callers queue fairly."""
+
+    def __init__(self, name: str, rate: float, capacity: float) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, max_wait: float | None = None) -> float:
+        """Take one token, sleeping if needed. Returns seconds waited.
+
+        Raises RateLimitExceeded without consuming anything if the wait would exceed `max_wait`
+        (None means wait as long as necessary).
+        """
+        self._refill()
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        if max_wait is not None and wait > max_wait:
+            raise RateLimitExceeded(self.name, wait)
+        self._tokens -= 1
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def available(self) -> float:
+        """Tokens currently available (negative when callers are queued)."""
+        self._refill()
+        return self._tokens
+
+
+class MoltbookRateLimiter:
+    """Request, comment and post buckets for one Moltbook agent key."""
+
+    def __init__(self, settings: Settings) -> None:
+        rpm = settings.moltbook_requests_per_minute
+        self.requests = TokenBucket("requests", rate=rpm / 60.0, capacity=rpm)
+        self.comments = TokenBucket("comments", rate=1.0 / settings.moltbook_comment_interval, capacity=1)
+        self.posts = TokenBucket("posts", rate=1.0 / settings.moltbook_post_interval, capacity=1)
+
+    def bucket_for(self, method: str, path: str) -> TokenBucket | None:
+        """Write-specific bucket for a request, if any."""
+        if method != "POST":
+            return None
+        parts = path.strip("/").split("/")
+        if parts == ["posts"]:
+            return self.posts
+        if len(parts) == 3 and parts[0] == "posts" and parts[2] == "comments":
+            return self.comments
+        return None
+
+    async def acquire(self, method: str, path: str, max_wait: float | None = 0.0) -> float:
+        """Acquire the write bucket (bounded by `max_wait`) and then the request bucket."""
+        waited = 0.0
+        bucket = self.bucket_for(method, path)
+        if bucket is not None:
+            waited += await bucket.acquire(max_wait)
+        waited += await self.requests.acquire()
+        return waited
+
+
+_limiters: dict[str, MoltbookRateLimiter] = {}
+
+
+def get_moltbook_limiter(settings: Settings) -> MoltbookRateLimiter:
+    """Process-wide limiter per API key (clients are created per call, limits are per agent)."""
+    key = settings.moltbook_api_key or ""
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = MoltbookRateLimiter(settings)
+    return limiter
+
+
+def reset_limiters() -> None:
+    """Forget all buckets (tests, key rotation)."""
+    _limiters.clear()
@@ -0,0 +1,165 @@
+"""Opt-in recording of MCP tool calls as NDJSON, for replaying production-shaped load.
+
+With OPENCLAW_RECORD_CALLS=1 the server adds `RecordingMiddleware`, which appends one line
+per `tools/call` to OPENCLAW_RECORD_PATH (default `<log_dir>/calls.ndjson`):
+
+    {"ts": 1760000000.123, "tool": "clawd_sessions", "args": {...}, "duration_ms": 41.2,
+     "result_bytes": 5120, "success": true, "session": "..."}
+
+`ts` is the wall-clock start of the call, so overlapping calls overlap again on replay
+(`python -m openclaw_molt_mcp.replay`). Arguments are redacted before writing: secret-like
+keys (token, api_key, password, ...) become "[REDACTED]", recipients (to, targets, recipient,
+peer, phone) become "[HASH:<digest>]" (stable, so calls still group by recipient), and with
+OPENCLAW_RECORD_REDACT_TEXT (default on) free text (message, content, text, body, query) becomes
+"[REDACTED:<length>]" so replay can send text of the same size. When recording is off nothing
+is installed.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumpb
+from openclaw_molt_mcp.serve_logs import SENSITIVE_KEYS
+
+logger = logging.getLogger(__name__)
+
+TEXT_KEYS = frozenset({"message", "content", "text", "body", "query"})
+RECIPIENT_KEYS = frozenset({"to", "targets", "recipient", "recipients", "peer", "peer_id", "phone", "phone_number"})
+TEXT_MARKER = re.compile(r"^\[REDACTED:(\d+)\]$")
+
+
+def hash_recipients(value: Any) -> Any:
+    """Recipient identifiers (also inside lists and target dicts) replaced by a short stable digest."""
+    if isinstance(value, dict):
+        return {k: hash_recipients(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [hash_recipients(v) for v in value]
+    if isinstance(value, (str, int)) and not isinstance(value, bool) and value != "":
+        return f"[HASH:{hashlib.blake2b(str(value).encode(), digest_size=6).hexdigest()}]"
+    return value
+
+
+def redact_args(value: Any, redact_text: bool = True, key: str = "") -> Any:
+    """Copy of tool arguments: secrets removed, recipients hashed, free text (optionally) reduced to its length."""
+    lowered = key.lower()
+    if key and any(s in lowered for s in SENSITIVE_KEYS):
+        return "[REDACTED]" if value else value
+    if lowered in RECIPIENT_KEYS:
+        return hash_recipients(value)
+    if isinstance(value, dict):
+        return {k: redact_args(v, redact_text, str(k)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [redact_args(v, redact_text, key) for v in value]
+    if redact_text and isinstance(value, str) and lowered in TEXT_KEYS:
+        return f"[REDACTED:{len(value)}]"
+    return value
+
+
+def result_size(result: Any) -> int:
+    """Bytes of the text content of a ToolResult (structured content if there is no text)."""
+    size = 0
+    for part in getattr(result, "content", None) or []:
+        text = getattr(part, "text", None)
+        if isinstance(text, str):
+            size += len(text.encode())
+    if not size and getattr(result, "structured_content", None) is not None:
+        size = len(dumpb(result.structured_content))
+    return size
+
+
+def result_success(result: Any) -> bool:
+    """Dialogic `success` of a ToolResult, else not is_error."""
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict):
+        inner = structured.get("result", structured)
+        if isinstance(inner, dict) and "success" in inner:
+            return bool(inner["success"])
+    return not getattr(result, "is_error", False)
+
+
+class CallRecorder:
+    """Appends NDJSON records to a file; safe to share across tasks and threads."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = dumpb(record) + b"\n"
+        with self._lock, self.path.open("ab") as f:
+            f.write(line)
+
+
+class RecordingMiddleware(Middleware):
+    """Records tool name, redacted arguments, timing, result size and outcome of each tool call."""
+
+    def __init__(self, recorder: CallRecorder, redact_text: bool = True) -> None:
+        self.recorder = recorder
+        self.redact_text = redact_text
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        started = time.time()
+        t0 = time.perf_counter()
+        record: dict[str, Any] = {
+            "ts": round(started, 6),
+            "tool": context.message.name,
+            "args": redact_args(context.message.arguments or {}, self.redact_text),
+        }
+        fctx = context.fastmcp_context
+        try:
+            record["session"] = fctx.session_id if fctx is not None else None
+        except RuntimeError:
+            record["session"] = None
+        try:
+            result = await call_next(context)
+        except Exception as e:
+            record.update(
+                duration_ms=round((time.perf_counter() - t0) * 1000, 3),
+                result_bytes=0,
+                success=False,
+                error=type(e).__name__,
+            )
+            self._write(record)
+            raise
+        record.update(
+            duration_ms=round((time.perf_counter() - t0) * 1000, 3),
+            result_bytes=result_size(result),
+            success=result_success(result),
+        )
+        self._write(record)
+        return result
+
+    def _write(self, record: dict[str, Any]) -> None:
+        try:
+            self.recorder.write(record)
+        except OSError as e:
+            logger.error(
+                "Could not write call record: %s",
+                e,
+                extra={"tool": "recorder", "operation": "write", "error_type": type(e).__name__},
+                exc_info=True,
+            )
+
+
+def recording_middleware(settings: Settings | None = None) -> RecordingMiddleware | None:
+    """Middleware to install when OPENCLAW_RECORD_CALLS is on, else None."""
+    settings = settings or Settings()
+    if not settings.record_calls:
+        return None
+    path = settings.record_path or Path(settings.log_dir) / "calls.ndjson"
+    return RecordingMiddleware(CallRecorder(path), redact_text=settings.record_redact_text)
@@ -0,0 +1,302 @@
+"""Replay a recorded tool-call trace (see `recorder`) and compare latencies.
+
+Each recorded call is reissued at its original offset from the start of the trace divided by
+`speed` (2 = twice as fast), each in its own task, so calls that overlapped when recorded
+overlap again. Tasks are started as their calls fall due, at most `max_in_flight` at a time.
+Redacted text (`[REDACTED:<n>]`) is replaced by `n` filler characters.
+
+Replay is read-only by default: only operations listed in `READ_ONLY_OPERATIONS` are sent;
+sends, posts, comments, upvotes, broadcasts, disconnects and anything unknown are skipped and
+counted in the report, unless `--allow-writes` is given (point it at the emulator: recorded
+recipients are hashed and text is filler).
+
+    python -m openclaw_molt_mcp.replay calls.ndjson                       # in-process server
+    python -m openclaw_molt_mcp.replay calls.ndjson --speed 4 --url http://127.0.0.1:10765/mcp
+
+In-process replay uses the current environment (OPENCLAW_GATEWAY_URL etc.), so it runs
+against a real Gateway or the emulator (`python -m openclaw_molt_mcp.emulator`). The report
+gives, per tool and overall, recorded vs replayed p50/p95/mean latency and their deltas,
+errors, peak concurrency and schedule lag (how late calls started; high lag means the
+replaying client could not keep up and the result understates load).
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from openclaw_molt_mcp.jsoncodec import dumps, loads
+from openclaw_molt_mcp.recorder import TEXT_MARKER, result_success
+
+# `openclaw doctor` can apply migrations and fixes, so `clawd_gateway doctor` and `clawd_security audit`
+# (which runs it) are not listed.
+READ_ONLY_OPERATIONS: dict[str, frozenset[str]] = {
+    "clawd_admin": frozenset({"profiling_status", "list_profiles", "profile_summary", "slow_calls", "log_levels"}),
+    "clawd_agent": frozenset({"job_status", "job_result"}),
+    "clawd_bastion": frozenset({"validate", "status"}),
+    "clawd_channels": frozenset({"list_channels", "get_channel_config", "get_recent_messages", "unified_inbox"}),
+    "clawd_gateway": frozenset({"status", "health"}),
+    "clawd_moltbook": frozenset({"feed", "search", "status", "heartbeat_dm", "fetch_posts"}),
+    "clawd_routing": frozenset({"get_routing_rules", "test_routing", "get_session_by_channel"}),
+    "clawd_security": frozenset({"check_skills", "validate_config", "recommendations"}),
+    "clawd_sessions": frozenset({"list", "history", "archive_history", "history_many"}),
+    "clawd_skills": frozenset({"list", "read"}),
+}
+# Operation a tool runs when the call omits it.
+DEFAULT_OPERATIONS = {"clawd_admin": "profiling_status", "clawd_gateway": "status"}
+
+
+def call_name(record: dict[str, Any]) -> str:
+    """`tool.operation` of a record (just the tool when it takes no operation)."""
+    raw_args = record.get("args")
+    args: dict[str, Any] = raw_args if isinstance(raw_args, dict) else {}
+    operation = args.get("operation") or DEFAULT_OPERATIONS.get(record["tool"])
+    return f"{record['tool']}.{operation}" if operation else record["tool"]
+
+
+def is_read_only(record: dict[str, Any]) -> bool:
+    """Whether replaying the record cannot send, post or change anything upstream."""
+    tool, _, operation = call_name(record).partition(".")
+    return operation in READ_ONLY_OPERATIONS.get(tool, ())
+
+
+def load_trace(path: Path | str, tools: list[str] | None = None) -> list[dict[str, Any]]:
+    """Records from an NDJSON trace ordered by start time (malformed lines are skipped)."""
+    records = []
+    with Path(path).open("rb") as f:
+        for line in f:
+            try:
+                record = loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and "tool" in record and "ts" in record:
+                if not tools or record["tool"] in tools:
+                    records.append(record)
+    records.sort(key=lambda r: r["ts"])
+    return records
+
+
+def restore_args(value: Any, filler: str = "x") -> Any:
+    """Arguments with `[REDACTED:<n>]` text markers expanded to `n` filler characters."""
+    if isinstance(value, dict):
+        return {k: restore_args(v, filler) for k, v in value.items()}
+    if isinstance(value, list):
+        return [restore_args(v, filler) for v in value]
+    if isinstance(value, str):
+        match = TEXT_MARKER.match(value)
+        if match:
+            return filler * int(match.group(1))
+    return value
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered), max(1, math.ceil(q / 100 * len(ordered)))) - 1]
+
+
+def peak_concurrency(intervals: list[tuple[float, float]]) -> int:
+    """Most intervals (start, end) open at the same moment."""
+    events = sorted([(s, 1) for s, _ in intervals] + [(e, -1) for _, e in intervals])
+    peak = current = 0
+    for _, step in events:
+        current += step
+        peak = max(peak, current)
+    return peak
+
+
+async def replay(
+    client: Any,
+    records: list[dict[str, Any]],
+    speed: float = 1.0,
+    allow_writes: bool = False,
+    max_in_flight: int = 256,
+) -> list[dict[str, Any]]:
+    """Reissue `records` through an MCP client on the recorded schedule; one outcome per call sent.
+
+    Without `allow_writes`, records that are not read-only are skipped (offsets still count
+    from the first record). A call starts when due or, with `max_in_flight` calls running,
+    when one finishes; the delay shows up as lag.
+    """
+    if not records:
+        return []
+    speed = max(speed, 1e-6)
+    t0 = records[0]["ts"]
+    start = time.perf_counter()
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    outcomes: list[dict[str, Any]] = []
+    running: set[asyncio.Task[None]] = set()
+
+    async def run(record: dict[str, Any], due: float) -> None:
+        began = time.perf_counter() - start
+        try:
+            result = await client.call_tool(
+                record["tool"], restore_args(record.get("args") or {}), raise_on_error=False
+            )
+            success = result_success(result)
+        except Exception:
+            success = False
+        finally:
+            slots.release()
+        ended = time.perf_counter() - start
+        outcomes.append(
+            {
+                "tool": record["tool"],
+                "start": began,
+                "end": ended,
+                "lag_ms": max(0.0, (began - due) * 1000),
+                "replay_ms": (ended - began) * 1000,
+                "recorded_ms": float(record.get("duration_ms") or 0.0),
+                "success": success,
+                "recorded_success": bool(record.get("success", True)),
+            }
+        )
+
+    try:
+        for record in records:
+            if not allow_writes and not is_read_only(record):
+                continue
+            due = (record["ts"] - t0) / speed
+            delay = due - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            task = asyncio.create_task(run(record, due))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        while running:
+            await asyncio.gather(*running)
+    finally:
+        for task in running:
+            task.cancel()
+    return sorted(outcomes, key=lambda o: o["start"])
+
+
+def _latency_stats(outcomes: list[dict[str, Any]]) -> dict[str, Any]:
+    recorded = [o["recorded_ms"] for o in outcomes]
+    replayed = [o["replay_ms"] for o in outcomes]
+    out: dict[str, Any] = {"calls": len(outcomes)}
+    stats: tuple[tuple[str, Callable[[list[float]], float]], ...] = (
+        ("p50", lambda v: _percentile(v, 50)),
+        ("p95", lambda v: _percentile(v, 95)),
+        ("mean", lambda v: sum(v) / len(v)),
+    )
+    for name, fn in stats:
+        rec, rep = fn(recorded), fn(replayed)
+        out[f"recorded_{name}_ms"] = round(rec, 2)
+        out[f"replay_{name}_ms"] = round(rep, 2)
+        out[f"delta_{name}_ms"] = round(rep - rec, 2)
+    out["errors"] = sum(not o["success"] for o in outcomes)
+    out["recorded_errors"] = sum(not o["recorded_success"] for o in outcomes)
+    return out
+
+
+def skipped_writes(records: list[dict[str, Any]]) -> dict[str, int]:
+    """Calls per `tool.operation` that a read-only replay leaves out."""
+    skipped: dict[str, int] = {}
+    for record in records:
+        if not is_read_only(record):
+            name = call_name(record)
+            skipped[name] = skipped.get(name, 0) + 1
+    return dict(sorted(skipped.items()))
+
+
+def build_report(
+    records: list[dict[str, Any]],
+    outcomes: list[dict[str, Any]],
+    speed: float,
+    allow_writes: bool = False,
+) -> dict[str, Any]:
+    """Per-tool and overall latency deltas, errors, concurrency and schedule lag.
+
+    Recorded figures cover the calls that were replayed; `skipped` counts the write calls a
+    read-only replay left out.
+    """
+    skipped = {} if allow_writes else skipped_writes(records)
+    if not allow_writes:
+        records = [r for r in records if is_read_only(r)]
+    report: dict[str, Any] = {"speed": speed, "allow_writes": allow_writes, "skipped": skipped}
+    if not outcomes or not records:
+        return {**report, "overall": {"calls": 0}, "tools": {}}
+    by_tool: dict[str, list[dict[str, Any]]] = {}
+    for o in outcomes:
+        by_tool.setdefault(o["tool"], []).append(o)
+    recorded_intervals = [(r["ts"], r["ts"] + float(r.get("duration_ms") or 0) / 1000) for r in records]
+    overall = _latency_stats(outcomes)
+    overall.update(
+        recorded_duration_s=round(max(e for _, e in recorded_intervals) - records[0]["ts"], 3),
+        replay_duration_s=round(max(o["end"] for o in outcomes), 3),
+        recorded_peak_concurrency=peak_concurrency(recorded_intervals),
+        replay_peak_concurrency=peak_concurrency([(o["start"], o["end"]) for o in outcomes]),
+        max_lag_ms=round(max(o["lag_ms"] for o in outcomes), 2),
+        p95_lag_ms=round(_percentile([o["lag_ms"] for o in outcomes], 95), 2),
+    )
+    return {
+        **report,
+        "overall": overall,
+        "tools": {tool: _latency_stats(items) for tool, items in sorted(by_tool.items())},
+    }
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    from fastmcp import Client
+
+    records = load_trace(args.trace, args.tools)
+    if args.url:
+        target: Any = args.url
+    else:
+        from openclaw_molt_mcp import server  # noqa: F401 -- registers tools and middleware
+        from openclaw_molt_mcp.mcp_instance import mcp
+
+        target = mcp
+    async with Client(target) as client:
+        outcomes = await replay(client, records, args.speed, args.allow_writes, args.max_in_flight)
+    return build_report(records, outcomes, args.speed, args.allow_writes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded openclaw-molt-mcp tool-call trace")
+    parser.add_argument("trace", type=Path, help="NDJSON trace written with OPENCLAW_RECORD_CALLS=1")
+    parser.add_argument("--speed", type=float, default=1.0, help="time compression factor (2 = twice as fast)")
+    parser.add_argument("--url", help="MCP HTTP endpoint (default: in-process server)")
+    parser.add_argument("--tools", nargs="+", help="only replay these tools")
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="also replay sends, posts, comments, upvotes, broadcasts, disconnects and doctor runs (default: off)",
+    )
+    parser.add_argument("--max-in-flight", type=int, default=256, help="most calls running at once")
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(_run(args))
+    o = report["overall"]
+    print(f"Replayed {o['calls']} calls at {report['speed']}x")
+    if report["skipped"]:
+        skipped = ", ".join(f"{name} x{n}" for name, n in report["skipped"].items())
+        total = sum(report["skipped"].values())
+        print(f"  skipped {total} write calls (read-only replay; --allow-writes sends them): {skipped}")
+    if o["calls"]:
+        print(
+            f"  duration {o['recorded_duration_s']}s -> {o['replay_duration_s']}s, peak concurrency "
+            f"{o['recorded_peak_concurrency']} -> {o['replay_peak_concurrency']}, lag p95 {o['p95_lag_ms']} ms"
+        )
+        print(
+            f"  {'tool':<28} {'calls':>6} {'p50 rec':>9} {'p50 rep':>9} {'p95 rec':>9} {'p95 rep':>9} "
+            f"{'Δmean':>8} {'errors':>7}"
+        )
+        for tool, t in [("(all)", o), *report["tools"].items()]:
+            print(
+                f"  {tool:<28} {t['calls']:>6} {t['recorded_p50_ms']:>9} {t['replay_p50_ms']:>9} "
+                f"{t['recorded_p95_ms']:>9} {t['replay_p95_ms']:>9} {t['delta_mean_ms']:>+8.1f} {t['errors']:>7}"
+            )
+    if args.json:
+        args.json.write_text(dumps(report), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
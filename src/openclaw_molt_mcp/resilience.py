@@ -0,0 +1,248 @@
+"""Retry with jittered backoff and per-upstream circuit breakers for the HTTP clients.
+
+`GatewayClient` and `MoltbookClient` route every request through `send_with_resilience`:
+
+- Connection failures (request never sent) are retried for any method.
+- Read timeouts, protocol errors and 5xx responses are retried only for idempotent calls.
+- 429 and 503 responses honor `Retry-After` (capped) before the next attempt.
+- Each upstream has a circuit breaker: after N consecutive failed calls (one outcome per call,
+  however many attempts it took) it opens and calls fail fast with `CircuitOpenError`; after
+  the reset timeout one probe call is let through (half-open) and its outcome closes or
+  re-opens the circuit.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from openclaw_molt_mcp.config import Settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+RETRY_STATUS = frozenset({429, 502, 503, 504})
+# Errors raised before any byte of the request reached the upstream: always safe to retry.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the upstream's circuit is open."""
+
+    def __init__(self, upstream: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {upstream}; retry in {retry_in:.0f}s")
+        self.upstream = upstream
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.last_error: str | None = None
+
+    def before_call(self) -> None:
+        """Admit or reject a call. Moves open -> half_open once the reset timeout has passed."""
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN:
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(self.name, remaining)
+            self.state = HALF_OPEN
+            self.probe_in_flight = False
+        if self.probe_in_flight:
+            raise CircuitOpenError(self.name, 0.0)
+        self.probe_in_flight = True
+
+    def release_probe(self) -> None:
+        """Forget an admitted call without an outcome (it was cancelled)."""
+        self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info(
+                "Circuit closed for %s",
+                self.name,
+                extra={"tool": "resilience", "operation": "circuit_close"},
+            )
+        self.state = CLOSED
+        self.failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self, error: str) -> None:
+        self.failures += 1
+        self.last_error = error
+        self.probe_in_flight = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning(
+                    "Circuit opened for %s after %d failures: %s",
+                    self.name,
+                    self.failures,
+                    error,
+                    extra={"tool": "resilience", "operation": "circuit_open"},
+                )
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        """State for health output."""
+        snap: dict[str, Any] = {"state": self.state, "failures": self.failures, "last_error": self.last_error}
+        if self.state == OPEN:
+            snap["retry_in"] = round(max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at)), 1)
+        return snap
+
+
+class RetryPolicy:
+    """Attempt budget and full-jitter exponential backoff."""
+
+    def __init__(
+        self, max_attempts: int = 3, backoff_base: float = 0.2, backoff_max: float = 5.0, retry_after_max: float = 30.0
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RetryPolicy":
+        return cls(
+            max_attempts=settings.retry_max_attempts,
+            backoff_base=settings.retry_backoff_base,
+            backoff_max=settings.retry_backoff_max,
+            retry_after_max=settings.retry_after_max,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))  # noqa: S311 (jitter)
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)."""
+    value = response.headers.get("Retry-After") if response.headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(upstream: str, settings: Settings) -> CircuitBreaker:
+    """Process-wide breaker per upstream (clients are short-lived; upstream health is not)."""
+    breaker = _breakers.get(upstream)
+    if breaker is None:
+        breaker = _breakers[upstream] = CircuitBreaker(
+            upstream,
+            failure_threshold=settings.breaker_failure_threshold,
+            reset_timeout=settings.breaker_reset_timeout,
+        )
+    return breaker
+
+
+def breaker_states() -> dict[str, dict[str, Any]]:
+    """Snapshot of every known breaker, keyed by upstream."""
+    return {name: b.snapshot() for name, b in _breakers.items()}
+
+
+def reset_breakers() -> None:
+    """Forget all breakers (tests, config reload)."""
+    _breakers.clear()
+
+
+async def send_with_resilience(
+    send: Callable[[], Awaitable[httpx.Response]],
+    breaker: CircuitBreaker,
+    policy: RetryPolicy,
+    idempotent: bool,
+) -> httpx.Response:
+    """Run `send` under the breaker with retries; returns the response after raise_for_status.
+
+    The breaker admits the call once and records one outcome for it, however many attempts it
+    took: a failure when it ends in a request error, a 5xx or any other exception, a success
+    otherwise (4xx included: the upstream answered). Cancellation only releases a half-open
+    probe, so the next call can probe again.
+
+    Raises CircuitOpenError, httpx.HTTPStatusError or httpx.RequestError once retries are
+    exhausted, so callers keep their existing dialogic error handling.
+    """
+    breaker.before_call()
+    try:
+        resp = await _send_with_retries(send, breaker.name, policy, idempotent)
+    except asyncio.CancelledError:
+        breaker.release_probe()
+        raise
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code >= 500:
+            breaker.record_failure(f"HTTP {e.response.status_code}")
+        else:
+            breaker.record_success()
+        raise
+    except BaseException as e:
+        breaker.record_failure(f"{type(e).__name__}: {e}")
+        raise
+    breaker.record_success()
+    return resp
+
+
+async def _send_with_retries(
+    send: Callable[[], Awaitable[httpx.Response]],
+    upstream: str,
+    policy: RetryPolicy,
+    idempotent: bool,
+) -> httpx.Response:
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            resp = await send()
+        except httpx.RequestError as e:
+            retriable = isinstance(e, NOT_SENT_ERRORS) or idempotent
+            if not retriable or attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt)
+        else:
+            status = resp.status_code
+            # 429 and 503 mean the upstream refused the request, so any method may retry.
+            retriable = status in RETRY_STATUS and (idempotent or status in (429, 503))
+            if not retriable or attempt >= policy.max_attempts:
+                resp.raise_for_status()
+                return resp
+            hinted = retry_after_seconds(resp) if status in (429, 503) else None
+            if hinted is not None and hinted > policy.retry_after_max:
+                resp.raise_for_status()
+            delay = hinted if hinted is not None else policy.backoff(attempt)
+            await resp.aclose()  # release streamed responses before retrying
+        logger.debug(
+            "Retrying %s (attempt %d/%d) in %.2fs",
+            upstream,
+            attempt + 1,
+            policy.max_attempts,
+            delay,
+            extra={"tool": "resilience", "operation": "retry"},
+        )
+        await asyncio.sleep(delay)
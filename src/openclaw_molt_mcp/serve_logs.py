@@ -5,12 +5,12 @@ Run: python -m openclaw_molt_mcp.serve_logs
 Serves GET /api/logs?tail=500 with CORS. Default port 8765 (CLAWD_LOG_SERVER_PORT).
 """
 
-import json
 import os
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
+from openclaw_molt_mcp import jsoncodec
 from openclaw_molt_mcp.logging_config import get_log_file_path
 
 
@@ -50,9 +50,9 @@ def tail_log_lines(path: Path, n: int = 500) -> list[dict]:
         if not line:
             continue
         try:
-            entry = json.loads(line)
+            entry = jsoncodec.loads(line)
             out.append(_redact_entry(entry))
-        except json.JSONDecodeError:
+        except ValueError:
             out.append({"msg": line, "level": "RAW", "ts": None})
     return out
 
@@ -93,7 +93,7 @@ class LogsHandler(BaseHTTPRequestHandler):
                 pass
         log_path = get_log_file_path()
         entries = tail_log_lines(log_path, n=tail)
-        body = json.dumps({"entries": entries, "source": str(log_path)}).encode("utf-8")
+        body = jsoncodec.dumpb({"entries": entries, "source": str(log_path)})
         self.send_response(200)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
@@ -7,14 +7,66 @@ import sys
 from openclaw_molt_mcp.config import Settings
 from openclaw_molt_mcp.logging_config import setup_logging
 from openclaw_molt_mcp.mcp_instance import mcp
-from openclaw_molt_mcp.tools import agent, bastion, channels, gateway, moltbook, openclaw_remove, routing, security, sessions, skills, voice  # noqa: F401 -- register tools
+from openclaw_molt_mcp.profiling import enable_profiling
+from openclaw_molt_mcp.recorder import recording_middleware
+from openclaw_molt_mcp.slow_calls import configure_slow_calls
+from openclaw_molt_mcp.tools import (  # noqa: F401 -- register tools
+    admin,
+    agent,
+    bastion,
+    channels,
+    gateway,
+    moltbook,
+    openclaw_remove,
+    routing,
+    security,
+    sessions,
+    skills,
+    voice,
+)
+from openclaw_molt_mcp.tracing import TracingMiddleware, configure_tracing
 
 _settings = Settings()
 setup_logging(_settings)
 logger = logging.getLogger(__name__)
 
+# Runtime per-logger levels (clawd_admin set_log_level) sync from the mcp lifespan (mcp_instance.py)
+
 # Tools register via @mcp.tool() on import
 
+# Trace/span ids per tool call (logs, outbound traceparent); OTLP/JSON export with OPENCLAW_TRACE_EXPORT=1
+mcp.add_middleware(TracingMiddleware())
+_trace_exporter = configure_tracing(_settings)
+if _trace_exporter is not None:
+    logger.info(
+        "Exporting traces to %s",
+        _trace_exporter.path,
+        extra={"tool": "server", "operation": "trace_export"},
+    )
+
+# Slow-call journal (OPENCLAW_SLOW_CALL_MS, default 2000; 0 = off)
+configure_slow_calls(_settings)
+
+# Opt-in call recording for replay (OPENCLAW_RECORD_CALLS=1)
+_recorder = recording_middleware(_settings)
+if _recorder is not None:
+    mcp.add_middleware(_recorder)
+    logger.info(
+        "Recording tool calls to %s",
+        _recorder.recorder.path,
+        extra={"tool": "server", "operation": "record_calls"},
+    )
+
+# Opt-in per-tool profiling (OPENCLAW_PROFILE_TOOLS=clawd_sessions,... or *; runtime: clawd_admin)
+if _settings.profile_tools.strip():
+    _profiler = enable_profiling(_settings.profile_tools, _settings.profile_sample_rate, _settings)
+    logger.info(
+        "Profiling %s to %s",
+        ",".join(sorted(_profiler.tools)),
+        _profiler.directory,
+        extra={"tool": "server", "operation": "profile_tools"},
+    )
+
 # Optional: mount virtualization-mcp for sandbox provisioning (CLAWD_MOUNT_VBOX=1)
 if os.environ.get("CLAWD_MOUNT_VBOX", "").lower() in ("1", "true", "yes"):
     try:
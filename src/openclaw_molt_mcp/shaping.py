@@ -0,0 +1,159 @@
+"""Output shaping for large tool results: field projection, byte budgets and cursor paging.
+
+`shape_result` works on the dialogic envelope (`{success, message, data}`). When `data` is
+(or wraps, e.g. `{"messages": [...]}`) a list of items:
+
+- `fields` keeps only the listed keys of each item (dotted paths such as `author.name`).
+- `page_size` / `cursor` page through the items; `page.next_cursor` continues the listing.
+- `max_bytes` caps the serialized envelope: trailing items are deferred to the next page and,
+  if a single item is still too large, long strings are cut with a `…[+N chars]` marker.
+  The envelope then gains `truncated` describing what was cut.
+
+Results are returned untouched unless at least one shaping option is given.
+"""
+
+from typing import Any
+
+from openclaw_molt_mcp.inbox import InvalidCursorError, decode_cursor, encode_cursor
+from openclaw_molt_mcp.jsoncodec import dumpb
+
+LIST_KEYS = ("messages", "posts", "items", "results", "history", "comments", "feed")
+MIN_MAX_BYTES = 256
+MIN_STRING_CHARS = 32
+# Room kept for the `truncated` and `page` keys added after the budget is applied.
+ENVELOPE_RESERVE = 200
+
+
+def encoded_size(value: Any) -> int:
+    """Bytes of `value` as compact UTF-8 JSON."""
+    return len(dumpb(value))
+
+
+def project(item: Any, fields: list[str]) -> Any:
+    """Keep only `fields` (dotted paths) of a dict item; other values pass through unchanged."""
+    if not isinstance(item, dict):
+        return item
+    out: dict[str, Any] = {}
+    for path in fields:
+        parts = path.split(".")
+        value: Any = item
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = out
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return out
+
+
+def truncate_strings(value: Any, max_chars: int) -> tuple[Any, int]:
+    """Cut strings longer than `max_chars`; returns (value, number of strings cut)."""
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value, 0
+        return f"{value[:max_chars]}…[+{len(value) - max_chars} chars]", 1
+    if isinstance(value, dict):
+        cut = 0
+        out = {}
+        for k, v in value.items():
+            out[k], n = truncate_strings(v, max_chars)
+            cut += n
+        return out, cut
+    if isinstance(value, list):
+        cut = 0
+        items = []
+        for v in value:
+            v, n = truncate_strings(v, max_chars)
+            items.append(v)
+            cut += n
+        return items, cut
+    return value, 0
+
+
+def _locate(data: Any) -> tuple[str | None, list[Any] | None]:
+    """Key of the item list inside `data` (None if `data` is the list), and the list itself."""
+    if isinstance(data, list):
+        return None, data
+    if isinstance(data, dict):
+        for key in LIST_KEYS:
+            if isinstance(data.get(key), list):
+                return key, data[key]
+    return None, None
+
+
+def _with_items(data: Any, key: str | None, items: list[Any]) -> Any:
+    return items if key is None else {**data, key: items}
+
+
+def shape_result(
+    result: dict[str, Any],
+    fields: list[str] | None = None,
+    max_bytes: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """Apply projection, paging and a byte budget to a successful dialogic result."""
+    if not result.get("success") or "data" not in result:
+        return result
+    if not (fields or max_bytes or page_size or cursor):
+        return result
+    try:
+        offset = int(decode_cursor(cursor).get("offset", 0)) if cursor else 0
+    except (InvalidCursorError, TypeError, ValueError) as e:
+        return {"success": False, "message": f"Invalid cursor: {e}", "error": "invalid_cursor"}
+
+    data = result["data"]
+    key, items = _locate(data)
+    out = dict(result)
+    page: dict[str, Any] | None = None
+    if items is None:
+        out["data"] = project(data, fields) if fields else data
+    else:
+        offset = max(0, min(offset, len(items)))
+        end = len(items) if not page_size else min(len(items), offset + max(1, page_size))
+        selected = items[offset:end]
+        if fields:
+            selected = [project(i, fields) for i in selected]
+        out["data"] = _with_items(data, key, selected)
+        page = {"offset": offset, "returned": len(selected), "total": len(items)}
+
+    if max_bytes:
+        budget = max(MIN_MAX_BYTES, max_bytes) - ENVELOPE_RESERVE
+        original = encoded_size(out)
+        if original > budget:
+            omitted = 0
+            if page is not None:
+                # Largest prefix of the page that fits (at least one item is always kept).
+                lo, hi = 1, len(selected)
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if encoded_size({**out, "data": _with_items(data, key, selected[:mid])}) <= budget:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                keep = min(lo, len(selected))
+                omitted = len(selected) - keep
+                selected = selected[:keep]
+                out["data"] = _with_items(data, key, selected)
+                page["returned"] = keep
+            strings_cut = 0
+            max_chars = 4096
+            full = out["data"]
+            while encoded_size(out) > budget and max_chars >= MIN_STRING_CHARS:
+                out["data"], strings_cut = truncate_strings(full, max_chars)
+                max_chars //= 2
+            out["truncated"] = {
+                "original_bytes": original,
+                "returned_bytes": encoded_size(out),
+                "omitted_items": omitted,
+                "strings_truncated": strings_cut,
+            }
+
+    if page is not None:
+        end = page["offset"] + page["returned"]
+        page["next_cursor"] = encode_cursor({"offset": end}) if end < page["total"] else None
+        out["page"] = page
+    return out
@@ -0,0 +1,198 @@
+"""Slow-call journal: tail-latency forensics without DEBUG logging.
+
+A span processor (see `tracing`) that looks at every finished trace: when its root span (an MCP
+tool call, a webapp API request, or an upstream request made outside either) took at least
+OPENCLAW_SLOW_CALL_MS, one entry is kept in an in-memory ring buffer (OPENCLAW_SLOW_CALL_BUFFER
+entries) and appended to a rotating NDJSON file (`<log_dir>/slow-calls.jsonl` for the MCP
+server, `slow-calls-webapp.jsonl` for the webapp API; rotated with log_max_bytes /
+log_backup_count):
+
+    {"ts": ..., "trace_id": "...", "name": "tools/call clawd_sessions", "tool": "clawd_sessions",
+     "operation": "history", "duration_ms": 4210.5, "success": true, "args": {...redacted...},
+     "result_bytes": 81234, "upstream_ms": 4102.3,
+     "breakdown": [{"name": "gateway sessions_history", "offset_ms": 0.4, "duration_ms": 4105.0},
+                   {"name": "gateway POST /tools/invoke", "offset_ms": 0.6, "duration_ms": 3001.2,
+                    "status": "ReadTimeout"}, ...]}
+
+Arguments are redacted like call recordings (`recorder.redact_args`). Entries are only built
+for slow traces; OPENCLAW_SLOW_CALL_MS=0 turns the journal off.
+"""
+
+import logging
+import logging.handlers
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumps, loads
+from openclaw_molt_mcp.recorder import redact_args, result_size
+from openclaw_molt_mcp.tracing import STATUS_ERROR, Span, TraceCollector, add_span_processor, remove_span_processor
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "slow-calls.jsonl"
+# Attributes copied from child spans into the breakdown.
+BREAKDOWN_ATTRIBUTES = {
+    "http.status_code": "http_status",
+    "http.request.body.size": "request_bytes",
+    "http.response.body.size": "response_bytes",
+    "exit_code": "exit_code",
+}
+
+
+def build_entry(spans: list[Span]) -> dict[str, Any]:
+    """Journal entry for a finished trace (root span last)."""
+    root = spans[-1]
+    entry: dict[str, Any] = {
+        "ts": round(root.start_ns / 1e9, 3),
+        "trace_id": root.trace_id,
+        "name": root.name,
+        "duration_ms": round(root.duration_ms, 2),
+        "success": root.status != STATUS_ERROR,
+    }
+    for key in ("tool", "operation", "http.method", "url.path", "http.status_code"):
+        if key in root.attributes:
+            entry[key] = root.attributes[key]
+    if root.error:
+        entry["error"] = root.error
+    payload = root.payload or {}
+    if "args" in payload:
+        entry["args"] = redact_args(payload["args"])
+    if payload.get("result") is not None:
+        entry["result_bytes"] = result_size(payload["result"])
+    breakdown = []
+    for s in sorted(spans[:-1], key=lambda s: s.start_ns):
+        item: dict[str, Any] = {
+            "name": s.name,
+            "offset_ms": round((s.start_ns - root.start_ns) / 1e6, 2),
+            "duration_ms": round(s.duration_ms, 2),
+        }
+        for attr, key in BREAKDOWN_ATTRIBUTES.items():
+            if attr in s.attributes:
+                item[key] = s.attributes[attr]
+        if s.error:
+            item["status"] = s.error
+        breakdown.append(item)
+    entry["upstream_ms"] = round(sum(s.duration_ms for s in spans[:-1] if s.kind == "client"), 2)
+    entry["breakdown"] = breakdown
+    return entry
+
+
+class SlowCallJournal(TraceCollector):
+    """Ring buffer (+ optional rotating file) of traces slower than `threshold_ms`."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        maxlen: int = 200,
+        path: Path | str | None = None,
+        max_bytes: int = 2 * 1024 * 1024,
+        backup_count: int = 3,
+    ) -> None:
+        super().__init__()
+        self.threshold_ms = threshold_ms
+        self.entries: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self.path = Path(path) if path else None
+        self._handler: logging.Handler | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                self.path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+            )
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    @classmethod
+    def from_settings(cls, settings: Settings, process: str = "mcp") -> "SlowCallJournal":
+        return cls(
+            settings.slow_call_ms,
+            maxlen=settings.slow_call_buffer,
+            path=journal_path(settings, process),
+            max_bytes=settings.log_max_bytes,
+            backup_count=settings.log_backup_count,
+        )
+
+    def on_trace(self, spans: list[Span]) -> None:
+        if spans[-1].duration_ms < self.threshold_ms:
+            return
+        try:
+            entry = build_entry(spans)
+        except Exception as e:
+            logger.error(
+                "Could not build slow-call entry: %s",
+                e,
+                extra={"tool": "slow_calls", "operation": "record", "error_type": type(e).__name__},
+                exc_info=True,
+            )
+            return
+        self.entries.append(entry)
+        if self._handler is not None:
+            self._handler.handle(logging.makeLogRecord({"msg": dumps(entry)}))
+
+    def recent(self, limit: int = 50) -> list[dict[str, Any]]:
+        """Newest `limit` entries in this process, newest first."""
+        return list(reversed(self.entries))[: max(0, limit)]
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self._handler.close()
+
+
+def journal_path(settings: Settings, process: str = "mcp") -> Path:
+    """Journal file of the MCP server ("mcp") or another process (e.g. "webapp": slow-calls-webapp.jsonl)."""
+    path = settings.slow_call_path or Path(settings.log_dir) / JOURNAL_FILE
+    return path if process == "mcp" else path.with_name(f"{path.stem}-{process}{path.suffix}")
+
+
+def read_journal(path: Path | str, limit: int = 50) -> list[dict[str, Any]]:
+    """Newest `limit` entries from a journal file and its rotated backups, newest first."""
+    path = Path(path)
+    entries: list[dict[str, Any]] = []
+    backups = [p for p in path.parent.glob(f"{path.name}.*") if p.suffix[1:].isdigit()]
+    files = [path, *sorted(backups, key=lambda p: int(p.suffix[1:]))]
+    for file in files:
+        if len(entries) >= limit:
+            break
+        try:
+            lines = file.read_bytes().splitlines()
+        except OSError:
+            continue
+        for line in reversed(lines):
+            try:
+                entry = loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
+    return entries
+
+
+_journal: SlowCallJournal | None = None
+
+
+def configure_slow_calls(settings: Settings | None = None, process: str = "mcp") -> SlowCallJournal | None:
+    """Install the journal as a span processor unless OPENCLAW_SLOW_CALL_MS is 0."""
+    global _journal
+    settings = settings or Settings()
+    reset_slow_calls()
+    if settings.slow_call_ms <= 0:
+        return None
+    _journal = SlowCallJournal.from_settings(settings, process)
+    add_span_processor(_journal)
+    return _journal
+
+
+def get_journal() -> SlowCallJournal | None:
+    """The installed journal, if any."""
+    return _journal
+
+
+def reset_slow_calls() -> None:
+    """Uninstall the journal (tests, config reload)."""
+    global _journal
+    if _journal is not None:
+        remove_span_processor(_journal)
+        _journal.close()
+        _journal = None
@@ -0,0 +1,171 @@
+"""clawd_admin: runtime diagnostics of this MCP server (profiling, slow calls, log levels)."""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+from fastmcp import Context
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.log_levels import get_log_levels
+from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.profiling import (
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    list_profiles,
+    profile_summary,
+)
+from openclaw_molt_mcp.slow_calls import get_journal
+
+logger = logging.getLogger(__name__)
+
+
+@mcp.tool()
+async def clawd_admin(
+    ctx: Context,
+    operation: Literal[
+        "profiling_status",
+        "profiling_enable",
+        "profiling_disable",
+        "list_profiles",
+        "profile_summary",
+        "slow_calls",
+        "log_levels",
+        "set_log_level",
+        "reset_log_level",
+    ] = "profiling_status",
+    tools: list[str] | None = None,
+    sample_rate: float = 1.0,
+    name: str | None = None,
+    limit: int = 20,
+    sort: Literal["cumulative", "tottime"] = "cumulative",
+    logger_name: str | None = None,
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = None,
+    ttl_seconds: float | None = None,
+) -> dict[str, Any]:
+    """
+    Runtime diagnostics for this openclaw-molt-mcp server process.
+
+    **Operations:**
+    - `profiling_status`: Whether profiling is on, selected tools, sample rate, counters.
+    - `profiling_enable`: cProfile calls to `tools` (e.g. ["clawd_sessions"], ["*"] for all) at `sample_rate` (0-1).
+    - `profiling_disable`: Stop profiling; tool calls no longer pass through the profiler.
+    - `list_profiles`: Newest `limit` profiles (file, tool, operation, duration_ms).
+    - `profile_summary`: Top `limit` functions of profile `name` (file from list_profiles), by `sort`.
+    - `slow_calls`: Newest `limit` slow-call journal entries (calls over OPENCLAW_SLOW_CALL_MS, with timing breakdown).
+    - `log_levels`: Active runtime log level overrides and when they revert.
+    - `set_log_level`: Set `logger_name` (e.g. openclaw_molt_mcp.gateway_client, or root) to `level` for
+      `ttl_seconds` (default OPENCLAW_LOG_LEVEL_TTL_SECONDS); reverts by itself, no restart needed.
+    - `reset_log_level`: Revert `logger_name` now (all overrides if omitted).
+
+    Profiles are written to OPENCLAW_PROFILE_DIR (default <log_dir>/profiles) as .prof files
+    readable with pstats or snakeviz.
+
+    **Dialogic returns**: Natural language message plus structured data.
+    """
+    settings = Settings()
+    profiler = get_profiler(settings)
+    try:
+        if operation == "profiling_status":
+            status = profiler.status()
+            state = f"on for {', '.join(status['tools'])}" if status["enabled"] else "off"
+            return {"success": True, "message": f"Profiling is {state}.", "data": status}
+
+        if operation == "profiling_enable":
+            if not tools:
+                return {"success": False, "message": "tools is required (tool names, or ['*'] for all)."}
+            enable_profiling(tools, sample_rate, settings)
+            logger.info(
+                "Profiling enabled for %s at %.2f",
+                ",".join(sorted(profiler.tools)),
+                profiler.sample_rate,
+                extra={"tool": "clawd_admin", "operation": operation},
+            )
+            return {
+                "success": True,
+                "message": f"Profiling {', '.join(sorted(profiler.tools))} ({profiler.sample_rate:.0%} of calls).",
+                "data": profiler.status(),
+            }
+
+        if operation == "profiling_disable":
+            disable_profiling()
+            logger.info("Profiling disabled", extra={"tool": "clawd_admin", "operation": operation})
+            return {"success": True, "message": "Profiling disabled.", "data": profiler.status()}
+
+        if operation == "list_profiles":
+            profiles = list_profiles(profiler.directory, limit)
+            return {
+                "success": True,
+                "message": f"{len(profiles)} profile(s) in {profiler.directory}.",
+                "data": {"profiles": profiles, "directory": str(profiler.directory)},
+            }
+
+        if operation == "profile_summary":
+            if not name:
+                return {"success": False, "message": "name is required (a file from list_profiles)."}
+            path = profiler.directory / Path(name).name
+            if path.suffix != ".prof" or not path.is_file():
+                return {"success": False, "message": f"Profile not found: {name}"}
+            rows = profile_summary(path, limit, sort)
+            return {
+                "success": True,
+                "message": f"Top {len(rows)} functions of {path.name} by {sort}.",
+                "data": {"file": path.name, "functions": rows},
+            }
+
+        if operation == "slow_calls":
+            journal = get_journal()
+            if journal is None:
+                return {"success": False, "message": "Slow-call journal is off (OPENCLAW_SLOW_CALL_MS=0)."}
+            entries = journal.recent(limit)
+            return {
+                "success": True,
+                "message": f"{len(entries)} call(s) over {journal.threshold_ms:.0f} ms.",
+                "data": {"entries": entries, "threshold_ms": journal.threshold_ms, "file": str(journal.path)},
+            }
+
+        if operation == "log_levels":
+            overrides = get_log_levels(settings)
+            overrides.sync()
+            active = overrides.status()
+            return {
+                "success": True,
+                "message": f"{len(active)} log level override(s)." if active else "No log level overrides.",
+                "data": {"overrides": active, "file": str(overrides.path)},
+            }
+
+        if operation == "set_log_level":
+            if not logger_name or not level:
+                return {"success": False, "message": "logger_name and level are required."}
+            overrides = get_log_levels(settings)
+            try:
+                entry = overrides.set(logger_name, level, ttl_seconds)
+            except ValueError as e:
+                return {"success": False, "message": str(e)}
+            until = time.strftime("%H:%M:%S", time.localtime(entry["expires_at"]))
+            return {
+                "success": True,
+                "message": f"{entry['logger']} logs at {entry['level']} until {until}, then reverts.",
+                "data": {"override": entry, "overrides": overrides.status()},
+            }
+
+        if operation == "reset_log_level":
+            overrides = get_log_levels(settings)
+            reverted = overrides.clear(logger_name)
+            return {
+                "success": True,
+                "message": f"Reverted {', '.join(reverted)}." if reverted else "Nothing to revert.",
+                "data": {"reverted": reverted, "overrides": overrides.status()},
+            }
+
+        return {"success": False, "message": f"Unknown operation: {operation}"}
+    except Exception as e:
+        logger.error(
+            "clawd_admin failed: %s",
+            e,
+            extra={"tool": "clawd_admin", "operation": operation, "error_type": type(e).__name__},
+            exc_info=True,
+        )
+        return {"success": False, "message": f"clawd_admin {operation} failed: {e!s}", "error": str(e)}
@@ -1,22 +1,102 @@
 """clawd_agent: Agent invocation and messaging (OpenClaw)."""
 
+import asyncio
+import contextlib
 import logging
-from typing import Literal
+from typing import Annotated, Any, Literal
 
 from fastmcp import Context
+from pydantic import Field
 
 from openclaw_molt_mcp.mcp_instance import mcp
 
-from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.agent_stream import stream_agent_turn
+from openclaw_molt_mcp.gateway_client import AGENT_TIMEOUT_GRACE, GatewayClient
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jobs import JobLimitError, get_job_registry
 
 logger = logging.getLogger(__name__)
 
+MAX_TIMEOUT_SECONDS = 3600
+MAX_JOB_WAIT_SECONDS = 300
+JOB_OPERATIONS = ("job_status", "job_result", "job_cancel")
+
+
+async def run_agent_turn(
+    settings: Settings,
+    message: str,
+    session_key: str = "main",
+    thinking: str | None = None,
+    timeout_seconds: int | None = None,
+) -> dict[str, Any]:
+    """One isolated agent turn on its own client (used for background jobs)."""
+    client = GatewayClient(settings)
+    deadline = timeout_seconds + AGENT_TIMEOUT_GRACE if timeout_seconds else None
+    try:
+        async with asyncio.timeout(deadline):
+            return await client.hooks_agent(
+                message=message,
+                session_key=session_key,
+                deliver=False,
+                thinking=thinking,
+                timeout_seconds=timeout_seconds,
+            )
+    except TimeoutError:
+        return {
+            "success": False,
+            "message": f"Agent operation did not finish within {timeout_seconds}s.",
+            "error": "timeout",
+        }
+    finally:
+        await client.close()
+
+
+async def _streamed_turn(ctx: Context, client: GatewayClient, settings: Settings, **turn: Any) -> dict[str, Any]:
+    """Run hooks_agent while relaying partial output as MCP progress notifications."""
+    updates = 0
+    first_update_ms: float | None = None
+    async with contextlib.aclosing(
+        stream_agent_turn(client, poll_interval=settings.agent_stream_poll_interval, **turn)
+    ) as events:
+        async for event in events:
+            if event["type"] == "partial":
+                updates += 1
+                if first_update_ms is None:
+                    first_update_ms = event["elapsed_ms"]
+                await ctx.report_progress(progress=updates, message=event["delta"])
+                continue
+            result = dict(event["result"])
+            result["stream"] = {
+                "text": event["text"],
+                "updates": updates,
+                "first_update_ms": first_update_ms,
+                "elapsed_ms": event["elapsed_ms"],
+            }
+            return result
+    return {"success": False, "message": "Agent stream ended without a result."}
+
+
+async def _job_operation(operation: str, job_id: str | None, wait_seconds: float) -> dict[str, Any]:
+    """job_status / job_result / job_cancel against the process job registry."""
+    if not job_id:
+        return {"success": False, "message": f"job_id required for {operation}"}
+    registry = get_job_registry()
+    if operation == "job_cancel":
+        job = await registry.cancel(job_id)
+    elif operation == "job_result":
+        job = await registry.wait(job_id, max(0.0, min(wait_seconds, MAX_JOB_WAIT_SECONDS)))
+    else:
+        job = registry.get(job_id)
+    if job is None:
+        return {"success": False, "message": f"Unknown or expired job: {job_id}"}
+    data = job.to_dict(include_result=operation == "job_result")
+    return {"success": True, "message": f"Job {job_id} is {job.status}.", "data": data}
+
 
 @mcp.tool()
 async def clawd_agent(
     ctx: Context,
-    operation: Literal["send_message", "run_agent", "wake"],
+    operation: Literal["send_message", "run_agent", "wake", "job_status", "job_result", "job_cancel"],
     message: str = "",
     session_key: str = "main",
     channel: Literal["last", "whatsapp", "telegram", "discord", "slack"] | None = None,
@@ -24,6 +104,10 @@ async def clawd_agent(
     deliver: bool = False,
     thinking: Literal["off", "minimal", "low", "medium", "high", "xhigh"] | None = None,
     timeout_seconds: int | None = None,
+    run_async: Annotated[bool, Field(alias="async")] = False,
+    job_id: str | None = None,
+    wait_seconds: float = 0,
+    stream: bool = False,
 ) -> dict:
     """
     Invoke OpenClaw agent operations.
@@ -32,45 +116,137 @@ async def clawd_agent(
     - `send_message`: Send message to agent; optionally deliver response to channel.
     - `run_agent`: Run isolated agent turn; return response to MCP (no channel delivery).
     - `wake`: Trigger heartbeat / wake main session with system event.
+    - `job_status`: State of a background job (`job_id`).
+    - `job_result`: Job state plus result; waits up to `wait_seconds` (max 300) for it to finish.
+    - `job_cancel`: Cancel a queued or running job and abort its Gateway request.
+
+    **Background runs:** `run_agent` with `async=true` returns a `job_id` immediately instead of
+    blocking until the turn completes. Jobs run with a concurrency cap
+    (OPENCLAW_JOBS_MAX_CONCURRENT, default 8; extra jobs queue) and finished jobs are kept for
+    OPENCLAW_JOBS_TTL_SECONDS (default 3600).
+
+    **Streaming:** `send_message` / `run_agent` with `stream=true` poll the session's
+    `sessions_history` while the turn runs and send the new assistant text as MCP progress
+    notifications (`message` = text delta), so clients can render output before the turn ends.
+    The result gains `stream` with the full streamed text, update count and time to first update.
+    Poll interval: OPENCLAW_AGENT_STREAM_POLL_INTERVAL (default 0.5s).
+
+    **Deadlines:** `thinking` and `timeout_seconds` are forwarded to `/hooks/agent`
+    (`thinking`, `timeoutSeconds`). With `timeout_seconds` the whole call, retries included, is
+    bounded to that many seconds plus a short grace period. If the MCP client cancels the call,
+    the in-flight Gateway request is aborted rather than left running.
 
     **Dialogic returns**: Natural language message plus structured data.
 
     Requires OpenClaw Gateway running at OPENCLAW_GATEWAY_URL with OPENCLAW_GATEWAY_TOKEN
     when gateway auth is enabled. Webhooks require hooks.enabled and hooks.token in config.
     """
+    if timeout_seconds is not None and not 0 < timeout_seconds <= MAX_TIMEOUT_SECONDS:
+        return {"success": False, "message": f"timeout_seconds must be between 1 and {MAX_TIMEOUT_SECONDS}."}
+    if operation in JOB_OPERATIONS:
+        return await _job_operation(operation, job_id, wait_seconds)
+
     settings = Settings()
+    if operation == "run_agent" and run_async:
+        registry = get_job_registry(settings)
+        text = message or "Isolated run triggered via openclaw-molt-mcp"
+        try:
+            job = registry.submit(
+                "run_agent",
+                lambda: run_agent_turn(settings, text, session_key, thinking, timeout_seconds),
+                meta={"session_key": session_key, "thinking": thinking, "timeout_seconds": timeout_seconds},
+            )
+        except JobLimitError as e:
+            return {"success": False, "message": str(e), "error": "job_limit"}
+        await ctx.info(f"Agent turn queued as job {job.id}")
+        return {
+            "success": True,
+            "message": f"Agent turn started as job {job.id}. Poll with job_status or job_result.",
+            "data": job.to_dict(),
+        }
+
     client = GatewayClient(settings)
+    deadline = timeout_seconds + AGENT_TIMEOUT_GRACE if timeout_seconds else None
 
     try:
-        if operation == "wake":
-            text = message or "Wake triggered via openclaw-molt-mcp"
-            result = await client.hooks_wake(text=text, mode="now")
-            return result
+        async with asyncio.timeout(deadline):
+            if operation == "wake":
+                text = message or "Wake triggered via openclaw-molt-mcp"
+                result = await client.hooks_wake(text=text, mode="now")
+                return result
 
-        if operation == "run_agent":
-            ctx.info("Running isolated agent turn (deliver=False)")
-            result = await client.hooks_agent(
-                message=message or "Isolated run triggered via openclaw-molt-mcp",
-                session_key=session_key,
-                deliver=False,
-            )
-            return result
+            if operation == "run_agent" and stream:
+                await ctx.info("Running isolated agent turn (deliver=False, streaming)")
+                return await _streamed_turn(
+                    ctx,
+                    client,
+                    settings,
+                    message=message or "Isolated run triggered via openclaw-molt-mcp",
+                    session_key=session_key,
+                    thinking=thinking,
+                    timeout_seconds=timeout_seconds,
+                )
 
-        if operation == "send_message":
-            ctx.info("Sending message to agent")
-            result = await client.hooks_agent(
-                message=message,
-                session_key=session_key,
-                deliver=deliver,
-                channel=channel,
-                to=to,
-            )
-            return result
+            if operation == "run_agent":
+                await ctx.info("Running isolated agent turn (deliver=False)")
+                result = await client.hooks_agent(
+                    message=message or "Isolated run triggered via openclaw-molt-mcp",
+                    session_key=session_key,
+                    deliver=False,
+                    thinking=thinking,
+                    timeout_seconds=timeout_seconds,
+                )
+                return result
+
+            if operation == "send_message" and stream:
+                await ctx.info("Sending message to agent (streaming)")
+                return await _streamed_turn(
+                    ctx,
+                    client,
+                    settings,
+                    message=message,
+                    session_key=session_key,
+                    deliver=deliver,
+                    channel=channel,
+                    to=to,
+                    thinking=thinking,
+                    timeout_seconds=timeout_seconds,
+                )
+
+            if operation == "send_message":
+                await ctx.info("Sending message to agent")
+                result = await client.hooks_agent(
+                    message=message,
+                    session_key=session_key,
+                    deliver=deliver,
+                    channel=channel,
+                    to=to,
+                    thinking=thinking,
+                    timeout_seconds=timeout_seconds,
+                )
+                return result
 
         return {
             "success": False,
             "message": f"Unknown operation: {operation}",
         }
+    except TimeoutError:
+        logger.warning(
+            "clawd_agent exceeded timeout_seconds=%s",
+            timeout_seconds,
+            extra={"tool": "clawd_agent", "operation": operation, "error_type": "TimeoutError"},
+        )
+        return {
+            "success": False,
+            "message": f"Agent operation did not finish within {timeout_seconds}s.",
+            "error": "timeout",
+        }
+    except asyncio.CancelledError:
+        logger.info(
+            "clawd_agent cancelled by client; aborting Gateway request",
+            extra={"tool": "clawd_agent", "operation": operation},
+        )
+        raise
     except Exception as e:
         logger.error(
             "clawd_agent failed: %s",
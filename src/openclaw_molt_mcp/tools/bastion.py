@@ -280,12 +280,20 @@ async def _status_bastio(api_key: str) -> dict:
         }
 
     try:
-        import httpx
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                "https://api.bastio.com/v1/status",
-                headers={"Authorization": f"Bearer {api_key}"},
+        from openclaw_molt_mcp.adaptive_timeout import get_timeout_policy, timed_call
+        from openclaw_molt_mcp.tracing import TracingClient
+
+        async with TracingClient("bastio") as client:
+            resp = await timed_call(
+                get_timeout_policy(),
+                "bastio",
+                "status",
+                lambda t: client.get(
+                    "https://api.bastio.com/v1/status",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=t,
+                ),
+                ceiling=10.0,
             )
             ok = resp.status_code < 500
             return {
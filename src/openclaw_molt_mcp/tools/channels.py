@@ -1,32 +1,194 @@
 """clawd_channels: OpenClaw channel visibility and messaging (WhatsApp, Telegram, Discord, etc.)."""
 
 import logging
+import time
 from pathlib import Path
 from typing import Any, Literal
 
 from fastmcp import Context
 
+from openclaw_molt_mcp.concurrency import gather_bounded, summarize
 from openclaw_molt_mcp.config import Settings
 from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.inbox import (
+    InvalidCursorError,
+    after_cursor,
+    channel_messages,
+    channel_names,
+    decode_cursor,
+    merge_newest_first,
+    page_cursor,
+)
 from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.shaping import shape_result
 
 logger = logging.getLogger(__name__)
 
 # Gateway tool/action mapping. When OpenClaw exposes channels via Tools Invoke, these are used.
 CHANNELS_TOOL = "channels"
 CHANNEL_ACTIONS = ("list_channels", "get_channel_config", "send_message", "get_recent_messages")
+MAX_BROADCAST_TARGETS = 200
+# Gateway cap for get_recent_messages; also the deepest an inbox cursor can page into one channel.
+MAX_RECENT_MESSAGES = 100
+
+
+def normalize_targets(targets: list[dict[str, Any]] | None) -> list[dict[str, str]]:
+    """Strip and de-duplicate (channel, to) targets; entries without a channel are dropped."""
+    seen: dict[tuple[str, str], dict[str, str]] = {}
+    for target in targets or []:
+        channel = str(target.get("channel") or "").strip()
+        to = str(target.get("to") or "").strip()
+        if channel and (channel, to) not in seen:
+            seen[(channel, to)] = {"channel": channel, "to": to} if to else {"channel": channel}
+    return list(seen.values())
+
+
+async def broadcast(
+    client: GatewayClient,
+    targets: list[dict[str, Any]] | None,
+    message: str | None,
+    session_key: str = "main",
+    concurrency: int = 5,
+) -> dict[str, Any]:
+    """Send one message to many (channel, to) targets over a shared Gateway client.
+
+    Sends run with at most `concurrency` in flight; each target gets its own result and
+    `elapsed_ms`, and a failed target does not stop the others.
+    """
+    text = (message or "").strip()
+    if not text:
+        return {"success": False, "message": "broadcast requires 'message'."}
+    normalized = normalize_targets(targets)
+    if not normalized:
+        return {"success": False, "message": "broadcast requires 'targets' (list of {channel, to})."}
+    if len(normalized) > MAX_BROADCAST_TARGETS:
+        return {"success": False, "message": f"At most {MAX_BROADCAST_TARGETS} targets per broadcast."}
+
+    async def send(target: dict[str, str]) -> dict[str, Any]:
+        result = await client.tools_invoke(
+            tool=CHANNELS_TOOL,
+            action="send_message",
+            args={**target, "message": text},
+            session_key=session_key,
+        )
+        return {**target, **result}
+
+    started = time.perf_counter()
+    data = summarize(await gather_bounded(normalized, send, limit=concurrency), started)
+    return {
+        "success": data["failed"] == 0,
+        "message": f"Broadcast delivered to {data['succeeded']}/{len(normalized)} targets.",
+        "data": data,
+    }
+
+
+async def unified_inbox(
+    client: GatewayClient,
+    channels: list[str] | None = None,
+    limit: int = 20,
+    cursor: str | None = None,
+    session_key: str = "main",
+    concurrency: int = 8,
+) -> dict[str, Any]:
+    """Recent messages from many channels in one newest-first page.
+
+    Channels default to every channel from `list_channels`. Per-channel `get_recent_messages`
+    calls run concurrently and are merged by timestamp (k-way heap merge). `next_cursor`
+    continues the listing; pass it back with no other arguments changed.
+    """
+    limit = max(1, min(limit, MAX_RECENT_MESSAGES))
+    depth: dict[str, int] = {}
+    before: float | None = None
+    seen: set[str] = set()
+    if cursor:
+        try:
+            state = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            return {"success": False, "message": str(e), "error": "invalid_cursor"}
+        channels = list(state.get("channels") or [])
+        depth = {str(k): int(v) for k, v in (state.get("depth") or {}).items()}
+        before = float(state.get("before", 0))
+        seen = set(state.get("seen") or [])
+
+    names = list(dict.fromkeys(c.strip() for c in channels or [] if c and c.strip()))
+    if not names:
+        listed = await client.tools_invoke(tool=CHANNELS_TOOL, action="list_channels", session_key=session_key)
+        if not listed.get("success"):
+            return listed
+        names = channel_names(listed.get("data"))
+    if not names:
+        return {"success": True, "message": "No channels to read.", "data": {"messages": [], "next_cursor": None}}
+
+    # Depth already consumed plus one page: correct even if the Gateway has no "before" filter.
+    fetch = {c: min(MAX_RECENT_MESSAGES, depth.get(c, 0) + limit) for c in names}
+
+    async def recent(channel: str) -> dict[str, Any]:
+        return await client.tools_invoke(
+            tool=CHANNELS_TOOL,
+            action="get_recent_messages",
+            args={"channel": channel, "limit": fetch[channel]},
+            session_key=session_key,
+        )
+
+    started = time.perf_counter()
+    results = await gather_bounded(names, recent, limit=concurrency)
+    streams: list[list[dict[str, Any]]] = []
+    errors: dict[str, str] = {}
+    maybe_more = False
+    for channel, result in zip(names, results, strict=True):
+        if not result.get("success"):
+            errors[channel] = result.get("error") or result.get("message", "failed")
+            continue
+        messages = [{**m, "channel": channel} for m in channel_messages(result.get("data"))]
+        maybe_more = maybe_more or (len(messages) >= fetch[channel] and fetch[channel] < MAX_RECENT_MESSAGES)
+        streams.append(after_cursor(messages, before, seen) if before is not None else messages)
+    if errors and len(errors) == len(names):
+        return {
+            "success": False,
+            "message": f"Could not read any of {len(names)} channels.",
+            "error": "all_channels_failed",
+            "data": {"errors": errors},
+        }
+
+    merged = merge_newest_first(streams, limit + 1)
+    page = merged[:limit]
+    next_cursor = None
+    if page and (len(merged) > limit or maybe_more):
+        for m in page:
+            depth[m["channel"]] = depth.get(m["channel"], 0) + 1
+        next_cursor = page_cursor(page, names, depth, before, seen)
+    return {
+        "success": True,
+        "message": f"{len(page)} messages from {len(names) - len(errors)}/{len(names)} channels.",
+        "data": {
+            "messages": page,
+            "next_cursor": next_cursor,
+            "channels": names,
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
 
 
 @mcp.tool()
 async def clawd_channels(
     ctx: Context,
-    operation: Literal["list_channels", "get_channel_config", "send_message", "get_recent_messages"],
+    operation: Literal[
+        "list_channels", "get_channel_config", "send_message", "get_recent_messages", "broadcast", "unified_inbox"
+    ],
     channel: str | None = None,
     to: str | None = None,
     message: str | None = None,
     limit: int = 20,
     session_key: str = "main",
     args: dict[str, Any] | None = None,
+    targets: list[dict[str, str]] | None = None,
+    concurrency: int = 5,
+    channels: list[str] | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+    max_bytes: int | None = None,
+    page_size: int | None = None,
 ) -> dict[str, Any]:
     """
     OpenClaw channel operations: list channels, config, send message, get recent messages.
@@ -36,18 +198,43 @@ async def clawd_channels(
     - `get_channel_config`: Read channel-specific settings (allowFrom, routing rules).
     - `send_message`: Route a message to a channel (WhatsApp, Telegram, Discord, etc.).
     - `get_recent_messages`: Pull last N messages from a channel.
+    - `broadcast`: Send one `message` to many targets concurrently.
+    - `unified_inbox`: Recent messages across channels, merged newest first.
 
     **Args (by operation):**
     - list_channels: no extra args.
     - get_channel_config: `channel` (required).
     - send_message: `channel`, `to` (optional peer), `message` (required).
-    - get_recent_messages: `channel`, `limit` (default 20).
+    - get_recent_messages: `channel`, `limit` (default 20). Output shaping: `fields` (keep
+      only these message keys), `page_size` / `cursor` (page through the fetched messages;
+      see `page.next_cursor`), `max_bytes` (cap the response size; adds `truncated`).
+    - broadcast: `targets` (list of `{"channel": ..., "to": ...}`, `to` optional, max 200),
+      `message` (required), `concurrency` (default 5, max 32). Returns per-target results
+      with `elapsed_ms` plus succeeded/failed counts; duplicate targets are sent once.
+    - unified_inbox: `channels` (default: all from list_channels), `limit` (page size, default
+      20), `cursor` (`next_cursor` from the previous page), `concurrency`. Channels are read in
+      parallel and merged by timestamp; each message gains `channel`. Channels that fail are
+      listed in `errors` while the rest are still returned.
 
     **Dialogic returns**: Natural language message plus structured data.
 
     Requires OpenClaw Gateway with Tools Invoke API. If the Gateway does not yet expose
     the channels tool, the call returns a clear error.
     """
+    if operation == "broadcast":
+        client = GatewayClient(Settings())
+        try:
+            return await broadcast(client, targets, message, session_key, concurrency)
+        finally:
+            await client.close()
+
+    if operation == "unified_inbox":
+        client = GatewayClient(Settings())
+        try:
+            return await unified_inbox(client, channels, limit, cursor, session_key, concurrency)
+        finally:
+            await client.close()
+
     if operation not in CHANNEL_ACTIONS:
         return {
             "success": False,
@@ -80,6 +267,8 @@ async def clawd_channels(
             args=invoke_args,
             session_key=session_key,
         )
+        if operation == "get_recent_messages":
+            return shape_result(result, fields, max_bytes, page_size, cursor)
         return result
     except Exception as e:
         logger.error(
@@ -9,7 +9,10 @@ from fastmcp import Context
 from openclaw_molt_mcp.mcp_instance import mcp
 
 from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.adaptive_timeout import get_timeout_policy
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.resilience import breaker_states
+from openclaw_molt_mcp.tracing import span, subprocess_env
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +27,7 @@ async def clawd_gateway(
 
     **Operations:**
     - `status`: Gateway status, bind, auth mode (via CLI).
-    - `health`: Health check (via CLI).
+    - `health`: Health check (via CLI). Includes circuit breaker state and adaptive timeouts per upstream.
     - `doctor`: Run doctor for migrations/config validation (via CLI).
 
     **Dialogic returns**: Natural language message plus structured data.
@@ -56,20 +59,24 @@ async def clawd_gateway(
         if operation == "health":
             # Tools Invoke as health probe
             result = await client.tools_invoke(tool="sessions_list", args={})
+            data = {"breakers": breaker_states(), "timeouts": get_timeout_policy(settings).snapshot()}
             if result.get("success"):
-                return {"success": True, "message": "Gateway healthy."}
-            return {"success": False, "message": result.get("message", "Health check failed")}
+                return {"success": True, "message": "Gateway healthy.", "data": data}
+            return {"success": False, "message": result.get("message", "Health check failed"), "data": data}
 
         if operation == "doctor":
             # Run openclaw doctor via subprocess
             try:
-                proc = await asyncio.create_subprocess_exec(
-                    settings.openclaw_path,
-                    "doctor",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, stderr = await proc.communicate()
+                with span("subprocess openclaw doctor", kind="client", command="doctor") as sp:
+                    proc = await asyncio.create_subprocess_exec(
+                        settings.openclaw_path,
+                        "doctor",
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        env=subprocess_env(),
+                    )
+                    stdout, stderr = await proc.communicate()
+                    sp.set("exit_code", proc.returncode)
                 out = stdout.decode() if stdout else ""
                 err = stderr.decode() if stderr else ""
                 if proc.returncode == 0:
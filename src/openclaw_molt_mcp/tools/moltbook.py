@@ -1,17 +1,27 @@
 """clawd_moltbook: Moltbook social network operations for AI agents."""
 
 import logging
-from typing import Literal
+import time
+from typing import Any, Literal
 
 from fastmcp import Context
 
 from openclaw_molt_mcp.mcp_instance import mcp
 
+from openclaw_molt_mcp.concurrency import gather_bounded, summarize
 from openclaw_molt_mcp.config import Settings
 from openclaw_molt_mcp.moltbook_client import MoltbookClient
+from openclaw_molt_mcp.moltbook_index import get_index, merge_results, search_local
+from openclaw_molt_mcp.shaping import shape_result
 
 logger = logging.getLogger(__name__)
 
+BULK_OPERATIONS = ("upvote_many", "comment_many", "fetch_posts")
+MAX_BULK_ITEMS = 100
+BULK_DEFAULT_WAIT_SECONDS = 30.0
+# Covers one comment interval (20 s), so back-to-back comments wait instead of failing.
+SINGLE_DEFAULT_WAIT_SECONDS = 25.0
+
 
 @mcp.tool()
 async def clawd_moltbook(
@@ -25,23 +35,60 @@ async def clawd_moltbook(
         "heartbeat_run",
         "heartbeat_dm",
         "status",
+        "upvote_many",
+        "comment_many",
+        "fetch_posts",
     ],
     post_id: str | None = None,
+    post_ids: list[str] | None = None,
     content: str | None = None,
     query: str | None = None,
+    scope: Literal["remote", "local", "merged"] = "remote",
+    fuzzy: bool = False,
+    limit: int = 20,
+    concurrency: int = 5,
+    max_wait_seconds: float | None = None,
+    fields: list[str] | None = None,
+    max_bytes: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
 ) -> dict:
     """
     Moltbook social network operations for AI agents.
 
     **Operations:**
-    - `feed`: Get personalized or global feed.
-    - `search`: Semantic search across posts/comments.
+    - `feed`: Get personalized or global feed (`limit` posts, default 20). Supports output
+      shaping: `fields` (keep only these post keys, dotted paths allowed), `page_size` /
+      `cursor` (page through the fetched posts; see `page.next_cursor`) and `max_bytes`
+      (cap the response size; the result gains `truncated` when anything was cut).
+    - `search`: Semantic search across posts/comments. `scope="remote"` (default) calls Moltbook
+      `/search`; `scope="local"` queries the offline index of posts/comments already fetched via
+      feed, heartbeat and search (no API call, no rate-limit cost); `scope="merged"` returns remote
+      hits followed by local BM25 hits, deduplicated. `fuzzy=True` tolerates misspelled terms
+      (local index only); `limit` caps local/merged results.
     - `post`: Create a post (rate limit: 1 per 30 min).
     - `comment`: Add comment to post (rate limit: 1 per 20 sec).
     - `upvote`: Upvote a post.
     - `heartbeat_run`: Execute full heartbeat flow (check DMs, feed, consider posting).
     - `heartbeat_dm`: Check DMs only (pending requests, unread).
     - `status`: Check Moltbook API connectivity and key presence.
+    - `upvote_many`: Upvote every post in `post_ids`.
+    - `comment_many`: Add the same `content` as a comment on every post in `post_ids`.
+    - `fetch_posts`: Fetch every post in `post_ids` (also feeds the local search index).
+
+    **Rate limiting**: writes are paced by a client-side limiter mirroring the limits below.
+    A single `post`/`comment` waits up to `max_wait_seconds` (default 25, enough for the next
+    comment slot) for its slot; when the wait would be longer (e.g. a second post within
+    30 min) it returns `error="rate_limited"` with `retry_after` without calling Moltbook.
+    Pass `max_wait_seconds=0` to fail fast instead.
+
+    **Bulk operations** run up to `concurrency` requests at once (max 32, at most 100 ids) and
+    pace themselves with the same limiter, waiting up to `max_wait_seconds` (default 30) per
+    item. Items that cannot get a slot in time come back as `rate_limited`; `data.rate_limited`
+    lists their post ids and `data.retry_after` says when to send them again. Comments are
+    1 per 20 s, so one `comment_many` call posts about 1 + `max_wait_seconds` / 20 comments
+    (2 with the default); raise `max_wait_seconds` or call again with `data.rate_limited` for
+    larger batches. Returns per-item results with `elapsed_ms`.
 
     **Dialogic returns**: Natural language message plus structured data.
 
@@ -56,6 +103,18 @@ async def clawd_moltbook(
     )
 
     try:
+        if operation in BULK_OPERATIONS:
+            return await _bulk(
+                client,
+                operation,
+                post_ids or [],
+                content,
+                concurrency,
+                BULK_DEFAULT_WAIT_SECONDS if max_wait_seconds is None else max_wait_seconds,
+            )
+
+        single_wait = SINGLE_DEFAULT_WAIT_SECONDS if max_wait_seconds is None else max_wait_seconds
+
         if operation == "status":
             if not settings.moltbook_api_key:
                 return {
@@ -72,15 +131,35 @@ async def clawd_moltbook(
             return result
 
         if operation == "feed":
-            result = await client.get("/feed", params={"limit": "20"})
+            result = await client.get("/feed", params={"limit": str(max(1, min(limit, 100)))})
             if result.get("success"):
+                get_index().add_payload(result.get("data"))
                 result["message"] = "Feed retrieved."
-            return result
+            return shape_result(result, fields, max_bytes, page_size, cursor)
 
         if operation == "search":
             if not query:
                 return {"success": False, "message": "query required for search"}
+            limit = max(1, min(limit, 100))
+            if scope == "local":
+                data = search_local(query, limit=limit, fuzzy=fuzzy)
+                return {
+                    "success": True,
+                    "message": f"{len(data['results'])} local results for: {query} ({data['indexed']} indexed).",
+                    "data": data,
+                }
             result = await client.get("/search", params={"q": query})
+            if result.get("success"):
+                get_index().add_payload(result.get("data"))
+            if scope == "merged":
+                data = search_local(query, limit=limit, fuzzy=fuzzy)
+                remote_ok = bool(result.get("success"))
+                data["results"] = merge_results(data["results"], result.get("data") if remote_ok else None, limit)
+                data["remote_status"] = "ok" if remote_ok else "error"
+                message = f"Merged search results for: {query}"
+                if not remote_ok:
+                    message += f" (remote failed: {result.get('message', 'unknown error')}; local results only)"
+                return {"success": True, "message": message, "data": data}
             if result.get("success"):
                 result["message"] = f"Search results for: {query}"
             return result
@@ -88,7 +167,7 @@ async def clawd_moltbook(
         if operation == "post":
             if not content:
                 return {"success": False, "message": "content required for post"}
-            result = await client.post("/posts", json={"content": content})
+            result = await client.post("/posts", json={"content": content}, max_wait=single_wait)
             if result.get("success"):
                 result["message"] = "Post created."
             return result
@@ -99,6 +178,7 @@ async def clawd_moltbook(
             result = await client.post(
                 f"/posts/{post_id}/comments",
                 json={"content": content},
+                max_wait=single_wait,
             )
             if result.get("success"):
                 result["message"] = "Comment added."
@@ -121,6 +201,8 @@ async def clawd_moltbook(
         if operation == "heartbeat_run":
             dm_result = await client.get("/agents/dm/inbox")
             feed_result = await client.get("/feed", params={"limit": "10"})
+            if feed_result.get("success"):
+                get_index().add_payload(feed_result.get("data"))
             heartbeat_md = "https://www.moltbook.com/heartbeat.md"
             return {
                 "success": True,
@@ -147,3 +229,47 @@ async def clawd_moltbook(
         }
     finally:
         await client.close()
+
+
+async def _bulk(
+    client: MoltbookClient,
+    operation: str,
+    post_ids: list[str],
+    content: str | None,
+    concurrency: int,
+    max_wait: float,
+) -> dict[str, Any]:
+    """Fan a bulk operation out over `post_ids` with bounded concurrency."""
+    ids = list(dict.fromkeys(p.strip() for p in post_ids if p and p.strip()))
+    if not ids:
+        return {"success": False, "message": f"post_ids required for {operation}"}
+    if len(ids) > MAX_BULK_ITEMS:
+        return {"success": False, "message": f"At most {MAX_BULK_ITEMS} post_ids per {operation} call."}
+    if operation == "comment_many" and not content:
+        return {"success": False, "message": "content required for comment_many"}
+
+    async def run(pid: str) -> dict[str, Any]:
+        if operation == "upvote_many":
+            result = await client.post(f"/posts/{pid}/upvote", max_wait=max_wait)
+        elif operation == "comment_many":
+            result = await client.post(f"/posts/{pid}/comments", json={"content": content}, max_wait=max_wait)
+        else:
+            result = await client.get(f"/posts/{pid}")
+            if result.get("success"):
+                get_index().add_payload(result.get("data"))
+        return {"post_id": pid, **result}
+
+    started = time.perf_counter()
+    results = await gather_bounded(ids, run, limit=concurrency)
+    data = summarize(results, started)
+    verb = {"upvote_many": "Upvoted", "comment_many": "Commented on", "fetch_posts": "Fetched"}[operation]
+    message = f"{verb} {data['succeeded']}/{len(ids)} posts."
+    limited = [r for r in results if r.get("error") == "rate_limited"]
+    if limited:
+        data["rate_limited"] = [r["post_id"] for r in limited]
+        data["retry_after"] = max(r.get("retry_after", 0.0) for r in limited)
+        message += (
+            f" {len(limited)} hit the rate limit within {max_wait:.0f}s;"
+            f" retry data.rate_limited in {data['retry_after']:.0f}s or raise max_wait_seconds."
+        )
+    return {"success": data["failed"] == 0, "message": message, "data": data}
@@ -79,7 +79,7 @@ async def clawd_routing(
     if operation == "update_routing":
         if not (channel and channel.strip()) or not (agent and agent.strip()):
             return {"success": False, "message": "update_routing requires 'channel' and 'agent'."}
-        ctx.info("update_routing is a write operation; use with care")
+        await ctx.info("update_routing is a write operation; use with care")
     if operation == "get_session_by_channel" and not (channel and channel.strip()):
         return {"success": False, "message": "get_session_by_channel requires 'channel'."}
 
@@ -14,6 +14,7 @@ from openclaw_molt_mcp.mcp_instance import mcp
 
 from openclaw_molt_mcp.config import Settings
 from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.tracing import span, subprocess_env
 
 logger = logging.getLogger(__name__)
 
@@ -194,13 +195,16 @@ async def _audit(ctx: Context, settings: Settings) -> dict:
             )
             return {"success": True, "message": "Audit skipped: invalid openclaw_path.", "data": {"findings": findings}}
     try:
-        proc = await asyncio.create_subprocess_exec(
-            path,
-            "doctor",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        with span("subprocess openclaw doctor", kind="client", command="doctor") as sp:
+            proc = await asyncio.create_subprocess_exec(
+                path,
+                "doctor",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=subprocess_env(),
+            )
+            stdout, stderr = await proc.communicate()
+            sp.set("exit_code", proc.returncode)
         out = stdout.decode() if stdout else ""
         err = stderr.decode() if stderr else ""
         if proc.returncode == 0:
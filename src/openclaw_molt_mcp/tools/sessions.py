@@ -1,24 +1,91 @@
 """clawd_sessions: Session discovery and agent-to-agent coordination."""
 
+import asyncio
 import logging
+import time
 from typing import Any, Literal
 
 from fastmcp import Context
 
 from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.shaping import shape_result
 
+from openclaw_molt_mcp.concurrency import gather_bounded
 from openclaw_molt_mcp.gateway_client import GatewayClient
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.transcript_archive import get_archive
+from openclaw_molt_mcp.transcript_store import get_transcript_store, incremental_history, sync_session
 
 logger = logging.getLogger(__name__)
 
+MAX_SESSION_KEYS = 100
+
+
+async def _many(
+    client: GatewayClient,
+    settings: Settings,
+    operation: str,
+    session_keys: list[str] | None,
+    session_key: str,
+    args: dict[str, Any] | None,
+    incremental: bool,
+    since: int,
+    limit: int,
+    offset: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """history_many / send_many: fan out over session keys on one client with bounded concurrency."""
+    keys = list(dict.fromkeys(k.strip() for k in session_keys or [] if k and k.strip()))
+    if not keys:
+        return {"success": False, "message": f"session_keys required for {operation}"}
+    if len(keys) > MAX_SESSION_KEYS:
+        return {"success": False, "message": f"At most {MAX_SESSION_KEYS} session_keys per {operation} call."}
+
+    async def run(key: str) -> dict[str, Any]:
+        if operation == "send_many":
+            # The target session goes in the sessions_send args; the call runs as `session_key`.
+            return await client.tools_invoke(
+                tool="sessions_send", action="json", args={**(args or {}), "sessionKey": key}, session_key=session_key
+            )
+        if incremental:
+            return await incremental_history(client, get_transcript_store(settings), key, args, since, limit, offset)
+        return await client.tools_invoke(tool="sessions_history", action="json", args=args or {}, session_key=key)
+
+    started = time.perf_counter()
+    outcomes = await gather_bounded(keys, run, limit=concurrency)
+    results: list[dict[str, Any]] = []
+    failures: list[dict[str, Any]] = []
+    for key, outcome in zip(keys, outcomes, strict=True):
+        (results if outcome.get("success") else failures).append({"session_key": key, **outcome})
+    verb = "Sent to" if operation == "send_many" else "Fetched history for"
+    return {
+        "success": not failures,
+        "message": f"{verb} {len(results)}/{len(keys)} sessions.",
+        "data": {
+            "results": results,
+            "failures": failures,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
+
 
 @mcp.tool()
 async def clawd_sessions(
     ctx: Context,
-    operation: Literal["list", "history", "send"],
+    operation: Literal["list", "history", "send", "archive", "archive_history", "history_many", "send_many"],
     session_key: str = "main",
     args: dict[str, Any] | None = None,
+    incremental: bool = False,
+    since: int = 0,
+    limit: int = 50,
+    offset: int = 0,
+    session_keys: list[str] | None = None,
+    concurrency: int = 5,
+    fields: list[str] | None = None,
+    max_bytes: int | None = None,
+    page_size: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
 ) -> dict:
     """
     OpenClaw session operations (agent-to-agent coordination).
@@ -27,6 +94,34 @@ async def clawd_sessions(
     - `list`: List active sessions (agents) and metadata via sessions_list tool.
     - `history`: Fetch transcript for a session via sessions_history tool.
     - `send`: Message another session via sessions_send tool (agent-to-agent).
+    - `archive`: Sync the session into the local store, then write messages not archived yet
+      as a compressed NDJSON segment (zstd if `zstandard` is installed, else gzip).
+    - `archive_history`: Read archived messages with `seq` > `since` (up to `limit`), only
+      decompressing the blocks that hold them.
+    - `history_many`: `history` for every key in `session_keys` (honors `incremental`, `since`,
+      `limit`, `offset`, `args`).
+    - `send_many`: `sessions_send` to every key in `session_keys` with the same `args`
+      (e.g. `{"message": "..."}`); the target key is set as `args.sessionKey`.
+
+    **Output shaping (`history`):** `fields` keeps only these message keys (dotted paths
+    allowed), `page_size` / `cursor` page through the returned messages (`page.next_cursor`),
+    and `max_bytes` caps the response size, deferring trailing messages to the next page and
+    cutting oversized strings; the result then gains `truncated`.
+
+    **Multi-session operations** run at most `concurrency` calls at once (default 5, max 32; at
+    most 100 keys) over one Gateway client. `data.results` holds successes and `data.failures`
+    failures, each in input order and tagged with `session_key` and `elapsed_ms`.
+
+    **Incremental history:** `history` with `incremental=true` syncs the session into the local
+    transcript store (SQLite under OPENCLAW_DATA_DIR), fetching only messages newer than the
+    last stored one, then pages from the store: `since` (return messages with `seq` greater
+    than this, default 0), `limit` (default 50, max 500), `offset`. Each message gains `seq`;
+    `data.cursor` is the latest `seq`, pass it as `since` next time to get only new messages.
+
+    **Streaming (`list`, `history`):** `stream=true` parses the Gateway response incrementally
+    and stops after `limit` sessions/messages, closing the connection instead of downloading
+    and decoding the rest; `stream` in the result reports `items`, `stopped_early` and
+    `bytes_read`. Use it for busy Gateways whose responses run to tens of MB.
 
     **Dialogic returns**: Natural language message plus structured data.
 
@@ -34,19 +129,81 @@ async def clawd_sessions(
     """
     settings = Settings()
     client = GatewayClient(settings)
-    tool_map = {"list": "sessions_list", "history": "sessions_history", "send": "sessions_send"}
+    tool_map = {
+        "list": "sessions_list",
+        "history": "sessions_history",
+        "send": "sessions_send",
+        "archive": "sessions_history",
+        "archive_history": "sessions_history",
+        "history_many": "sessions_history",
+        "send_many": "sessions_send",
+    }
     tool_name = tool_map.get(operation)
 
     if not tool_name:
         return {"success": False, "message": f"Unknown operation: {operation}"}
 
     try:
-        result = await client.tools_invoke(
-            tool=tool_name,
-            action="json",
-            args=args or {},
-            session_key=session_key,
-        )
+        if operation in ("history_many", "send_many"):
+            return await _many(
+                client,
+                settings,
+                operation,
+                session_keys,
+                session_key,
+                args,
+                incremental,
+                since,
+                limit,
+                offset,
+                concurrency,
+            )
+
+        if operation == "archive":
+            store = get_transcript_store(settings)
+            synced = await sync_session(client, store, session_key, args)
+            if not synced.get("success"):
+                return synced
+            data = await asyncio.to_thread(get_archive(settings).export_from_store, store, session_key)
+            return {
+                "success": True,
+                "message": f"Archived {data['messages']} messages (through seq {data['archived_through']}).",
+                "data": data,
+            }
+
+        if operation == "archive_history":
+            data = await asyncio.to_thread(get_archive(settings).read, session_key, since, max(1, min(limit, 500)))
+            return {
+                "success": True,
+                "message": (
+                    f"{len(data['messages'])} archived messages (archived through seq {data['archived_through']})."
+                ),
+                "data": data,
+            }
+
+        if operation == "history" and incremental:
+            result = await incremental_history(
+                client, get_transcript_store(settings), session_key, args, since, limit, offset
+            )
+            return shape_result(result, fields, max_bytes, page_size, cursor)
+
+        if stream and operation in ("list", "history"):
+            result = await client.tools_invoke_items(
+                tool=tool_name,
+                action="json",
+                args=args or {},
+                session_key=session_key,
+                limit=max(1, limit),
+            )
+        else:
+            result = await client.tools_invoke(
+                tool=tool_name,
+                action="json",
+                args=args or {},
+                session_key=session_key,
+            )
+        if operation == "history":
+            return shape_result(result, fields, max_bytes, page_size, cursor)
         return result
     except Exception as e:
         logger.error(
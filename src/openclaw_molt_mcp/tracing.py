@@ -0,0 +1,333 @@
+"""Request-scoped trace/span ids carried in a contextvar, with optional OTLP-JSON export.
+
+`TracingMiddleware` opens a root span per MCP tool call; code below it opens child spans with
+`span(name)`. Ids follow W3C Trace Context and reach:
+
+- log lines: `logging_config` adds `trace_id` / `span_id` of the current span;
+- outbound HTTP: `TracingClient` (Gateway, Moltbook, Ollama and Bastio clients) makes one
+  client span per attempt, so retries show up individually, and sends `traceparent`;
+- subprocesses: `subprocess_env()` passes `TRACEPARENT` to child processes (`openclaw doctor`).
+
+With OPENCLAW_TRACE_EXPORT=1 every finished trace is appended to OPENCLAW_TRACE_EXPORT_PATH
+(default `<log_dir>/traces.otlp.jsonl`) as one OTLP/JSON `ExportTraceServiceRequest` per line,
+which the OpenTelemetry collector's `otlpjsonfile` receiver (or any OTLP/JSON reader) accepts.
+Exporter and slow-call journal are span processors (`TraceCollector`s, see
+`add_span_processor`); without any, spans only cost two random ids and a contextvar set/reset.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from pathlib import Path
+from typing import Any
+
+import httpx
+import mcp.types as mt
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from structlog.contextvars import bound_contextvars
+
+from openclaw_molt_mcp import __version__
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumpb
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "openclaw-molt-mcp"
+# OTLP SpanKind / StatusCode values
+KINDS = {"internal": 1, "server": 2, "client": 3}
+STATUS_OK, STATUS_ERROR = 1, 2
+# Traces whose root span has not finished yet, kept for export (oldest dropped beyond this).
+MAX_PENDING_TRACES = 1000
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    """One timed operation; `parent_id` is None for the root of a trace."""
+
+    __slots__ = (
+        "attributes",
+        "end_ns",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "payload",
+        "span_id",
+        "start_ns",
+        "status",
+        "trace_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = "internal",
+        parent: "Span | None" = None,
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        self.trace_id: str = parent.trace_id if parent else _new_id(128)
+        self.span_id: str = _new_id(64)
+        self.parent_id: str | None = parent.span_id if parent else None
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.status = STATUS_OK
+        self.error: str | None = None
+        # Raw inputs/outputs for span processors (tool args, result); never exported.
+        self.payload: dict[str, Any] | None = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def fail(self, error: str) -> None:
+        self.status = STATUS_ERROR
+        self.error = error
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+_current: ContextVar[Span | None] = ContextVar("openclaw_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def current_ids() -> tuple[str, str] | None:
+    """(trace_id, span_id) of the active span, if any."""
+    s = _current.get()
+    return (s.trace_id, s.span_id) if s else None
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Span]:
+    """Child of the current span (or a new trace) for the duration of the block."""
+    s = Span(name, kind, _current.get(), attributes)
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.fail(type(e).__name__)
+        raise
+    finally:
+        s.end_ns = time.time_ns()
+        _current.reset(token)
+        for processor in _processors:
+            processor.finish(s)
+
+
+def detached_context() -> Context:
+    """Copy of the current context without the active span, for tasks that outlive it (background
+    jobs): their spans start a trace of their own instead of joining one whose root already ended."""
+    ctx = copy_context()
+    ctx.run(_current.set, None)
+    return ctx
+
+
+def subprocess_env() -> dict[str, str] | None:
+    """Environment for a child process carrying TRACEPARENT (None = inherit unchanged)."""
+    s = _current.get()
+    if s is None:
+        return None
+    return {**os.environ, "TRACEPARENT": s.traceparent}
+
+
+def _attr_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_span(s: Span) -> dict[str, Any]:
+    """OTLP/JSON representation of a finished span."""
+    out: dict[str, Any] = {
+        "traceId": s.trace_id,
+        "spanId": s.span_id,
+        "name": s.name,
+        "kind": KINDS.get(s.kind, 1),
+        "startTimeUnixNano": str(s.start_ns),
+        "endTimeUnixNano": str(s.end_ns),
+        "attributes": [{"key": k, "value": _attr_value(v)} for k, v in s.attributes.items() if v is not None],
+        "status": {"code": s.status, **({"message": s.error} if s.error else {})},
+    }
+    if s.parent_id:
+        out["parentSpanId"] = s.parent_id
+    return out
+
+
+def otlp_request(spans: list[Span]) -> dict[str, Any]:
+    """ExportTraceServiceRequest (OTLP/JSON) for `spans`."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "openclaw_molt_mcp", "version": __version__},
+                        "spans": [otlp_span(s) for s in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class TraceCollector(ABC):
+    """Span processor that groups finished spans by trace and passes each trace to `on_trace`
+    when its root span ends (the root is the last span of the list)."""
+
+    def __init__(self) -> None:
+        self._pending: OrderedDict[str, list[Span]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def finish(self, s: Span) -> None:
+        with self._lock:
+            spans = self._pending.setdefault(s.trace_id, [])
+            spans.append(s)
+            if s.parent_id is not None:
+                while len(self._pending) > MAX_PENDING_TRACES:
+                    self._pending.popitem(last=False)
+                return
+            del self._pending[s.trace_id]
+        self.on_trace(spans)
+
+    @abstractmethod
+    def on_trace(self, spans: list[Span]) -> None: ...
+
+
+class OTLPFileExporter(TraceCollector):
+    """Appends each finished trace to a file as one OTLP/JSON line."""
+
+    def __init__(self, path: Path | str) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+
+    def on_trace(self, spans: list[Span]) -> None:
+        try:
+            with self._write_lock, self.path.open("ab") as f:
+                f.write(dumpb(otlp_request(spans)) + b"\n")
+        except OSError as e:
+            logger.error(
+                "Could not export trace: %s",
+                e,
+                extra={"tool": "tracing", "operation": "export", "error_type": type(e).__name__},
+                exc_info=True,
+            )
+
+
+_processors: list[TraceCollector] = []
+
+
+def add_span_processor(processor: TraceCollector) -> None:
+    """Pass every finished span to `processor` (exporter, slow-call journal)."""
+    if processor not in _processors:
+        _processors.append(processor)
+
+
+def remove_span_processor(processor: TraceCollector) -> None:
+    if processor in _processors:
+        _processors.remove(processor)
+
+
+def configure_tracing(settings: Settings | None = None) -> OTLPFileExporter | None:
+    """Install the file exporter when OPENCLAW_TRACE_EXPORT is on; returns it (else None)."""
+    settings = settings or Settings()
+    for processor in [p for p in _processors if isinstance(p, OTLPFileExporter)]:
+        remove_span_processor(processor)
+    if not settings.trace_export:
+        return None
+    exporter = OTLPFileExporter(settings.trace_export_path or Path(settings.log_dir) / "traces.otlp.jsonl")
+    add_span_processor(exporter)
+    return exporter
+
+
+def reset_tracing() -> None:
+    """Remove all span processors (tests)."""
+    _processors.clear()
+
+
+class TracingClient(httpx.AsyncClient):
+    """httpx client that wraps each request in a client span and sends `traceparent`.
+
+    Tracing happens in `send`, so the client keeps httpx's own transports, including the proxy
+    mounts it builds from HTTP(S)_PROXY / ALL_PROXY / NO_PROXY.
+    """
+
+    def __init__(self, upstream: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.upstream = upstream
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        with span(
+            f"{self.upstream} {request.method} {request.url.path}",
+            kind="client",
+            **{"upstream": self.upstream, "http.method": request.method, "url.path": request.url.path},
+        ) as s:
+            request.headers["traceparent"] = s.traceparent
+            if "content-length" in request.headers:
+                s.set("http.request.body.size", int(request.headers["content-length"]))
+            response = await super().send(request, **kwargs)
+            s.set("http.status_code", response.status_code)
+            if "content-length" in response.headers:
+                s.set("http.response.body.size", int(response.headers["content-length"]))
+            if response.status_code >= 500:
+                s.fail(f"HTTP {response.status_code}")
+            return response
+
+
+class TracingMiddleware(Middleware):
+    """Root span per tool call, tagged with tool, operation and MCP session; tool and operation are
+    also bound to the log context, so every log line of the call carries them."""
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        from openclaw_molt_mcp.recorder import result_success  # recorder -> serve_logs -> logging_config -> here
+
+        arguments = context.message.arguments or {}
+        operation = arguments.get("operation")
+        fields = {"tool": context.message.name}
+        if isinstance(operation, str):
+            fields["operation"] = operation
+        with (
+            bound_contextvars(**fields),
+            span(f"tools/call {context.message.name}", kind="server", **fields) as s,
+        ):
+            fctx = context.fastmcp_context
+            try:
+                s.set("mcp.session_id", fctx.session_id if fctx is not None else None)
+            except RuntimeError:
+                pass
+            s.payload = {"args": arguments}
+            result = await call_next(context)
+            s.payload["result"] = result
+            if not result_success(result):
+                s.fail("unsuccessful")
+            return result
@@ -0,0 +1,223 @@
+"""Compressed transcript archive: NDJSON segments with a memory-mapped offset index.
+
+Layout under `<data_dir>/archive/<hint>-<digest>/`, where `hint` is the session key with unsafe
+characters replaced (for humans) and `digest` a sha256 prefix of the exact key (so distinct keys
+never share a directory):
+
+- `seg-<first_seq>.ndjson.zst` (or `.gz`): one export run. Messages are written in blocks of
+  `BLOCK_MESSAGES` lines, each block its own zstd frame / gzip member, so the whole file is
+  still a valid stream for `zstdcat`/`zcat` while any block can be decompressed on its own.
+- `seg-<first_seq>.idx`: one fixed-size record per block
+  (`first_seq`, byte offset, compressed length, message count; little-endian).
+
+Range reads memory-map the index, binary-search it for the first block holding the requested
+`seq`, then decompress only the blocks that overlap the range, sliced straight out of a
+memory-mapped segment. Segment and index are each written to a temp file and renamed into
+place (segment first), so a crash never leaves a truncated segment behind a complete index.
+zstd requires the optional `zstandard` package
+(`pip install openclaw-molt-mcp[archive]`); gzip is always available.
+"""
+
+import gzip
+import hashlib
+import mmap
+import os
+import re
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jsoncodec import dumpb, loads
+from openclaw_molt_mcp.transcript_store import TranscriptStore
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+BLOCK_MESSAGES = 256
+INDEX_RECORD = struct.Struct("<QQQI")
+CODECS = {"zstd": ".ndjson.zst", "gzip": ".ndjson.gz"}
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        compressed: bytes = zstandard.ZstdCompressor(level=10).compress(data)
+        return compressed
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        raw: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return raw
+    return gzip.decompress(data)
+
+
+def _replace(tmp: Path, target: Path) -> None:
+    """Atomically move a fully written temp file over `target` (removing it on failure)."""
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class Segment:
+    """One archived segment file and its fixed-record index."""
+
+    def __init__(self, data_path: Path, index_path: Path, codec: str) -> None:
+        self.data_path = data_path
+        self.index_path = index_path
+        self.codec = codec
+        self.block_count = index_path.stat().st_size // INDEX_RECORD.size
+        with self._mapped(index_path) as index:
+            self.first_seq = INDEX_RECORD.unpack_from(index, 0)[0]
+            first, _, _, count = INDEX_RECORD.unpack_from(index, (self.block_count - 1) * INDEX_RECORD.size)
+        self.last_seq = first + count - 1
+
+    @staticmethod
+    def _mapped(path: Path) -> mmap.mmap:
+        with path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, start_seq: int, limit: int) -> list[dict[str, Any]]:
+        """Messages with seq >= start_seq (at most `limit`), decompressing only needed blocks."""
+        out: list[dict[str, Any]] = []
+        with self._mapped(self.index_path) as index, self._mapped(self.data_path) as data:
+            # Last block whose first seq <= start_seq, found by bisecting the mapped records.
+            lo, hi = 0, self.block_count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if INDEX_RECORD.unpack_from(index, mid * INDEX_RECORD.size)[0] <= start_seq:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            for i in range(max(0, lo - 1), self.block_count):
+                first, offset, length, _ = INDEX_RECORD.unpack_from(index, i * INDEX_RECORD.size)
+                lines = _decompress(self.codec, data[offset : offset + length]).splitlines()
+                for seq, line in enumerate(lines, start=first):
+                    if seq >= start_seq:
+                        out.append({"seq": seq, **loads(line)})
+                        if len(out) >= limit:
+                            return out
+        return out
+
+
+class TranscriptArchive:
+    """Per-session directory of compressed segments."""
+
+    def __init__(self, root: Path | str, codec: str | None = None) -> None:
+        self.root = Path(root)
+        self.codec = codec or default_codec()
+        if self.codec not in CODECS:
+            raise ValueError(f"Unknown archive codec: {self.codec}")
+        if self.codec == "zstd" and zstandard is None:
+            raise ValueError("zstd archive codec requires the 'zstandard' package")
+
+    def _session_dir(self, session_key: str) -> Path:
+        if not session_key.strip("."):
+            raise ValueError(f"Invalid session key for archive: {session_key!r}")
+        hint = _UNSAFE.sub("_", session_key)[:48].strip(".")
+        digest = hashlib.sha256(session_key.encode()).hexdigest()[:16]
+        return self.root / f"{hint}-{digest}"
+
+    def segments(self, session_key: str) -> list[Segment]:
+        """Segments ordered by first seq (segments written with either codec are readable)."""
+        found: list[Segment] = []
+        folder = self._session_dir(session_key)
+        if not folder.is_dir():
+            return found
+        for index_path in sorted(folder.glob("seg-*.idx")):
+            for codec, suffix in CODECS.items():
+                data_path = index_path.with_name(index_path.stem + suffix)
+                if data_path.exists():
+                    if codec == "zstd" and zstandard is None:
+                        raise ValueError(f"{data_path.name} needs the 'zstandard' package to read")
+                    found.append(Segment(data_path, index_path, codec))
+                    break
+        return found
+
+    def last_seq(self, session_key: str) -> int:
+        segments = self.segments(session_key)
+        return segments[-1].last_seq if segments else 0
+
+    def write_segment(self, session_key: str, messages: list[tuple[int, dict[str, Any]]]) -> dict[str, Any]:
+        """Write (seq, message) pairs (consecutive seqs) as a new segment plus index."""
+        folder = self._session_dir(session_key)
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = f"seg-{messages[0][0]:012d}"
+        data_path = folder / f"{stem}{CODECS[self.codec]}"
+        index_path = folder / f"{stem}.idx"
+        raw_bytes = offset = 0
+        index = bytearray()
+        data = tempfile.NamedTemporaryFile(dir=folder, prefix=f".{stem}.", delete=False)
+        try:
+            with data:
+                for i in range(0, len(messages), BLOCK_MESSAGES):
+                    block = messages[i : i + BLOCK_MESSAGES]
+                    raw = b"".join(dumpb(m) + b"\n" for _, m in block)
+                    packed = _compress(self.codec, raw)
+                    data.write(packed)
+                    index += INDEX_RECORD.pack(block[0][0], offset, len(packed), len(block))
+                    offset += len(packed)
+                    raw_bytes += len(raw)
+        except BaseException:
+            Path(data.name).unlink(missing_ok=True)
+            raise
+        # Segment first: an index (which is what `last_seq` reads) never points at a partial segment.
+        _replace(Path(data.name), data_path)
+        with tempfile.NamedTemporaryFile(dir=folder, prefix=f".{stem}.", suffix=".idx", delete=False) as tmp:
+            tmp.write(index)
+        _replace(Path(tmp.name), index_path)
+        return {
+            "segment": data_path.name,
+            "messages": len(messages),
+            "raw_bytes": raw_bytes,
+            "compressed_bytes": offset,
+            "ratio": round(raw_bytes / offset, 2) if offset else None,
+        }
+
+    def export_from_store(self, store: TranscriptStore, session_key: str) -> dict[str, Any]:
+        """Archive messages from the local transcript store not archived yet."""
+        archived = self.last_seq(session_key)
+        pending: list[tuple[int, dict[str, Any]]] = []
+        while True:
+            page = store.page(session_key, since=archived + len(pending), limit=500)
+            pending.extend((m.pop("seq"), m) for m in page["messages"])
+            if page["next_offset"] is None:
+                break
+        if not pending:
+            return {"segment": None, "messages": 0, "archived_through": archived, "codec": self.codec}
+        written = self.write_segment(session_key, pending)
+        return {**written, "archived_through": pending[-1][0], "codec": self.codec}
+
+    def read(self, session_key: str, since: int = 0, limit: int = 50) -> dict[str, Any]:
+        """Archived messages with seq > `since`, oldest first."""
+        start = since + 1
+        out: list[dict[str, Any]] = []
+        segments = self.segments(session_key)
+        for segment in segments:
+            if segment.last_seq < start or len(out) >= limit:
+                continue
+            out.extend(segment.read(max(start, segment.first_seq), limit - len(out)))
+        last = segments[-1].last_seq if segments else 0
+        return {
+            "messages": out,
+            "next_since": out[-1]["seq"] if out and out[-1]["seq"] < last else None,
+            "archived_through": last,
+        }
+
+
+def get_archive(settings: Settings | None = None) -> TranscriptArchive:
+    """Archive rooted at `<data_dir>/archive` using OPENCLAW_ARCHIVE_CODEC (auto: zstd if installed)."""
+    settings = settings or Settings()
+    codec = None if settings.archive_codec == "auto" else settings.archive_codec
+    return TranscriptArchive(Path(settings.data_dir) / "archive", codec)
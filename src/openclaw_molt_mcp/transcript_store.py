@@ -0,0 +1,287 @@
+"""Local append-only transcript store for incremental session history.
+
+`clawd_sessions history` with `incremental=true` keeps every session's transcript in SQLite
+(`<data_dir>/transcripts.db`). Each sync asks the Gateway for a small tail window of
+`sessions_history`, lines it up with the tail of the stored transcript and appends only what
+follows the overlap; the window grows geometrically until an overlap is found, so a long
+transcript is fetched in full only once. Pages (`since`/`limit`/`offset`) are then served
+from the local store.
+
+Messages without an `id` are keyed by a digest of their content, so the same text sent twice
+has the same key. Such messages are deduplicated only against the overlap being merged,
+never across the whole session, so repeated turns ("ok", "ok") are both kept.
+
+Messages get a per-session sequence number (`seq`, 1-based). `since=<seq>` returns only
+messages appended after that point, which lets callers poll for new messages cheaply.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from openclaw_molt_mcp.agent_stream import history_messages
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.inbox import message_timestamp
+from openclaw_molt_mcp.jsoncodec import dumpb, dumps, loads
+
+INITIAL_WINDOW = 50
+WINDOW_GROWTH = 4
+MAX_WINDOW = 5000
+MAX_PAGE = 500
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    session_key TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    msg_key TEXT NOT NULL,
+    ts REAL NOT NULL,
+    role TEXT,
+    body TEXT NOT NULL,
+    PRIMARY KEY (session_key, seq)
+);
+CREATE INDEX IF NOT EXISTS messages_by_key ON messages (session_key, msg_key);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_key TEXT PRIMARY KEY,
+    last_key TEXT,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+
+def message_key(message: dict[str, Any]) -> str:
+    """Stable key for a transcript message: its id, else a digest of its canonical JSON."""
+    if message.get("id") is not None:
+        return f"id:{message['id']}"
+    return "b2:" + hashlib.blake2b(dumpb(message, sort_keys=True), digest_size=16).hexdigest()
+
+
+def overlap_end(keys: list[str], stored_tail: list[str]) -> int | None:
+    """Index in `keys` (a tail window of the transcript) where messages after the stored ones start.
+
+    The window is the end of the stored transcript followed by new messages, so the shortest
+    run of new messages whose preceding keys equal the stored tail wins. None when no prefix
+    of the window lines up with the stored tail.
+    """
+    if not stored_tail:
+        return 0
+    last = stored_tail[-1]
+    for cut in range(min(len(keys), len(stored_tail)), 0, -1):
+        if keys[cut - 1] == last and keys[:cut] == stored_tail[-cut:]:
+            return cut
+    return None
+
+
+class TranscriptStore:
+    """SQLite transcript store; one connection guarded by a lock.
+
+    Methods block on SQLite; async callers run them with `asyncio.to_thread`.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        if not self._conn.execute("PRAGMA user_version").fetchone()[0]:
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def cursor(self, session_key: str) -> tuple[str | None, int]:
+        """(last stored message key, last seq) for a session."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_key, last_seq FROM sessions WHERE session_key = ?", (session_key,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, 0)
+
+    def tail_keys(self, session_key: str, n: int) -> list[str]:
+        """Keys of the last `n` stored messages, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT msg_key FROM messages WHERE session_key = ? ORDER BY seq DESC LIMIT ?", (session_key, n)
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def key_counts(self, session_key: str, keys: set[str]) -> dict[str, int]:
+        """How many stored messages of the session carry each of `keys`."""
+        counts: dict[str, int] = {}
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM messages WHERE session_key = ? AND msg_key = ?", (session_key, key)
+                ).fetchone()
+                if row[0]:
+                    counts[key] = row[0]
+        return counts
+
+    def append(self, session_key: str, messages: list[dict[str, Any]]) -> int:
+        """Append messages; returns how many were added.
+
+        Messages with an `id` already stored are skipped. Messages without one are always
+        appended (identical text can legitimately repeat); the caller dedupes them.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT last_key, last_seq FROM sessions WHERE session_key = ?", (session_key,)
+            ).fetchone()
+            last_key, seq = (row[0], row[1]) if row else (None, 0)
+            added = 0
+            for message in messages:
+                key = message_key(message)
+                if (
+                    key.startswith("id:")
+                    and self._conn.execute(
+                        "SELECT 1 FROM messages WHERE session_key = ? AND msg_key = ?", (session_key, key)
+                    ).fetchone()
+                ):
+                    continue
+                seq += 1
+                added += 1
+                last_key = key
+                self._conn.execute(
+                    "INSERT INTO messages (session_key, seq, msg_key, ts, role, body) VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_key, seq, key, message_timestamp(message), message.get("role"), dumps(message)),
+                )
+            self._conn.execute(
+                "INSERT INTO sessions (session_key, last_key, last_seq, synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(session_key) DO UPDATE SET last_key = excluded.last_key, "
+                "last_seq = excluded.last_seq, synced_at = excluded.synced_at",
+                (session_key, last_key, seq, time.time()),
+            )
+        return added
+
+    def page(self, session_key: str, since: int = 0, limit: int = 50, offset: int = 0) -> dict[str, Any]:
+        """Messages with seq > `since`, oldest first, paged by `limit`/`offset`."""
+        limit = max(1, min(limit, MAX_PAGE))
+        offset = max(0, offset)
+        with self._lock:
+            total = self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE session_key = ? AND seq > ?", (session_key, since)
+            ).fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT seq, body FROM messages WHERE session_key = ? AND seq > ? ORDER BY seq LIMIT ? OFFSET ?",
+                (session_key, since, limit, offset),
+            ).fetchall()
+        messages = [{"seq": seq, **loads(body)} for seq, body in rows]
+        end = offset + len(messages)
+        return {
+            "messages": messages,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": end if end < total else None,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            sessions, messages = self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM sessions), (SELECT COUNT(*) FROM messages)"
+            ).fetchone()
+        return {"path": str(self.path), "sessions": sessions, "messages": messages}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+async def sync_session(
+    client: GatewayClient,
+    store: TranscriptStore,
+    session_key: str,
+    args: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Fetch only messages newer than the stored cursor and append them.
+
+    Returns a dialogic result whose `data` has `fetched` (new messages), `requests` and
+    `window` (size of the last tail window requested; None means the full transcript).
+    """
+    _, stored = await asyncio.to_thread(store.cursor, session_key)
+    window: int | None = INITIAL_WINDOW if stored else None
+    requests = 0
+    while True:
+        invoke_args = dict(args or {})
+        if window is not None:
+            invoke_args["limit"] = window
+        result = await client.tools_invoke(
+            tool="sessions_history", action="json", args=invoke_args, session_key=session_key
+        )
+        requests += 1
+        if not result.get("success"):
+            return result
+        messages = history_messages(result.get("data"))
+        keys = [message_key(m) for m in messages]
+        start = overlap_end(keys, await asyncio.to_thread(store.tail_keys, session_key, len(keys))) if stored else 0
+        if start is not None:
+            new = messages[start:]
+            break
+        # Whole transcript fetched, or no overlap within MAX_WINDOW (e.g. transcript compacted):
+        # keep each message beyond the copies already stored.
+        if window is None or len(messages) < window or window >= MAX_WINDOW:
+            counts = await asyncio.to_thread(store.key_counts, session_key, set(keys))
+            seen: Counter[str] = Counter()
+            new = []
+            for message, key in zip(messages, keys, strict=True):
+                seen[key] += 1
+                if seen[key] > counts.get(key, 0):
+                    new.append(message)
+            break
+        window = min(window * WINDOW_GROWTH, MAX_WINDOW)
+    fetched = await asyncio.to_thread(store.append, session_key, new)
+    return {
+        "success": True,
+        "message": f"Synced {fetched} new messages.",
+        "data": {"fetched": fetched, "requests": requests, "window": window},
+    }
+
+
+async def incremental_history(
+    client: GatewayClient,
+    store: TranscriptStore,
+    session_key: str,
+    args: dict[str, Any] | None = None,
+    since: int = 0,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Sync a session, then return a page from the store with `cursor` (latest seq) and `fetched`."""
+    synced = await sync_session(client, store, session_key, args)
+    if not synced.get("success"):
+        return synced
+    page = await asyncio.to_thread(store.page, session_key, since, limit, offset)
+    page["cursor"] = (await asyncio.to_thread(store.cursor, session_key))[1]
+    page["fetched"] = synced["data"]["fetched"]
+    return {
+        "success": True,
+        "message": f"{len(page['messages'])} of {page['total']} messages ({page['fetched']} new from Gateway).",
+        "data": page,
+    }
+
+
+_store: TranscriptStore | None = None
+
+
+def get_transcript_store(settings: Settings | None = None) -> TranscriptStore:
+    """Process-wide store at `<data_dir>/transcripts.db`."""
+    global _store
+    if _store is None:
+        settings = settings or Settings()
+        _store = TranscriptStore(Path(settings.data_dir) / "transcripts.db")
+    return _store
+
+
+def reset_transcript_store() -> None:
+    """Close and drop the shared store (tests, data_dir change)."""
+    global _store
+    if _store is not None:
+        _store.close()
+    _store = None
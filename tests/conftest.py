@@ -9,8 +9,17 @@ import pytest
 import pytest_asyncio
 
 from fastmcp.client import Client
+from openclaw_molt_mcp.adaptive_timeout import reset_timeout_policy
 from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.jobs import reset_job_registry
+from openclaw_molt_mcp.log_levels import reset_log_levels
 from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.profiling import reset_profiler
+from openclaw_molt_mcp.rate_limit import reset_limiters
+from openclaw_molt_mcp.resilience import reset_breakers
+from openclaw_molt_mcp.slow_calls import reset_slow_calls
+from openclaw_molt_mcp.tracing import reset_tracing
+from openclaw_molt_mcp.transcript_store import reset_transcript_store
 
 # Import server to register tools before Client connects
 from openclaw_molt_mcp import server  # noqa: F401
@@ -28,6 +37,33 @@ def extract_tool_result(result: object) -> dict:
     return {}
 
 
+@pytest.fixture(autouse=True)
+def isolate_upstream_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Fresh breakers, limiters, timeouts, jobs, stores, profiler, log levels, tracing and slow-call journal
+    per test; no real sleeps between retries."""
+    monkeypatch.setenv("OPENCLAW_RETRY_BACKOFF_BASE", "0")
+    monkeypatch.setenv("OPENCLAW_DATA_DIR", str(tmp_path / "data"))
+    reset_breakers()
+    reset_limiters()
+    reset_timeout_policy()
+    reset_job_registry()
+    reset_transcript_store()
+    reset_profiler()
+    reset_log_levels()
+    reset_slow_calls()
+    reset_tracing()
+    yield
+    reset_breakers()
+    reset_limiters()
+    reset_timeout_policy()
+    reset_job_registry()
+    reset_transcript_store()
+    reset_profiler()
+    reset_log_levels()
+    reset_slow_calls()
+    reset_tracing()
+
+
 @pytest_asyncio.fixture
 async def mcp_client():
     """Async fixture providing FastMCP Client connected to mcp server (with tools loaded)."""
@@ -61,8 +97,8 @@ def settings_with_token(monkeypatch: pytest.MonkeyPatch) -> Settings:
 def mock_context() -> MagicMock:
     """Mock FastMCP Context for tool tests."""
     ctx = MagicMock()
-    ctx.info = MagicMock()
-    ctx.report_progress = MagicMock()
+    ctx.info = AsyncMock()
+    ctx.report_progress = AsyncMock()
     return ctx
 
 
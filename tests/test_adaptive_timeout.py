@@ -0,0 +1,53 @@
+"""Tests for openclaw_molt_mcp.adaptive_timeout."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from openclaw_molt_mcp.adaptive_timeout import AdaptiveTimeoutPolicy, endpoint_key, timed_call
+
+
+def test_ceiling_until_min_samples() -> None:
+    """Without enough samples the ceiling applies."""
+    policy = AdaptiveTimeoutPolicy(floor=1, ceiling=30, min_samples=5)
+    for _ in range(4):
+        policy.observe("gateway", "sessions_list", 0.05)
+    assert policy.read_deadline("gateway", "sessions_list") == 30
+
+
+def test_fast_endpoint_clamped_to_floor() -> None:
+    """A consistently fast endpoint gets the floor deadline, not 30 s."""
+    policy = AdaptiveTimeoutPolicy(floor=1, ceiling=30, multiplier=4, min_samples=5, connect_ceiling=5)
+    for _ in range(10):
+        policy.observe("gateway", "sessions_list", 0.05)
+    timeout = policy.timeout_for("gateway", "sessions_list")
+    assert timeout.read == 1
+    assert timeout.connect == 1
+    assert policy.read_deadline("gateway", "hooks_agent") == 30
+
+
+def test_slow_endpoint_scales_with_percentile() -> None:
+    """Deadline follows percentile x multiplier within bounds."""
+    policy = AdaptiveTimeoutPolicy(floor=1, ceiling=30, multiplier=4, min_samples=5)
+    for _ in range(10):
+        policy.observe("gateway", "sessions_history", 2.0)
+    assert policy.read_deadline("gateway", "sessions_history") == 8.0
+
+
+@pytest.mark.asyncio
+async def test_timed_call_records_timeout_as_deadline() -> None:
+    """A timeout is recorded at its deadline so the window widens."""
+    policy = AdaptiveTimeoutPolicy(floor=1, ceiling=30, min_samples=1)
+    call = AsyncMock(side_effect=httpx.ReadTimeout("hung"))
+    with pytest.raises(httpx.ReadTimeout):
+        await timed_call(policy, "gateway", "sessions_list", call)
+    passed_timeout = call.call_args[0][0]
+    assert passed_timeout.read == 30
+    assert policy.snapshot()["gateway sessions_list"]["samples"] == 1
+
+
+def test_endpoint_key_collapses_ids() -> None:
+    """Resource ids are collapsed so stats aggregate per endpoint."""
+    assert endpoint_key("/posts/abc123/upvote") == "/posts/{id}/upvote"
+    assert endpoint_key("/feed?limit=1") == "/feed"
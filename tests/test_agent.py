@@ -1,9 +1,12 @@
 """Tests for clawd_agent tool."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastmcp import Client
 
+from openclaw_molt_mcp.mcp_instance import mcp
 from tests.conftest import extract_tool_result
 
 
@@ -78,3 +81,114 @@ async def test_clawd_agent_send_message(mcp_client) -> None:
         data = extract_tool_result(result)
         assert data.get("success") is True
         assert data.get("data", {}).get("operation") == "send_message"
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_forwards_thinking_and_timeout(mcp_client) -> None:
+    """run_agent should forward thinking and timeout_seconds to hooks_agent."""
+    with patch("openclaw_molt_mcp.tools.agent.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.hooks_agent = AsyncMock(return_value={"success": True, "data": {}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        await mcp_client.call_tool(
+            "clawd_agent",
+            arguments={"operation": "run_agent", "message": "go", "thinking": "low", "timeout_seconds": 30},
+            raise_on_error=False,
+        )
+        call_kw = mock_client.hooks_agent.call_args[1]
+        assert call_kw["thinking"] == "low"
+        assert call_kw["timeout_seconds"] == 30
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_deadline_exceeded(mcp_client) -> None:
+    """A Gateway call outliving timeout_seconds + grace should return a timeout error."""
+    with (
+        patch("openclaw_molt_mcp.tools.agent.GatewayClient") as mock_gateway_class,
+        patch("openclaw_molt_mcp.tools.agent.AGENT_TIMEOUT_GRACE", -0.95),
+    ):
+        mock_client = MagicMock()
+
+        async def hang(**kwargs):
+            await asyncio.sleep(5)
+
+        mock_client.hooks_agent = AsyncMock(side_effect=hang)
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_agent",
+            arguments={"operation": "run_agent", "message": "go", "timeout_seconds": 1},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is False
+        assert data.get("error") == "timeout"
+        mock_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_rejects_bad_timeout(mcp_client) -> None:
+    """Non-positive timeout_seconds is rejected before calling the Gateway."""
+    result = await mcp_client.call_tool(
+        "clawd_agent",
+        arguments={"operation": "run_agent", "timeout_seconds": 0},
+        raise_on_error=False,
+    )
+    data = extract_tool_result(result)
+    assert data.get("success") is False
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_run_agent_stream(mcp_client) -> None:
+    """clawd_agent run_agent with stream=true relays history deltas and reports the streamed text."""
+    with patch("openclaw_molt_mcp.tools.agent.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.hooks_agent = AsyncMock(return_value={"success": True, "message": "done", "data": {}})
+        mock_client.tools_invoke = AsyncMock(
+            side_effect=[
+                {"success": True, "data": {"messages": []}},
+                {"success": True, "data": {"messages": [{"role": "assistant", "content": "Hi!"}]}},
+            ]
+        )
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        progress: list[tuple[float, str | None]] = []
+
+        async def on_progress(value, total, message):
+            progress.append((value, message))
+
+        result = await mcp_client.call_tool(
+            "clawd_agent",
+            arguments={"operation": "run_agent", "message": "hi", "stream": True},
+            progress_handler=on_progress,
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is True
+        assert data["stream"]["text"] == "Hi!"
+        assert data["stream"]["updates"] == 1
+        assert progress == [(1, "Hi!")]
+        mock_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_info_reaches_client() -> None:
+    """ctx.info progress notes are awaited and delivered as MCP log messages."""
+    logged: list[str] = []
+
+    async def on_log(message) -> None:
+        logged.append(str(message.data.get("msg") if isinstance(message.data, dict) else message.data))
+
+    with patch("openclaw_molt_mcp.tools.agent.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.hooks_agent = AsyncMock(return_value={"success": True, "data": {}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+        async with Client(mcp, log_handler=on_log) as client:
+            await client.call_tool("clawd_agent", {"operation": "run_agent", "message": "hi"})
+
+    assert "Running isolated agent turn (deliver=False)" in logged
@@ -0,0 +1,109 @@
+"""Tests for streaming agent turns (agent_stream)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openclaw_molt_mcp.agent_stream import assistant_text_since, history_messages, stream_agent_turn
+
+
+def _history(*messages: dict) -> dict:
+    return {"success": True, "data": {"messages": list(messages)}}
+
+
+def test_history_messages_envelopes() -> None:
+    msg = {"role": "assistant", "content": "hi"}
+    assert history_messages([msg]) == [msg]
+    assert history_messages({"messages": [msg]}) == [msg]
+    assert history_messages({"details": {"history": [msg]}}) == [msg]
+    assert history_messages("nope") == []
+
+
+def test_assistant_text_since_anchor() -> None:
+    messages = [
+        {"id": "1", "role": "assistant", "content": "old"},
+        {"id": "2", "role": "user", "content": "question"},
+        {
+            "id": "3",
+            "role": "assistant",
+            "content": [{"type": "text", "text": "new "}, {"type": "text", "text": "answer"}],
+        },
+    ]
+    assert assistant_text_since(messages, "1") == "new answer"
+    assert assistant_text_since(messages, "missing") == "old\n\nnew answer"
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_turn_yields_partials_then_result() -> None:
+    old = {"id": "0", "role": "assistant", "content": "previous turn"}
+    user = {"id": "1", "role": "user", "content": "hello"}
+    release = asyncio.Event()
+
+    async def hooks_agent(**kwargs):
+        await release.wait()
+        return {"success": True, "message": "Agent hook triggered successfully.", "data": {"ok": True}}
+
+    snapshots = iter(
+        [
+            _history(old),
+            _history(old, user, {"id": "2", "role": "assistant", "content": "Hel"}),
+            _history(old, user, {"id": "2", "role": "assistant", "content": "Hello there"}),
+        ]
+    )
+
+    async def tools_invoke(**kwargs):
+        result = next(snapshots, None)
+        if result is None:
+            release.set()
+            return _history(old, user, {"id": "2", "role": "assistant", "content": "Hello there"})
+        return result
+
+    client = MagicMock()
+    client.hooks_agent = AsyncMock(side_effect=hooks_agent)
+    client.tools_invoke = AsyncMock(side_effect=tools_invoke)
+
+    events = [e async for e in stream_agent_turn(client, "hello", poll_interval=0.01)]
+
+    partials = [e for e in events if e["type"] == "partial"]
+    assert [e["delta"] for e in partials] == ["Hel", "lo there"]
+    assert events[-1]["type"] == "result"
+    assert events[-1]["result"]["success"] is True
+    assert events[-1]["text"] == "Hello there"
+    assert client.hooks_agent.call_args.kwargs["deliver"] is False
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_turn_without_history_still_returns_result() -> None:
+    client = MagicMock()
+    client.hooks_agent = AsyncMock(return_value={"success": True, "message": "ok"})
+    client.tools_invoke = AsyncMock(return_value={"success": False, "message": "Tool not allowed"})
+
+    events = [e async for e in stream_agent_turn(client, "hello", poll_interval=0.01)]
+
+    assert [e["type"] for e in events] == ["result"]
+    assert client.tools_invoke.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_agent_turn_close_cancels_gateway_call() -> None:
+    cancelled = asyncio.Event()
+
+    async def hooks_agent(**kwargs):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client = MagicMock()
+    client.hooks_agent = AsyncMock(side_effect=hooks_agent)
+    client.tools_invoke = AsyncMock(
+        side_effect=[_history(), _history({"id": "1", "role": "assistant", "content": "thinking..."})]
+    )
+
+    stream = stream_agent_turn(client, "hello", poll_interval=0.01)
+    first = await anext(stream)
+    assert first["delta"] == "thinking..."
+    await stream.aclose()
+    assert cancelled.is_set()
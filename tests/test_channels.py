@@ -46,3 +46,158 @@ async def test_clawd_channels_send_message_requires_message(mcp_client) -> None:
     data = extract_tool_result(result)
     assert data.get("success") is False
     assert "message" in (data.get("message") or "").lower()
+
+
+@pytest.mark.asyncio
+async def test_clawd_channels_broadcast_fans_out(mcp_client) -> None:
+    """clawd_channels broadcast sends to each unique target over one client and reports per-target results."""
+    with patch("openclaw_molt_mcp.tools.channels.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+
+        async def tools_invoke(**kwargs):
+            if kwargs["args"]["channel"] == "slack":
+                return {"success": False, "message": "Gateway returned 502", "error": "502"}
+            return {"success": True, "message": "Tool invoked successfully.", "data": {"sent": True}}
+
+        mock_client.tools_invoke = AsyncMock(side_effect=tools_invoke)
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_channels",
+            arguments={
+                "operation": "broadcast",
+                "message": " deploy done ",
+                "targets": [
+                    {"channel": "telegram", "to": "ops"},
+                    {"channel": "telegram", "to": "ops"},
+                    {"channel": "discord"},
+                    {"channel": "slack", "to": "#alerts"},
+                ],
+                "concurrency": 2,
+            },
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is False
+        assert data["data"]["succeeded"] == 2
+        assert data["data"]["failed"] == 1
+        results = data["data"]["results"]
+        assert [(r["channel"], r.get("to")) for r in results] == [
+            ("telegram", "ops"),
+            ("discord", None),
+            ("slack", "#alerts"),
+        ]
+        assert all("elapsed_ms" in r for r in results)
+        assert mock_client.tools_invoke.await_count == 3
+        first_args = mock_client.tools_invoke.call_args_list[0][1]["args"]
+        assert first_args == {"channel": "telegram", "to": "ops", "message": "deploy done"}
+        mock_gateway_class.assert_called_once()
+        mock_client.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_clawd_channels_broadcast_requires_targets(mcp_client) -> None:
+    """clawd_channels broadcast without targets returns error without calling the Gateway."""
+    with patch("openclaw_molt_mcp.tools.channels.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock()
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_channels",
+            arguments={"operation": "broadcast", "message": "hi", "targets": [{"to": "x"}]},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is False
+        assert "targets" in data["message"]
+        mock_client.tools_invoke.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_clawd_channels_unified_inbox_merges_and_pages(mcp_client) -> None:
+    """unified_inbox lists channels, merges recent messages newest first and pages with a cursor."""
+    inbox = {
+        "telegram": [{"id": "t1", "ts": 100, "text": "t1"}, {"id": "t2", "ts": 70, "text": "t2"}],
+        "discord": [
+            {"id": "d1", "ts": 90, "text": "d1"},
+            {"id": "d2", "ts": 80, "text": "d2"},
+            {"id": "d3", "ts": 10, "text": "d3"},
+        ],
+        "slack": [],
+    }
+    with patch("openclaw_molt_mcp.tools.channels.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+
+        async def tools_invoke(**kwargs):
+            if kwargs["action"] == "list_channels":
+                return {"success": True, "data": {"channels": [{"name": n} for n in inbox] + [{"name": "broken"}]}}
+            channel = kwargs["args"]["channel"]
+            if channel == "broken":
+                return {"success": False, "message": "Gateway returned 500", "error": "500"}
+            return {"success": True, "data": {"messages": inbox[channel][: kwargs["args"]["limit"]]}}
+
+        mock_client.tools_invoke = AsyncMock(side_effect=tools_invoke)
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        first = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_channels",
+                arguments={"operation": "unified_inbox", "limit": 3},
+                raise_on_error=False,
+            )
+        )
+        assert first.get("success") is True
+        assert [m["id"] for m in first["data"]["messages"]] == ["t1", "d1", "d2"]
+        assert first["data"]["messages"][1]["channel"] == "discord"
+        assert first["data"]["errors"] == {"broken": "500"}
+        assert first["data"]["next_cursor"]
+
+        second = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_channels",
+                arguments={"operation": "unified_inbox", "limit": 3, "cursor": first["data"]["next_cursor"]},
+                raise_on_error=False,
+            )
+        )
+        assert [m["id"] for m in second["data"]["messages"]] == ["t2", "d3"]
+        assert second["data"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_clawd_channels_unified_inbox_bad_cursor(mcp_client) -> None:
+    """unified_inbox rejects an undecodable cursor."""
+    result = await mcp_client.call_tool(
+        "clawd_channels",
+        arguments={"operation": "unified_inbox", "cursor": "%%%"},
+        raise_on_error=False,
+    )
+    data = extract_tool_result(result)
+    assert data.get("success") is False
+    assert data.get("error") == "invalid_cursor"
+
+
+@pytest.mark.asyncio
+async def test_clawd_channels_get_recent_messages_max_bytes(mcp_client) -> None:
+    """get_recent_messages with max_bytes defers messages that do not fit to the next page."""
+    messages = [{"id": i, "text": "x" * 500} for i in range(20)]
+    with patch("openclaw_molt_mcp.tools.channels.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock(return_value={"success": True, "data": {"messages": messages}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        data = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_channels",
+                arguments={"operation": "get_recent_messages", "channel": "telegram", "max_bytes": 3000},
+                raise_on_error=False,
+            )
+        )
+        assert data.get("success") is True
+        assert 0 < len(data["data"]["messages"]) < 20
+        assert data["truncated"]["omitted_items"] == 20 - len(data["data"]["messages"])
+        assert data["page"]["next_cursor"]
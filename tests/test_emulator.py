@@ -0,0 +1,122 @@
+"""Tests for the local Gateway + Moltbook emulator."""
+
+import random
+
+import httpx
+import pytest
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.emulator import EmulatorProfile, LatencyProfile, create_app, run_emulator
+from openclaw_molt_mcp.gateway_client import GatewayClient
+
+
+def _client(profile: dict | None = None) -> httpx.AsyncClient:
+    app = create_app(EmulatorProfile.model_validate(profile or {}))
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://emulator")
+
+
+async def _invoke(client: httpx.AsyncClient, tool: str, action: str | None = None, **args) -> httpx.Response:
+    body = {"tool": tool, "args": args, "sessionKey": args.pop("session_key", "main")}
+    if action:
+        body["action"] = action
+    return await client.post("/tools/invoke", json=body)
+
+
+@pytest.mark.asyncio
+async def test_gateway_tools_and_hooks() -> None:
+    """Sessions, channels, routing, tts and hooks answer in Tools Invoke shape and share state."""
+    async with _client({"payload": {"sessions": 3, "history_messages": 4}}) as client:
+        sessions = (await _invoke(client, "sessions_list", "json")).json()
+        assert sessions["ok"] and len(sessions["result"]["sessions"]) == 3
+
+        history = (await _invoke(client, "sessions_history", "json", limit=2)).json()["result"]["messages"]
+        assert len(history) == 2
+
+        await client.post("/hooks/agent", json={"message": "ping", "sessionKey": "main"})
+        after = (await _invoke(client, "sessions_history", "json")).json()["result"]["messages"]
+        assert len(after) == 6 and after[-2]["content"] == "ping" and after[-1]["role"] == "assistant"
+
+        sent = (await _invoke(client, "channels", "send_message", channel="telegram", message="hi")).json()
+        recent = (await _invoke(client, "channels", "get_recent_messages", channel="telegram", limit=1)).json()
+        assert recent["result"]["messages"][0]["id"] == sent["result"]["messageId"]
+
+        routed = await _invoke(client, "routing", "get_session_by_channel", channel="slack")
+        assert routed.json()["result"]["sessionKey"] == "agent:main:slack"
+        assert (await _invoke(client, "tts", text="hello")).json()["result"]["media"].startswith("MEDIA:")
+        assert (await client.post("/hooks/wake", json={"text": "x"})).json()["ok"] is True
+
+        missing = await _invoke(client, "does_not_exist")
+        assert missing.status_code == 404 and missing.json()["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_moltbook_endpoints() -> None:
+    """Feed, posts, comments and upvotes behave like the v1 API."""
+    async with _client({"payload": {"feed_posts": 5}}) as client:
+        feed = (await client.get("/api/v1/feed", params={"limit": "3"})).json()
+        assert feed["success"] and len(feed["posts"]) == 3
+        created = (await client.post("/api/v1/posts", json={"content": "hello molt"})).json()["post"]
+        pid = created["id"]
+        assert (await client.post(f"/api/v1/posts/{pid}/upvote")).json()["upvotes"] == created["upvotes"] + 1
+        assert (await client.post(f"/api/v1/posts/{pid}/comments", json={"content": "nice"})).status_code == 201
+        assert (await client.get(f"/api/v1/posts/{pid}")).json()["post"]["comment_count"] == 1
+        assert (await client.get("/api/v1/search", params={"q": "hello molt"})).json()["results"][0]["id"] == pid
+        assert (await client.get("/api/v1/posts/missing")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_error_injection_rate_limit_and_stats() -> None:
+    """Per-endpoint error rates, upstream rate limits and counters are applied."""
+    profile = {
+        "gateway": {"endpoints": {"tts": {"error_rate": 1.0, "error_status": 503}}},
+        "moltbook": {"rate_limit": {"requests": 2, "per_seconds": 60}},
+    }
+    async with _client(profile) as client:
+        assert (await _invoke(client, "tts", text="x")).status_code == 503
+        assert (await _invoke(client, "sessions_list")).status_code == 200
+        statuses = [(await client.get("/api/v1/feed")).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        limited = await client.get("/api/v1/feed")
+        assert int(limited.headers["Retry-After"]) >= 1
+
+        stats = (await client.get("/__emulator/stats")).json()["endpoints"]
+        assert stats["gateway tts"]["errors"] == 1
+        assert stats["moltbook GET /feed"]["rate_limited"] == 2
+        await client.post("/__emulator/reset")
+        assert (await client.get("/__emulator/stats")).json()["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_gateway_token_required_when_configured() -> None:
+    """With gateway_token set, requests need the matching bearer token."""
+    async with _client({"gateway_token": "secret"}) as client:
+        assert (await _invoke(client, "sessions_list")).status_code == 401
+        client.headers["Authorization"] = "Bearer secret"
+        assert (await _invoke(client, "sessions_list")).status_code == 200
+
+
+def test_latency_distributions() -> None:
+    """Samples follow the configured distribution and are clamped to [0, max_ms]."""
+    rng = random.Random(1)  # noqa: S311
+    assert LatencyProfile(mean_ms=25).sample(rng) == 0.025
+    uniform = [LatencyProfile(distribution="uniform", mean_ms=50, spread_ms=10).sample(rng) for _ in range(200)]
+    assert all(0.04 <= s <= 0.06 for s in uniform)
+    lognormal = [LatencyProfile(distribution="lognormal", mean_ms=20, spread_ms=20).sample(rng) for _ in range(4000)]
+    assert 0.017 < sum(lognormal) / len(lognormal) < 0.023
+    assert max(lognormal) > 0.05  # long tail
+    assert LatencyProfile(distribution="normal", mean_ms=10, spread_ms=100, max_ms=50).sample(rng) <= 0.05
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_against_served_emulator(monkeypatch: pytest.MonkeyPatch) -> None:
+    """GatewayClient works unchanged against the emulator served over HTTP."""
+    async with run_emulator(EmulatorProfile()) as url:
+        monkeypatch.setenv("OPENCLAW_GATEWAY_URL", url)
+        client = GatewayClient(Settings())
+        try:
+            result = await client.tools_invoke("sessions_list", action="json")
+            streamed = await client.tools_invoke_items("sessions_history", action="json", limit=5)
+        finally:
+            await client.close()
+    assert result["success"] and len(result["data"]["sessions"]) == 20
+    assert len(streamed["data"]["messages"]) == 5 and streamed["stream"]["stopped_early"]
@@ -1,5 +1,7 @@
 """Tests for openclaw_molt_mcp.gateway_client."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -158,3 +160,111 @@ async def test_close(gateway_client: GatewayClient) -> None:
     await gateway_client.close()
     mock_client.aclose.assert_called_once()
     assert gateway_client._client is None
+
+
+@pytest.mark.asyncio
+async def test_hooks_agent_forwards_thinking_and_timeout(gateway_client: GatewayClient) -> None:
+    """hooks_agent should send thinking/timeoutSeconds and bound the HTTP read deadline."""
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.raise_for_status = MagicMock()
+    mock_resp.json.return_value = {"ok": True}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=mock_resp)
+
+    with patch.object(
+        gateway_client,
+        "_get_client",
+        new_callable=AsyncMock,
+        return_value=mock_client,
+    ):
+        result = await gateway_client.hooks_agent("hi", thinking="high", timeout_seconds=60)
+        assert result["success"] is True
+        call_kw = mock_client.post.call_args[1]
+        assert call_kw["json"]["thinking"] == "high"
+        assert call_kw["json"]["timeoutSeconds"] == 60
+        assert call_kw["timeout"].read == 65
+
+
+@pytest.mark.asyncio
+async def test_close_completes_when_cancelled(gateway_client: GatewayClient) -> None:
+    """close should still close the pool when the calling task is being cancelled."""
+    closed = asyncio.Event()
+
+    async def slow_close() -> None:
+        await asyncio.sleep(0.01)
+        closed.set()
+
+    gateway_client._client = MagicMock(aclose=AsyncMock(side_effect=slow_close))
+
+    async def run() -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            await gateway_client.close()
+
+    task = asyncio.create_task(run())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert closed.is_set()
+    assert gateway_client._client is None
+
+
+def _mock_transport_client(gateway_client: GatewayClient, handler) -> None:
+    gateway_client._client = httpx.AsyncClient(
+        base_url=gateway_client.settings.gateway_url, transport=httpx.MockTransport(handler)
+    )
+
+
+@pytest.mark.asyncio
+async def test_tools_invoke_items_stops_at_limit(gateway_client: GatewayClient) -> None:
+    """tools_invoke_items should keep `limit` items, report stopped_early and close the stream."""
+    closed = []
+
+    async def body():
+        yield b'{"ok": true, "result": {"sessions": ['
+        for i in range(1000):
+            yield (b"," if i else b"") + json.dumps({"key": f"s{i}"}).encode()
+        yield b"]}}"
+
+    class Body(httpx.AsyncByteStream):
+        def __aiter__(self):
+            return body()
+
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["tool"] == "sessions_list"
+        return httpx.Response(200, stream=Body())
+
+    _mock_transport_client(gateway_client, handler)
+    result = await gateway_client.tools_invoke_items("sessions_list", action="json", limit=3)
+    await gateway_client.close()
+    assert result["success"] is True
+    assert result["data"] == {"sessions": [{"key": "s0"}, {"key": "s1"}, {"key": "s2"}]}
+    assert result["stream"]["items"] == 3 and result["stream"]["stopped_early"] is True
+    assert closed
+
+
+@pytest.mark.asyncio
+async def test_tools_invoke_items_errors(gateway_client: GatewayClient) -> None:
+    """Gateway errors, HTTP errors and malformed bodies become dialogic errors."""
+    responses = iter(
+        [
+            httpx.Response(200, json={"ok": False, "error": {"message": "Tool not available"}}),
+            httpx.Response(404, json={"error": "missing"}),
+            httpx.Response(200, content=b'{"ok": true, "result": [1, 2'),
+        ]
+    )
+    _mock_transport_client(gateway_client, lambda request: next(responses))
+    not_ok = await gateway_client.tools_invoke_items("sessions_send")
+    http_error = await gateway_client.tools_invoke_items("sessions_send")
+    malformed = await gateway_client.tools_invoke_items("sessions_send")
+    await gateway_client.close()
+    assert not_ok["success"] is False and not_ok["message"] == "Tool not available"
+    assert http_error["success"] is False and "404" in http_error["message"]
+    assert malformed["success"] is False and "malformed" in malformed["message"]
@@ -0,0 +1,48 @@
+"""Tests for unified inbox helpers (timestamps, k-way merge, cursors)."""
+
+import pytest
+
+from openclaw_molt_mcp.inbox import (
+    InvalidCursorError,
+    after_cursor,
+    channel_names,
+    decode_cursor,
+    encode_cursor,
+    merge_newest_first,
+    message_timestamp,
+)
+
+
+def test_message_timestamp_formats() -> None:
+    assert message_timestamp({"timestamp": 1700000000}) == 1700000000.0
+    assert message_timestamp({"ts": 1700000000500}) == 1700000000.5
+    assert message_timestamp({"date": "1700000000"}) == 1700000000.0
+    assert message_timestamp({"created_at": "2023-11-14T22:13:20Z"}) == 1700000000.0
+    assert message_timestamp({"text": "no time"}) == 0.0
+
+
+def test_merge_newest_first_interleaves_and_limits() -> None:
+    a = [{"id": "a1", "ts": 10}, {"id": "a2", "ts": 4}]
+    b = [{"id": "b1", "ts": 7}, {"id": "b2", "ts": 12}]
+    merged = merge_newest_first([a, b], limit=3)
+    assert [m["id"] for m in merged] == ["b2", "a1", "b1"]
+
+
+def test_cursor_round_trip_and_invalid() -> None:
+    state = {"before": 5.0, "seen": ["x"], "channels": ["telegram"], "depth": {"telegram": 2}}
+    assert decode_cursor(encode_cursor(state)) == state
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor!")
+
+
+def test_after_cursor_keeps_unseen_ties() -> None:
+    messages = [{"id": "1", "ts": 5}, {"id": "2", "ts": 5}, {"id": "3", "ts": 4}, {"id": "4", "ts": 6}]
+    assert [m["id"] for m in after_cursor(messages, 5.0, {"1"})] == ["2", "3"]
+
+
+def test_channel_names_shapes() -> None:
+    assert channel_names({"channels": [{"name": "telegram"}, "discord", {"id": "slack"}, {"x": 1}]}) == [
+        "telegram",
+        "discord",
+        "slack",
+    ]
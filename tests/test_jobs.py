@@ -0,0 +1,133 @@
+"""Tests for openclaw_molt_mcp.jobs and clawd_agent background runs."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openclaw_molt_mcp.jobs import CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, JobLimitError, JobRegistry
+from openclaw_molt_mcp.tracing import Span, TraceCollector, add_span_processor, span
+from tests.conftest import extract_tool_result
+
+
+@pytest.mark.asyncio
+async def test_job_succeeds_and_fails() -> None:
+    """Dialogic success/failure maps to job status."""
+    registry = JobRegistry()
+    ok = registry.submit("t", AsyncMock(return_value={"success": True, "data": 1}))
+    bad = registry.submit("t", AsyncMock(return_value={"success": False, "message": "nope"}))
+    await registry.wait(ok.id, 1)
+    await registry.wait(bad.id, 1)
+    assert ok.status == SUCCEEDED
+    assert ok.to_dict(include_result=True)["result"]["data"] == 1
+    assert bad.status == FAILED
+    assert bad.error == "nope"
+
+
+@pytest.mark.asyncio
+async def test_job_spans_form_their_own_trace() -> None:
+    """A job submitted inside a tool call's span does not leave its spans pending on that trace."""
+
+    class Collector(TraceCollector):
+        def __init__(self) -> None:
+            super().__init__()
+            self.traces: list[list[Span]] = []
+
+        def on_trace(self, spans: list[Span]) -> None:
+            self.traces.append(spans)
+
+    collector = Collector()
+    add_span_processor(collector)
+    release = asyncio.Event()
+
+    async def turn() -> dict:
+        await release.wait()
+        with span("gateway POST /tools/invoke", kind="client"):
+            return {"success": True}
+
+    registry = JobRegistry()
+    with span("tools/call clawd_agent", kind="server") as call:
+        job = registry.submit("run_agent", turn)
+    release.set()
+    await registry.wait(job.id, 1)
+
+    assert job.status == SUCCEEDED and collector._pending == {}
+    (call_trace, job_trace) = collector.traces
+    assert call_trace == [call]
+    assert [s.name for s in job_trace] == ["gateway POST /tools/invoke", "job run_agent"]
+    assert job_trace[-1].trace_id != call.trace_id and job_trace[-1].attributes["job_id"] == job.id
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_queues_jobs() -> None:
+    """Jobs beyond max_concurrent stay queued until a slot frees."""
+    registry = JobRegistry(max_concurrent=1)
+    release = asyncio.Event()
+
+    async def blocker() -> dict:
+        await release.wait()
+        return {"success": True}
+
+    first = registry.submit("t", blocker)
+    second = registry.submit("t", blocker)
+    await asyncio.sleep(0.01)
+    assert first.status == RUNNING
+    assert second.status == QUEUED
+    release.set()
+    await registry.wait(second.id, 1)
+    assert second.status == SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_pending_limit() -> None:
+    """Cancel marks the job cancelled; max_pending rejects new submissions."""
+    registry = JobRegistry(max_pending=1)
+    job = registry.submit("t", lambda: asyncio.sleep(10))
+    with pytest.raises(JobLimitError):
+        registry.submit("t", lambda: asyncio.sleep(10))
+    await registry.cancel(job.id)
+    assert job.status == CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_retention_evicts_oldest_finished() -> None:
+    """Finished jobs beyond max_retained are evicted oldest first."""
+    registry = JobRegistry(max_retained=2)
+    jobs = []
+    for _ in range(3):
+        job = registry.submit("t", AsyncMock(return_value={"success": True}))
+        await registry.wait(job.id, 1)
+        jobs.append(job)
+    registry.submit("t", AsyncMock(return_value={"success": True}))
+    assert registry.get(jobs[0].id) is None
+    assert registry.get(jobs[2].id) is not None
+
+
+@pytest.mark.asyncio
+async def test_clawd_agent_async_run_and_result(mcp_client) -> None:
+    """run_agent with async=true returns a job id; job_result returns the agent response."""
+    with patch("openclaw_molt_mcp.tools.agent.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.hooks_agent = AsyncMock(return_value={"success": True, "data": {"reply": "done"}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        started = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_agent",
+                arguments={"operation": "run_agent", "message": "work", "async": True},
+                raise_on_error=False,
+            )
+        )
+        assert started.get("success") is True
+        job_id = started["data"]["job_id"]
+
+        result = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_agent",
+                arguments={"operation": "job_result", "job_id": job_id, "wait_seconds": 1},
+                raise_on_error=False,
+            )
+        )
+        assert result["data"]["status"] == SUCCEEDED
+        assert result["data"]["result"]["data"] == {"reply": "done"}
@@ -0,0 +1,72 @@
+"""Tests for incremental parsing of Tools Invoke responses."""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from openclaw_molt_mcp.json_stream import JSONItemStream
+
+
+async def _chunks(raw: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(raw), size):
+        yield raw[i : i + size]
+
+
+async def _collect(payload: object, size: int, limit: int | None = None) -> tuple[JSONItemStream, list]:
+    stream = JSONItemStream(_chunks(json.dumps(payload, ensure_ascii=False).encode(), size))
+    items = []
+    async for item in stream:
+        items.append(item)
+        if limit is not None and len(items) >= limit:
+            break
+    return stream, items
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 5, 4096])
+async def test_items_under_list_key_with_sibling_fields(size: int) -> None:
+    """Items of result.sessions stream one by one; other keys are kept and the shape rebuilt."""
+    sessions = [{"key": f"s{i}", "label": "café ✓", "n": 1.5e3 * i} for i in range(3)]
+    result = {"count": 3, "sessions": sessions, "more": False}
+    stream, items = await _collect({"ok": True, "result": result}, size)
+    assert items == result["sessions"]
+    assert stream.container == "sessions" and stream.complete and stream.ok
+    assert stream.data(items) == result
+
+
+@pytest.mark.asyncio
+async def test_bare_array_result_and_scalar_numbers_across_chunks() -> None:
+    """A list result is streamed directly; numbers split across chunks are not cut short."""
+    stream, items = await _collect({"result": [12345, 678, {"a": []}], "ok": True}, 2)
+    assert items == [12345, 678, {"a": []}]
+    assert stream.data(items) == items and stream.envelope == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_stop_early_leaves_rest_unread() -> None:
+    """Breaking after `limit` items stops reading the body."""
+    payload = {"ok": True, "result": {"messages": [{"i": i, "text": "x" * 100} for i in range(5000)]}}
+    stream, items = await _collect(payload, 1024, limit=10)
+    assert [m["i"] for m in items] == list(range(10))
+    assert not stream.complete
+    assert stream.bytes_read < 32 * 1024
+    assert stream.data(items) == {"messages": items}
+
+
+@pytest.mark.asyncio
+async def test_error_envelope_and_non_list_result() -> None:
+    """ok=false exposes the error; results without a list come back whole."""
+    stream, items = await _collect({"ok": False, "error": {"message": "nope"}}, 3)
+    assert items == [] and not stream.ok and stream.envelope["error"] == {"message": "nope"}
+    stream, items = await _collect({"ok": True, "result": {"status": "sent"}}, 3)
+    assert items == [] and stream.data(items) == {"status": "sent"}
+
+
+@pytest.mark.asyncio
+async def test_truncated_body_raises_value_error() -> None:
+    """A body that ends mid-list is reported as malformed."""
+    stream = JSONItemStream(_chunks(b'{"ok":true,"result":[1,2', 4))
+    with pytest.raises(ValueError):
+        async for _ in stream:
+            pass
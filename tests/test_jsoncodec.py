@@ -0,0 +1,54 @@
+"""Tests for the shared JSON codec."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from openclaw_molt_mcp import jsoncodec
+
+BACKENDS = ["json"] + (["orjson"] if jsoncodec.orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = jsoncodec.backend
+    assert jsoncodec.use_backend(request.param) == request.param
+    yield request.param
+    jsoncodec.use_backend(previous)
+
+
+def test_round_trip_compact_utf8(backend) -> None:
+    payload = {"b": [1, 2.5, None, True], "a": "héllo ✓", "nested": {"k": "v"}}
+    raw = jsoncodec.dumpb(payload)
+    assert b", " not in raw and "héllo".encode() in raw
+    assert jsoncodec.loads(raw) == payload
+    assert jsoncodec.loads(raw.decode()) == payload
+    assert jsoncodec.dumps(payload, sort_keys=True).startswith('{"a":')
+
+
+def test_unknown_types_stringified(backend) -> None:
+    out = jsoncodec.loads(jsoncodec.dumpb({"when": datetime(2026, 1, 2, tzinfo=UTC), "obj": object()}))
+    assert out["when"].startswith("2026-01-02")
+    assert out["obj"].startswith("<object object")
+
+
+def test_invalid_json_raises_value_error(backend) -> None:
+    with pytest.raises(ValueError):
+        jsoncodec.loads(b"{not json")
+
+
+def test_response_json_uses_content_bytes_or_falls_back() -> None:
+    resp = MagicMock()
+    resp.content = b'{"ok": true}'
+    assert jsoncodec.response_json(resp) == {"ok": True}
+    resp.json.assert_not_called()
+
+    mocked = MagicMock()
+    mocked.json.return_value = {"from": "json()"}
+    assert jsoncodec.response_json(mocked) == {"from": "json()"}
+
+
+def test_unknown_backend_rejected() -> None:
+    with pytest.raises(ValueError):
+        jsoncodec.use_backend("simdjson")
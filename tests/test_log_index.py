@@ -0,0 +1,88 @@
+"""Tests for the indexed log query over current and rotated log files."""
+
+import json
+
+import pytest
+
+from openclaw_molt_mcp.log_index import LogIndex, parse_time
+
+
+def _line(minute: int, second: int, level: str = "INFO", **fields) -> str:
+    ts = f"2026-10-19T14:{minute:02d}:{second:02d}.000000+00:00"
+    return json.dumps({"ts": ts, "level": level, "logger": "t", "msg": f"{minute}:{second}", **fields}) + "\n"
+
+
+def _write(path, lines: list[str], mode: str = "w") -> None:
+    with path.open(mode, encoding="utf-8") as f:
+        f.writelines(lines)
+
+
+def _size(log_path) -> int:
+    return sum(p.stat().st_size for p in log_path.parent.glob(log_path.name + "*"))
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "openclaw-molt-mcp.log"
+    # Older backup: minute 0-1; current file: minute 2
+    _write(
+        path.with_name(path.name + ".1"),
+        [_line(0, s, tool="clawd_skills", operation="list") for s in range(5)]
+        + [_line(1, 0, "ERROR", tool="clawd_sessions", operation="history", error_type="ReadTimeout", cookie="x")],
+    )
+    _write(path, [_line(2, s, tool="clawd_sessions" if s % 2 else "clawd_moltbook") for s in range(6)])
+    return path
+
+
+def test_query_filters_newest_first_across_rotated_files(log_path) -> None:
+    index = LogIndex(log_path)
+    sessions = index.query(tool="clawd_sessions")
+    assert [e["msg"] for e in sessions["entries"]] == ["2:5", "2:3", "2:1", "1:0"]
+
+    errors = index.query(level="warning", error_type="ReadTimeout")
+    assert [e["msg"] for e in errors["entries"]] == ["1:0"]
+    assert errors["entries"][0]["cookie"] == "[REDACTED]"
+
+    window = index.query(since="2026-10-19T14:00:02", until="2026-10-19T14:01:00", limit=2)
+    assert [e["msg"] for e in window["entries"]] == ["1:0", "0:4"] and window["truncated"]
+    assert index.query(operation="list", since=parse_time("2026-10-19T14:01:00"))["entries"] == []
+    with pytest.raises(ValueError):
+        index.query(level="LOUD")
+    # Exactly `limit` matches is a complete answer.
+    assert not index.query(level="ERROR", limit=1)["truncated"]
+
+
+@pytest.mark.parametrize("value", ["inf", "1e20", "-1e20", "nan", "yesterday"])
+def test_out_of_range_times_are_value_errors(log_path, value) -> None:
+    with pytest.raises(ValueError):
+        LogIndex(log_path).query(since=value)
+
+
+def test_buckets_limit_what_is_read(log_path) -> None:
+    index = LogIndex(log_path)
+    everything = index.query(limit=100)
+    assert len(everything["entries"]) == 12 and everything["scanned_bytes"] == everything["indexed_bytes"]
+    # Only the minute-1 bucket has an ERROR; only its bytes are read.
+    errors = index.query(level="ERROR")
+    assert 0 < errors["scanned_bytes"] < everything["indexed_bytes"] / 5
+    assert index.query(tool="clawd_voice")["scanned_bytes"] == 0
+
+
+def test_index_is_incremental_and_survives_rotation(log_path) -> None:
+    index = LogIndex(log_path)
+    assert index.refresh()["indexed_bytes"] == _size(log_path)
+    assert index.index_path.is_file()
+
+    _write(log_path, [_line(2, 30, "WARNING"), '{"ts": "2026-10-19T14:02:31'], mode="a")  # partial last line
+    appended = index.refresh()["indexed_bytes"]
+    assert appended == len(_line(2, 30, "WARNING"))
+
+    # Rotate as RotatingFileHandler does: .1 -> .2, current -> .1, fresh current.
+    backup = log_path.with_name(log_path.name + ".1")
+    backup.rename(log_path.with_name(log_path.name + ".2"))
+    log_path.rename(backup)
+    _write(log_path, [_line(3, 0, "ERROR", tool="clawd_agent")])
+    # A new process reuses the saved index: only the new file is read (the partial line stays unindexed).
+    reopened = LogIndex(log_path)
+    assert reopened.refresh() == {"files": 3, "indexed_bytes": len(_line(3, 0, "ERROR", tool="clawd_agent"))}
+    assert [e["msg"] for e in reopened.query(level="WARNING")["entries"]] == ["3:0", "2:30", "1:0"]
@@ -0,0 +1,94 @@
+"""Tests for runtime log level overrides."""
+
+import logging
+import threading
+
+import pytest
+from fastmcp.client import Client
+
+from openclaw_molt_mcp.log_levels import LogLevelOverrides
+from openclaw_molt_mcp.mcp_instance import mcp
+from tests.conftest import extract_tool_result
+
+NAME = "openclaw_molt_mcp.test_log_levels"
+
+
+@pytest.fixture
+def overrides(tmp_path):
+    levels = LogLevelOverrides(tmp_path / "log-levels.json", default_ttl=60)
+    yield levels
+    levels.stop()
+
+
+def test_override_applies_and_reverts_after_ttl(overrides) -> None:
+    logging.getLogger(NAME).setLevel(logging.WARNING)
+    entry = overrides.set(NAME, "debug", ttl_seconds=30)
+    assert logging.getLogger(f"{NAME}.child").isEnabledFor(logging.DEBUG)
+    assert overrides.status()[0]["effective_level"] == "DEBUG"
+
+    assert overrides.sync(now=entry["expires_at"] - 1) == []
+    assert overrides.sync(now=entry["expires_at"]) == [NAME]
+    assert logging.getLogger(NAME).level == logging.WARNING
+    assert overrides.status() == [] and overrides.path.read_text() == "{}"
+
+    with pytest.raises(ValueError):
+        overrides.set(NAME, "TRACE")
+    with pytest.raises(ValueError):
+        overrides.set(NAME, "DEBUG", ttl_seconds=0)
+    logging.getLogger(NAME).setLevel(logging.NOTSET)
+
+
+def test_overrides_written_by_another_process_are_picked_up(overrides) -> None:
+    """The webapp API only writes the file; the server applies it on its next sync."""
+    writer = LogLevelOverrides(overrides.path, apply=False)
+    writer.set(NAME, "ERROR")
+    overrides.sync()
+    assert logging.getLogger(NAME).level == logging.ERROR
+    writer.clear()
+    overrides.sync()
+    assert logging.getLogger(NAME).level == logging.NOTSET
+
+
+def test_expiry_write_keeps_overrides_from_another_process(overrides) -> None:
+    """sync() re-reads the file under the lock before writing back, so a concurrent set survives."""
+    entry = overrides.set(NAME, "DEBUG", ttl_seconds=30)
+    LogLevelOverrides(overrides.path, apply=False).set(f"{NAME}.other", "ERROR")
+    overrides._signature = overrides._stat()  # as if the change landed within mtime granularity
+    assert overrides.sync(now=entry["expires_at"]) == [NAME]
+    assert list(overrides._read()) == [f"{NAME}.other"]
+    assert sorted(p.name for p in overrides.path.parent.iterdir()) == ["log-levels.json", "log-levels.lock"]
+    overrides.clear()
+    logging.getLogger(NAME).setLevel(logging.NOTSET)
+
+
+@pytest.mark.asyncio
+async def test_admin_set_list_and_reset(mcp_client, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("OPENCLAW_LOG_DIR", str(tmp_path))
+    result = extract_tool_result(
+        await mcp_client.call_tool(
+            "clawd_admin", {"operation": "set_log_level", "logger_name": NAME, "level": "DEBUG", "ttl_seconds": 120}
+        )
+    )
+    assert result["success"] is True and result["data"]["override"]["level"] == "DEBUG"
+    assert logging.getLogger(NAME).getEffectiveLevel() == logging.DEBUG
+
+    listed = extract_tool_result(await mcp_client.call_tool("clawd_admin", {"operation": "log_levels"}))
+    assert [o["logger"] for o in listed["data"]["overrides"]] == [NAME]
+
+    reset = extract_tool_result(await mcp_client.call_tool("clawd_admin", {"operation": "reset_log_level"}))
+    assert reset["data"]["reverted"] == [NAME]
+    assert logging.getLogger(NAME).level == logging.NOTSET
+
+
+@pytest.mark.asyncio
+async def test_sync_thread_runs_only_while_server_runs(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Importing the server starts nothing; the mcp lifespan starts and stops the sync thread."""
+    monkeypatch.setenv("OPENCLAW_LOG_DIR", str(tmp_path))
+
+    def sync_threads() -> list[threading.Thread]:
+        return [t for t in threading.enumerate() if t.name == "log-levels"]
+
+    assert sync_threads() == []
+    async with Client(transport=mcp):
+        assert len(sync_threads()) == 1
+    assert sync_threads() == []
@@ -0,0 +1,58 @@
+"""Tests for the structured logging pipeline and per-logger sampling."""
+
+import json
+import logging
+from datetime import datetime
+
+from structlog.contextvars import bound_contextvars
+
+from openclaw_molt_mcp.logging_config import (
+    RateSampler,
+    StructuredFileFormatter,
+    StructuredStreamFormatter,
+    parse_sampling,
+)
+
+
+def _record(name: str = "openclaw_molt_mcp.gateway_client", level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "took %.1fms", (41.7,), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_record_fields_timestamp_and_bound_context() -> None:
+    """ts comes from record.created; bound fields fill in, explicit extras win."""
+    record = _record(tool="sessions_list")
+    with bound_contextvars(tool="clawd_sessions", operation="list"):
+        payload = json.loads(StructuredFileFormatter().format(record))
+    assert list(payload)[:4] == ["ts", "level", "logger", "msg"]
+    assert abs(datetime.fromisoformat(payload["ts"]).timestamp() - record.created) < 1e-5
+    assert payload["msg"] == "took 41.7ms"
+    assert (payload["tool"], payload["operation"]) == ("sessions_list", "list")
+
+
+def test_formatters_share_one_event_per_record() -> None:
+    record = _record()
+    with bound_contextvars(operation="list"):
+        line = StructuredFileFormatter().format(record)
+    # Formatted again outside the context (second handler, rollover check): same event.
+    assert StructuredFileFormatter().format(record) == line
+    assert "operation=list" in StructuredStreamFormatter().format(record)
+
+
+def test_rate_sampler_caps_info_per_logger_and_reports_dropped() -> None:
+    sampler = RateSampler(parse_sampling("openclaw_molt_mcp.tools=2, openclaw_molt_mcp.tools.skills=1"))
+    skills = [_record("openclaw_molt_mcp.tools.skills") for _ in range(4)]
+    for r in skills:
+        r.created = 1000.0
+    assert [sampler.filter(r) for r in skills] == [True, False, False, False]
+    # Same decision when a second handler asks.
+    assert sampler.filter(skills[1]) is False
+    # Other loggers: own budget; warnings always pass; unconfigured loggers untouched.
+    assert sampler.filter(_record("openclaw_molt_mcp.tools.moltbook", created=1000.0))
+    assert sampler.filter(_record("openclaw_molt_mcp.tools.skills", logging.WARNING, created=1000.0))
+    assert all(sampler.filter(_record(created=1000.0)) for _ in range(10))
+
+    later = _record("openclaw_molt_mcp.tools.skills", created=1001.0)
+    assert sampler.filter(later) and later.sampled_out == 3
+    assert json.loads(StructuredFileFormatter().format(later))["sampled_out"] == 3
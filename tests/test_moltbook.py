@@ -0,0 +1,94 @@
+"""Tests for clawd_moltbook bulk operations."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tests.conftest import extract_tool_result
+
+
+@pytest.mark.asyncio
+async def test_clawd_moltbook_upvote_many(mcp_client) -> None:
+    """upvote_many should upvote each unique post and report per-item results."""
+    with patch("openclaw_molt_mcp.tools.moltbook.MoltbookClient") as mock_client_class:
+        mock_client = MagicMock()
+
+        async def post(path, json=None, max_wait=0.0):
+            if "bad" in path:
+                return {"success": False, "message": "Moltbook returned 404"}
+            return {"success": True, "message": "OK", "data": {}}
+
+        mock_client.post = AsyncMock(side_effect=post)
+        mock_client.close = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_moltbook",
+            arguments={"operation": "upvote_many", "post_ids": ["a", "b", "a", "bad"], "concurrency": 2},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is False
+        assert data["data"]["succeeded"] == 2
+        assert data["data"]["failed"] == 1
+        assert [r["post_id"] for r in data["data"]["results"]] == ["a", "b", "bad"]
+        assert all("elapsed_ms" in r for r in data["data"]["results"])
+        assert mock_client.post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_clawd_moltbook_comment_many_requires_content(mcp_client) -> None:
+    """comment_many without content returns error."""
+    result = await mcp_client.call_tool(
+        "clawd_moltbook",
+        arguments={"operation": "comment_many", "post_ids": ["a"]},
+        raise_on_error=False,
+    )
+    data = extract_tool_result(result)
+    assert data.get("success") is False
+    assert "content" in data.get("message", "")
+
+
+@pytest.mark.asyncio
+async def test_clawd_moltbook_comment_many_reports_rate_limited(mcp_client) -> None:
+    """Items that miss their rate-limit slot are listed with a retry hint."""
+    with patch("openclaw_molt_mcp.tools.moltbook.MoltbookClient") as mock_client_class:
+        mock_client = MagicMock()
+
+        async def post(path, json=None, max_wait=0.0):
+            if path.startswith("/posts/a/"):
+                return {"success": True, "message": "OK", "data": {}}
+            return {"success": False, "message": "rate limit", "error": "rate_limited", "retry_after": 35.0}
+
+        mock_client.post = AsyncMock(side_effect=post)
+        mock_client.close = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_moltbook",
+            arguments={"operation": "comment_many", "post_ids": ["a", "b", "c"], "content": "hi"},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data["data"]["rate_limited"] == ["b", "c"]
+        assert data["data"]["retry_after"] == 35.0
+        assert "max_wait_seconds" in data["message"]
+        assert {c.kwargs["max_wait"] for c in mock_client.post.call_args_list} == {30.0}
+
+
+@pytest.mark.asyncio
+async def test_clawd_moltbook_single_comment_waits_for_slot(mcp_client) -> None:
+    """A single comment waits briefly for its slot by default; max_wait_seconds=0 fails fast."""
+    with patch("openclaw_molt_mcp.tools.moltbook.MoltbookClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value={"success": True, "message": "OK", "data": {}})
+        mock_client.close = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        for extra, expected in (({}, 25.0), ({"max_wait_seconds": 0}, 0.0)):
+            await mcp_client.call_tool(
+                "clawd_moltbook",
+                arguments={"operation": "comment", "post_id": "a", "content": "hi", **extra},
+                raise_on_error=False,
+            )
+            assert mock_client.post.call_args.kwargs["max_wait"] == expected
@@ -0,0 +1,144 @@
+"""Tests for openclaw_molt_mcp.moltbook_index and clawd_moltbook local search."""
+
+import itertools
+import math
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openclaw_molt_mcp.moltbook_index import (
+    BM25_B,
+    BM25_K1,
+    MoltbookIndex,
+    extract_documents,
+    get_index,
+    merge_results,
+)
+from tests.conftest import extract_tool_result
+
+FEED = {
+    "posts": [
+        {
+            "id": "p1",
+            "title": "Lobster molting season",
+            "content": "Lobsters shed their shells to grow.",
+            "author": {"name": "clawdia"},
+            "comments": [{"id": "c1", "content": "Molting is fascinating"}],
+        },
+        {"id": "p2", "title": "Gateway tips", "content": "Bind the gateway to loopback only."},
+    ]
+}
+
+
+def test_extract_documents_posts_and_comments() -> None:
+    """extract_documents should flatten posts and nested comments."""
+    docs = {(d["kind"], d["id"]): d for d in extract_documents(FEED)}
+    assert ("post", "p1") in docs
+    assert ("post", "p2") in docs
+    assert docs[("comment", "c1")]["post_id"] == "p1"
+    assert docs[("post", "p1")]["author"] == "clawdia"
+
+
+def test_index_bm25_ranking() -> None:
+    """Documents with more matching terms should rank first."""
+    index = MoltbookIndex()
+    index.add_payload(FEED)
+    results = index.search("lobster molting")
+    assert results[0]["id"] == "p1"
+    assert all("score" in r for r in results)
+    assert index.search("nonexistent") == []
+
+
+def test_index_fuzzy_matching() -> None:
+    """Misspelled terms should only match when fuzzy is enabled."""
+    index = MoltbookIndex()
+    index.add_payload(FEED)
+    assert index.search("gatway") == []
+    assert index.search("gatway", fuzzy=True)[0]["id"] == "p2"
+
+
+def test_index_replaces_and_evicts() -> None:
+    """Re-adding a document replaces it; max_docs evicts the oldest."""
+    index = MoltbookIndex(max_docs=2)
+    index.add({"id": "a", "kind": "post", "content": "alpha"})
+    index.add({"id": "a", "kind": "post", "content": "beta"})
+    assert len(index) == 1
+    assert index.search("alpha") == []
+    index.add({"id": "b", "kind": "post", "content": "gamma"})
+    index.add({"id": "c", "kind": "post", "content": "delta"})
+    assert len(index) == 2
+    assert index.search("beta") == []
+
+
+def test_merge_results_dedupes() -> None:
+    """merge_results should keep remote order and mark overlapping hits."""
+    local = [{"id": "p2", "kind": "post", "content": "x", "score": 1.0}]
+    merged = merge_results(local, {"results": [{"id": "p2", "content": "x"}, {"id": "p3", "content": "y"}]})
+    assert [m["id"] for m in merged] == ["p2", "p3"]
+    assert merged[0]["source"] == "both"
+    assert merged[0]["score"] == 1.0
+
+
+def test_merge_results_keeps_local_hits() -> None:
+    """A full page of remote hits must not push every local hit out of the result."""
+    local = [{"id": f"l{i}", "kind": "post", "content": "x", "score": 1.0} for i in range(3)]
+    remote = {"results": [{"id": f"r{i}", "content": "y"} for i in range(10)]}
+    merged = merge_results(local, remote, limit=6)
+    assert [m["id"] for m in merged] == ["r0", "l0", "r1", "l1", "r2", "l2"]
+    assert [m["id"] for m in merge_results(local, remote, limit=10)][6:] == ["r3", "r4", "r5", "r6"]
+
+
+def test_index_search_matches_exhaustive_bm25() -> None:
+    """Pruned search should return the same scores as scoring every posting."""
+    rnd = random.Random(3)  # noqa: S311 (synthetic corpus)
+    words = [f"w{i}" for i in range(60)]
+    cum_weights = list(itertools.accumulate(1 / (i + 1) for i in range(len(words))))
+    index = MoltbookIndex(max_docs=400)
+
+    def add(i: int) -> None:
+        text = " ".join(rnd.choices(words, cum_weights=cum_weights, k=rnd.randint(1, 30)))
+        index.add({"id": f"p{i % 450}", "kind": "post", "content": text})
+
+    def exhaustive(query: str, limit: int) -> list[float]:
+        n_docs = len(index._docs)
+        avgdl = index._total_len / n_docs
+        scores: dict[int, float] = {}
+        for term in set(query.split()) & index._postings.keys():
+            postings = index._postings[term]
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5)) * (BM25_K1 + 1)
+            for doc, tf in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * index._doc_len[doc] / avgdl)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf / (tf + norm)
+        return [round(s, 4) for s in sorted(scores.values(), reverse=True)[:limit]]
+
+    queries = ["w0", "w0 w1 w30", "w2 w45", "w7 w8 w9 w59", "missing w3"]
+    for step in range(2000):
+        add(step)  # ids wrap at 450, so later adds replace documents and max_docs evicts
+        if step % 97 == 0:
+            for query in queries:
+                for limit in (1, 5, 20):
+                    assert [r["score"] for r in index.search(query, limit=limit)] == exhaustive(query, limit)
+
+
+@pytest.mark.asyncio
+async def test_clawd_moltbook_local_search(mcp_client) -> None:
+    """search with scope=local should answer from the index without calling Moltbook."""
+    get_index().clear()
+    get_index().add_payload(FEED)
+    with patch("openclaw_molt_mcp.tools.moltbook.MoltbookClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_client.close = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_moltbook",
+            arguments={"operation": "search", "query": "loopback", "scope": "local"},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is True
+        assert data["data"]["results"][0]["id"] == "p2"
+        mock_client.get.assert_not_called()
+    get_index().clear()
@@ -0,0 +1,77 @@
+"""Tests for on-demand tool profiling and clawd_admin."""
+
+import pytest
+
+from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.profiling import (
+    ProfilingMiddleware,
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    parse_tools,
+)
+from tests.conftest import extract_tool_result
+
+
+def _installed() -> list:
+    return [m for m in mcp.middleware if isinstance(m, ProfilingMiddleware)]
+
+
+def test_parse_tools() -> None:
+    assert parse_tools("clawd_sessions, clawd_moltbook,") == {"clawd_sessions", "clawd_moltbook"}
+    assert parse_tools(["*"]) == {"*"}
+    assert parse_tools(None) == frozenset()
+
+
+def test_middleware_only_installed_while_enabled(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Disabled profiling leaves no middleware in the call path."""
+    monkeypatch.setenv("OPENCLAW_PROFILE_DIR", str(tmp_path))
+    assert _installed() == []
+    enable_profiling("clawd_security")
+    enable_profiling("clawd_skills")
+    assert len(_installed()) == 1
+    assert get_profiler().tools == {"clawd_skills"}
+    disable_profiling()
+    assert _installed() == []
+    with pytest.raises(ValueError):
+        enable_profiling(" , ")
+
+
+@pytest.mark.asyncio
+async def test_admin_profiles_selected_tool(mcp_client, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Enabled via clawd_admin: selected tool calls write .prof + metadata, others do not."""
+    monkeypatch.setenv("OPENCLAW_PROFILE_DIR", str(tmp_path))
+    result = await mcp_client.call_tool("clawd_admin", {"operation": "profiling_enable", "tools": ["clawd_security"]})
+    assert extract_tool_result(result)["data"]["enabled"] is True
+
+    await mcp_client.call_tool("clawd_security", {"operation": "recommendations"})
+    await mcp_client.call_tool("clawd_admin", {"operation": "profiling_status"})
+
+    listed = extract_tool_result(await mcp_client.call_tool("clawd_admin", {"operation": "list_profiles"}))
+    profiles = listed["data"]["profiles"]
+    assert [(p["tool"], p["operation"]) for p in profiles] == [("clawd_security", "recommendations")]
+    assert profiles[0]["success"] is True and (tmp_path / profiles[0]["file"]).is_file()
+
+    args = {"operation": "profile_summary", "name": profiles[0]["file"], "limit": 5}
+    summary = extract_tool_result(await mcp_client.call_tool("clawd_admin", args))
+    assert summary["success"] is True and 0 < len(summary["data"]["functions"]) <= 5
+    assert {"function", "calls", "tottime_ms", "cumtime_ms"} <= set(summary["data"]["functions"][0])
+
+    disabled = extract_tool_result(await mcp_client.call_tool("clawd_admin", {"operation": "profiling_disable"}))
+    assert disabled["data"]["enabled"] is False and disabled["data"]["profiled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_and_pruning(mcp_client, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """sample_rate 0 profiles nothing; only profile_max_files newest profiles are kept."""
+    monkeypatch.setenv("OPENCLAW_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("OPENCLAW_PROFILE_MAX_FILES", "2")
+    enable_profiling("*", sample_rate=0.0)
+    await mcp_client.call_tool("clawd_security", {"operation": "recommendations"})
+    assert list(tmp_path.glob("*.prof")) == []
+
+    enable_profiling("*", sample_rate=1.0)
+    for _ in range(3):
+        await mcp_client.call_tool("clawd_security", {"operation": "recommendations"})
+    assert len(list(tmp_path.glob("*.prof"))) == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
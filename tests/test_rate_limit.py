@@ -0,0 +1,34 @@
+"""Tests for openclaw_molt_mcp.rate_limit."""
+
+import pytest
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.rate_limit import MoltbookRateLimiter, RateLimitExceeded, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_fail_fast() -> None:
+    """An empty bucket should raise with retry_after when max_wait is too short."""
+    bucket = TokenBucket("comments", rate=1 / 20, capacity=1)
+    assert await bucket.acquire(max_wait=0) == 0
+    with pytest.raises(RateLimitExceeded) as exc:
+        await bucket.acquire(max_wait=0)
+    assert exc.value.retry_after > 19
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_allowed() -> None:
+    """Callers within max_wait should sleep for their reserved slot."""
+    bucket = TokenBucket("fast", rate=100, capacity=1)
+    await bucket.acquire()
+    waited = await bucket.acquire(max_wait=1)
+    assert 0 < waited <= 0.011
+
+
+def test_bucket_for_paths() -> None:
+    """Posts and comments map to their dedicated buckets; other writes do not."""
+    limiter = MoltbookRateLimiter(Settings())
+    assert limiter.bucket_for("POST", "/posts") is limiter.posts
+    assert limiter.bucket_for("POST", "/posts/abc/comments") is limiter.comments
+    assert limiter.bucket_for("POST", "/posts/abc/upvote") is None
+    assert limiter.bucket_for("GET", "/posts") is None
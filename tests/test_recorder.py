@@ -0,0 +1,154 @@
+"""Tests for tool-call recording and replay."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.mcp_instance import mcp
+from openclaw_molt_mcp.recorder import CallRecorder, RecordingMiddleware, recording_middleware, redact_args
+from openclaw_molt_mcp.replay import build_report, load_trace, peak_concurrency, replay, restore_args
+
+
+def test_redact_args_secrets_and_text() -> None:
+    """Secret-like keys are removed; free text keeps only its length (reversible to same size)."""
+    args = {
+        "api_key": "sk-1",
+        "message": "hello",
+        "args": {"sessionKey": "main", "token": "t", "content": "abc"},
+        "limit": 5,
+    }
+    redacted = redact_args(args)
+    assert redacted == {
+        "api_key": "[REDACTED]",
+        "message": "[REDACTED:5]",
+        "args": {"sessionKey": "main", "token": "[REDACTED]", "content": "[REDACTED:3]"},
+        "limit": 5,
+    }
+    assert redact_args(args, redact_text=False)["message"] == "hello"
+    assert restore_args(redacted)["args"]["content"] == "xxx"
+
+
+def test_redact_args_hashes_recipients() -> None:
+    """Recipients never reach the file in clear, but the same recipient keeps the same digest."""
+    redacted = redact_args(
+        {
+            "channel": "whatsapp",
+            "to": "+15551234567",
+            "targets": [{"channel": "telegram", "to": "+15551234567"}, {"channel": "slack", "to": "C0123"}],
+        }
+    )
+    assert redacted["channel"] == "whatsapp"
+    assert redacted["to"].startswith("[HASH:") and "5551234567" not in str(redacted)
+    assert redacted["targets"][0]["to"] == redacted["to"] != redacted["targets"][1]["to"]
+
+
+def test_recording_disabled_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No middleware unless OPENCLAW_RECORD_CALLS is set."""
+    assert recording_middleware(Settings()) is None
+    monkeypatch.setenv("OPENCLAW_RECORD_CALLS", "1")
+    assert isinstance(recording_middleware(Settings()), RecordingMiddleware)
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_tool_calls(mcp_client, tmp_path) -> None:
+    """Each tool call becomes one NDJSON record with redacted args, timing and result size."""
+    path = tmp_path / "calls.ndjson"
+    middleware = RecordingMiddleware(CallRecorder(path))
+    mcp.add_middleware(middleware)
+    try:
+        with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+            mock_client = MagicMock()
+            mock_client.tools_invoke = AsyncMock(return_value={"success": False, "message": "down"})
+            mock_client.close = AsyncMock()
+            mock_gateway_class.return_value = mock_client
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={"operation": "send", "args": {"message": "secret plan"}},
+                raise_on_error=False,
+            )
+        await mcp_client.call_tool("clawd_security", arguments={"operation": "recommendations"})
+    finally:
+        mcp.middleware.remove(middleware)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["tool"] for r in records] == ["clawd_sessions", "clawd_security"]
+    assert records[0]["args"]["args"] == {"message": "[REDACTED:11]"}
+    assert records[0]["success"] is False and records[1]["success"] is True
+    assert records[1]["result_bytes"] > 0 and records[1]["duration_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_replay_preserves_schedule_and_reports_deltas(mcp_client, tmp_path) -> None:
+    """Replay reissues calls at recorded offsets / speed and reports per-tool deltas."""
+    now = time.time()
+    trace = tmp_path / "trace.ndjson"
+    security = {"tool": "clawd_security", "args": {"operation": "recommendations"}, "duration_ms": 5.0}
+    skills = {
+        "tool": "clawd_skills",
+        "args": {"operation": "list", "workspace_path": str(tmp_path)},
+        "duration_ms": 2.0,
+    }
+    lines = [
+        {"ts": now, **security, "success": True},
+        {"ts": now + 0.001, **security, "success": True},
+        {"ts": now + 0.4, **skills, "success": True},
+    ]
+    trace.write_text("\n".join(json.dumps(x) for x in lines) + "\nnot json\n")
+    records = load_trace(trace)
+    assert len(records) == 3
+
+    outcomes = await replay(mcp_client, records, speed=4.0)
+    assert all(o["success"] for o in outcomes)
+    assert outcomes[2]["start"] >= 0.09  # 0.4 s at 4x
+    report = build_report(records, outcomes, 4.0)
+    assert report["overall"]["calls"] == 3
+    assert report["overall"]["recorded_peak_concurrency"] == 2
+    assert report["tools"]["clawd_security"]["calls"] == 2
+    assert "delta_p95_ms" in report["tools"]["clawd_skills"]
+
+
+@pytest.mark.asyncio
+async def test_replay_is_read_only_by_default_and_bounded() -> None:
+    """Sends, posts and disconnects are skipped and reported unless allow_writes is set."""
+    now = time.time()
+    records = [
+        {"ts": now, "tool": "clawd_gateway", "args": {}},
+        {"ts": now, "tool": "clawd_channels", "args": {"operation": "send_message", "to": "[HASH:ab]"}},
+        {"ts": now, "tool": "clawd_moltbook", "args": {"operation": "post", "content": "[REDACTED:4]"}},
+        {"ts": now, "tool": "clawd_moltbook", "args": {"operation": "feed"}},
+        {"ts": now, "tool": "clawd_openclaw_disconnect", "args": {}},
+        {"ts": now, "tool": "clawd_gateway", "args": {"operation": "doctor"}},
+    ]
+    running = peak = 0
+
+    async def call_tool(tool, args, raise_on_error=False):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return MagicMock(structured_content={"success": True})
+
+    client = MagicMock(call_tool=call_tool)
+    outcomes = await replay(client, records)
+    assert [o["tool"] for o in outcomes] == ["clawd_gateway", "clawd_moltbook"]
+    report = build_report(records, outcomes, 1.0)
+    assert report["skipped"] == {
+        "clawd_channels.send_message": 1,
+        "clawd_moltbook.post": 1,
+        "clawd_openclaw_disconnect": 1,
+        "clawd_gateway.doctor": 1,
+    }
+    assert report["overall"]["calls"] == 2
+
+    outcomes = await replay(client, records, allow_writes=True, max_in_flight=2)
+    assert len(outcomes) == 6 and peak == 2
+    assert build_report(records, outcomes, 1.0, allow_writes=True)["skipped"] == {}
+
+
+def test_peak_concurrency() -> None:
+    assert peak_concurrency([(0, 2), (1, 3), (2.5, 4), (5, 6)]) == 2
@@ -0,0 +1,134 @@
+"""Tests for openclaw_molt_mcp.resilience."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from openclaw_molt_mcp.config import Settings
+from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    breaker_states,
+    retry_after_seconds,
+    send_with_resilience,
+)
+
+REQUEST = httpx.Request("POST", "http://gateway/tools/invoke")
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers, request=REQUEST)
+
+
+def test_breaker_opens_and_half_opens(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Breaker should open at the threshold, fail fast, then admit one probe."""
+    now = [100.0]
+    monkeypatch.setattr("openclaw_molt_mcp.resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker("gw", failure_threshold=2, reset_timeout=10)
+    breaker.record_failure("boom")
+    assert breaker.state == CLOSED
+    breaker.record_failure("boom")
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] += 11
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_connect_error_retried_for_non_idempotent() -> None:
+    """Requests that never reached the upstream are retried even for POST."""
+    send = AsyncMock(side_effect=[httpx.ConnectError("refused"), _response(200)])
+    resp = await send_with_resilience(send, CircuitBreaker("gw"), RetryPolicy(backoff_base=0), idempotent=False)
+    assert resp.status_code == 200
+    assert send.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_read_timeout_not_retried_for_non_idempotent() -> None:
+    """A timeout after sending a non-idempotent request must not be repeated."""
+    send = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+    with pytest.raises(httpx.ReadTimeout):
+        await send_with_resilience(send, CircuitBreaker("gw"), RetryPolicy(backoff_base=0), idempotent=False)
+    assert send.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_honored() -> None:
+    """429 with Retry-After should sleep the hinted delay, then succeed."""
+    send = AsyncMock(side_effect=[_response(429, {"Retry-After": "2"}), _response(200)])
+    with patch("openclaw_molt_mcp.resilience.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        resp = await send_with_resilience(send, CircuitBreaker("gw"), RetryPolicy(), idempotent=False)
+    assert resp.status_code == 200
+    sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio
+async def test_server_error_exhausts_retries() -> None:
+    """Idempotent calls retry 5xx up to max_attempts, then raise HTTPStatusError."""
+    send = AsyncMock(return_value=_response(502))
+    breaker = CircuitBreaker("gw", failure_threshold=3)
+    with pytest.raises(httpx.HTTPStatusError):
+        await send_with_resilience(send, breaker, RetryPolicy(max_attempts=3, backoff_base=0), idempotent=True)
+    assert send.call_count == 3
+    # One logical call is one failure, whatever its retries.
+    assert breaker.failures == 1 and breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_probe_released_on_cancel_and_failed_on_other_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A half-open probe that is cancelled or raises unexpectedly must not wedge the breaker."""
+    now = [100.0]
+    monkeypatch.setattr("openclaw_molt_mcp.resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker("gw", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure("down")
+    now[0] += 11
+
+    with pytest.raises(asyncio.CancelledError):
+        await send_with_resilience(AsyncMock(side_effect=asyncio.CancelledError), breaker, RetryPolicy(), True)
+    assert breaker.state == HALF_OPEN and not breaker.probe_in_flight
+
+    with pytest.raises(ValueError):
+        await send_with_resilience(AsyncMock(side_effect=ValueError("bad json")), breaker, RetryPolicy(), True)
+    assert breaker.state == OPEN and breaker.last_error == "ValueError: bad json"
+
+    # A 4xx is an answer from a healthy upstream: the probe closes the circuit.
+    now[0] += 11
+    with pytest.raises(httpx.HTTPStatusError):
+        await send_with_resilience(AsyncMock(return_value=_response(404)), breaker, RetryPolicy(), True)
+    assert breaker.state == CLOSED
+
+
+def test_retry_after_seconds_parsing() -> None:
+    """Retry-After accepts delta seconds; garbage is ignored."""
+    assert retry_after_seconds(_response(429, {"Retry-After": "5"})) == 5.0
+    assert retry_after_seconds(_response(429, {"Retry-After": "soon"})) is None
+    assert retry_after_seconds(_response(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_gateway_client_fails_fast_when_open(test_settings: Settings) -> None:
+    """Once the Gateway breaker is open, tools_invoke returns circuit_open without a request."""
+    client = GatewayClient(test_settings)
+    for _ in range(test_settings.breaker_failure_threshold):
+        client.breaker.record_failure("down")
+    mock_http = MagicMock(post=AsyncMock())
+    with patch.object(client, "_get_client", new_callable=AsyncMock, return_value=mock_http):
+        result = await client.tools_invoke("sessions_list", args={})
+    assert result["success"] is False
+    assert result["error"] == "circuit_open"
+    mock_http.post.assert_not_called()
+    assert breaker_states()[f"gateway:{test_settings.gateway_url}"]["state"] == OPEN
@@ -61,3 +61,195 @@ async def test_clawd_sessions_history(mcp_client) -> None:
             args={"limit": 10},
             session_key="main",
         )
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_history_incremental(mcp_client) -> None:
+    """history with incremental=true syncs into the local store and pages from it."""
+    transcript = [{"id": f"m{i}", "role": "user", "content": str(i)} for i in range(3)]
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock(
+            side_effect=lambda **kw: {"success": True, "data": {"messages": list(transcript)}}
+        )
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_sessions",
+            arguments={"operation": "history", "session_key": "main", "incremental": True, "limit": 2},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data.get("success") is True
+        assert [m["seq"] for m in data["data"]["messages"]] == [1, 2]
+        assert data["data"]["next_offset"] == 2
+        assert data["data"]["cursor"] == 3
+        assert data["data"]["fetched"] == 3
+
+        transcript.append({"id": "m3", "role": "assistant", "content": "3"})
+        result = await mcp_client.call_tool(
+            "clawd_sessions",
+            arguments={"operation": "history", "session_key": "main", "incremental": True, "since": 3},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert [m["id"] for m in data["data"]["messages"]] == ["m3"]
+        assert data["data"]["fetched"] == 1
+        assert mock_client.tools_invoke.call_args.kwargs["args"] == {"limit": 50}
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_archive_and_read(mcp_client) -> None:
+    """archive syncs and exports a compressed segment; archive_history reads ranges back."""
+    transcript = [{"id": f"m{i}", "role": "user", "content": str(i)} for i in range(5)]
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock(return_value={"success": True, "data": {"messages": transcript}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        archived = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={"operation": "archive", "session_key": "main"},
+                raise_on_error=False,
+            )
+        )
+        assert archived.get("success") is True
+        assert archived["data"]["messages"] == 5
+
+        page = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={"operation": "archive_history", "session_key": "main", "since": 2, "limit": 2},
+                raise_on_error=False,
+            )
+        )
+        assert [m["id"] for m in page["data"]["messages"]] == ["m2", "m3"]
+        assert page["data"]["next_since"] == 4
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_history_many_splits_failures(mcp_client) -> None:
+    """history_many fetches each session concurrently and separates failures from results."""
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+
+        async def tools_invoke(**kwargs):
+            if kwargs["session_key"] == "gone":
+                return {"success": False, "message": "Session not found", "error": "not_found"}
+            return {"success": True, "data": {"messages": [{"content": kwargs["session_key"]}]}}
+
+        mock_client.tools_invoke = AsyncMock(side_effect=tools_invoke)
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        data = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={"operation": "history_many", "session_keys": ["a", "gone", "b", "a"], "concurrency": 2},
+                raise_on_error=False,
+            )
+        )
+        assert data.get("success") is False
+        assert [r["session_key"] for r in data["data"]["results"]] == ["a", "b"]
+        assert data["data"]["results"][1]["data"]["messages"][0]["content"] == "b"
+        assert [f["session_key"] for f in data["data"]["failures"]] == ["gone"]
+        assert mock_client.tools_invoke.await_count == 3
+        mock_gateway_class.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_send_many_targets_args(mcp_client) -> None:
+    """send_many sets each target as args.sessionKey and calls as the caller session."""
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock(return_value={"success": True, "data": {"ok": True}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        data = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={
+                    "operation": "send_many",
+                    "session_key": "coordinator",
+                    "session_keys": ["w1", "w2"],
+                    "args": {"message": "status?"},
+                },
+                raise_on_error=False,
+            )
+        )
+        assert data.get("success") is True
+        assert data["data"]["failures"] == []
+        calls = [c.kwargs for c in mock_client.tools_invoke.call_args_list]
+        assert [c["args"] for c in calls] == [
+            {"message": "status?", "sessionKey": "w1"},
+            {"message": "status?", "sessionKey": "w2"},
+        ]
+        assert {c["tool"] for c in calls} == {"sessions_send"}
+        assert {c["session_key"] for c in calls} == {"coordinator"}
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_many_requires_keys(mcp_client) -> None:
+    """history_many without session_keys returns an error."""
+    data = extract_tool_result(
+        await mcp_client.call_tool(
+            "clawd_sessions",
+            arguments={"operation": "history_many"},
+            raise_on_error=False,
+        )
+    )
+    assert data.get("success") is False
+    assert "session_keys" in data["message"]
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_history_shaping(mcp_client) -> None:
+    """history applies fields projection and page_size to the Gateway transcript."""
+    messages = [{"role": "user", "content": f"m{i}", "meta": {"tokens": i}} for i in range(4)]
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke = AsyncMock(return_value={"success": True, "data": {"messages": messages}})
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        data = extract_tool_result(
+            await mcp_client.call_tool(
+                "clawd_sessions",
+                arguments={"operation": "history", "fields": ["content"], "page_size": 3},
+                raise_on_error=False,
+            )
+        )
+        assert data["data"]["messages"] == [{"content": "m0"}, {"content": "m1"}, {"content": "m2"}]
+        assert data["page"]["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_clawd_sessions_list_stream_uses_limit(mcp_client) -> None:
+    """list with stream=true uses the streaming client call bounded by limit."""
+    with patch("openclaw_molt_mcp.tools.sessions.GatewayClient") as mock_gateway_class:
+        mock_client = MagicMock()
+        mock_client.tools_invoke_items = AsyncMock(
+            return_value={
+                "success": True,
+                "message": "Tool invoked successfully.",
+                "data": {"sessions": [{"id": "main"}]},
+                "stream": {"items": 1, "stopped_early": True, "bytes_read": 65536},
+            }
+        )
+        mock_client.close = AsyncMock()
+        mock_gateway_class.return_value = mock_client
+
+        result = await mcp_client.call_tool(
+            "clawd_sessions",
+            arguments={"operation": "list", "stream": True, "limit": 1},
+            raise_on_error=False,
+        )
+        data = extract_tool_result(result)
+        assert data["stream"]["stopped_early"] is True
+        mock_client.tools_invoke_items.assert_called_once_with(
+            tool="sessions_list", action="json", args={}, session_key="main", limit=1
+        )
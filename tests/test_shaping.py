@@ -0,0 +1,55 @@
+"""Tests for output shaping (projection, paging, byte budgets)."""
+
+from openclaw_molt_mcp.shaping import encoded_size, project, shape_result
+
+
+def _result(n: int, text: str = "hello") -> dict:
+    return {
+        "success": True,
+        "message": "ok",
+        "data": {"messages": [{"id": i, "author": {"name": f"u{i}", "bio": "x"}, "text": text} for i in range(n)]},
+    }
+
+
+def test_untouched_without_options() -> None:
+    result = _result(3)
+    assert shape_result(result) is result
+    failed = {"success": False, "message": "nope"}
+    assert shape_result(failed, fields=["id"]) is failed
+
+
+def test_project_dotted_fields() -> None:
+    item = {"id": 1, "author": {"name": "a", "bio": "b"}, "text": "t"}
+    assert project(item, ["id", "author.name", "missing.key"]) == {"id": 1, "author": {"name": "a"}}
+    assert project("plain", ["id"]) == "plain"
+
+
+def test_paging_with_cursor() -> None:
+    first = shape_result(_result(5), fields=["id"], page_size=2)
+    assert first["data"]["messages"] == [{"id": 0}, {"id": 1}]
+    assert first["page"]["total"] == 5
+    second = shape_result(_result(5), fields=["id"], page_size=2, cursor=first["page"]["next_cursor"])
+    assert second["data"]["messages"] == [{"id": 2}, {"id": 3}]
+    last = shape_result(_result(5), page_size=2, cursor=second["page"]["next_cursor"])
+    assert [m["id"] for m in last["data"]["messages"]] == [4]
+    assert last["page"]["next_cursor"] is None
+
+
+def test_max_bytes_defers_items_then_cuts_strings() -> None:
+    shaped = shape_result(_result(50, text="y" * 200), max_bytes=2000)
+    assert encoded_size(shaped) <= 2000
+    kept = shaped["page"]["returned"]
+    assert 0 < kept < 50
+    assert shaped["truncated"]["omitted_items"] == 50 - kept
+    assert shaped["page"]["next_cursor"]
+
+    huge = shape_result(_result(1, text="z" * 10_000), max_bytes=1000)
+    assert encoded_size(huge) <= 1000
+    assert huge["truncated"]["strings_truncated"] == 1
+    assert "chars]" in huge["data"]["messages"][0]["text"]
+
+
+def test_invalid_cursor() -> None:
+    shaped = shape_result(_result(2), cursor="!!!")
+    assert shaped["success"] is False
+    assert shaped["error"] == "invalid_cursor"
@@ -0,0 +1,70 @@
+"""Tests for the slow-call journal."""
+
+import pytest
+
+from openclaw_molt_mcp.slow_calls import SlowCallJournal, configure_slow_calls, get_journal, read_journal
+from openclaw_molt_mcp.tracing import _processors, add_span_processor, span
+from tests.conftest import extract_tool_result
+
+
+def test_entry_has_breakdown_sizes_and_redacted_args(tmp_path) -> None:
+    """Child spans become the breakdown; free text and secrets in args are redacted."""
+    journal = SlowCallJournal(0, path=tmp_path / "slow.jsonl")
+    add_span_processor(journal)
+    with span("tools/call clawd_agent", kind="server", tool="clawd_agent") as root:
+        root.payload = {"args": {"operation": "run", "message": "hello there", "api_key": "sk-1"}}
+        with span("gateway POST /tools/invoke", kind="client") as child:
+            child.set("http.status_code", 200)
+            child.set("http.response.body.size", 512)
+        with span("gateway POST /tools/invoke", kind="client") as retry:
+            retry.fail("ReadTimeout")
+
+    (entry,) = journal.recent()
+    assert entry["trace_id"] == root.trace_id and entry["tool"] == "clawd_agent"
+    assert entry["args"] == {"operation": "run", "message": "[REDACTED:11]", "api_key": "[REDACTED]"}
+    assert [b.get("status") for b in entry["breakdown"]] == [None, "ReadTimeout"]
+    assert entry["breakdown"][0]["http_status"] == 200 and entry["breakdown"][0]["response_bytes"] == 512
+    assert entry["upstream_ms"] >= entry["breakdown"][0]["duration_ms"]
+    assert read_journal(tmp_path / "slow.jsonl") == [entry]
+
+
+def test_fast_calls_skipped_and_zero_threshold_disables(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("OPENCLAW_SLOW_CALL_MS", "0")
+    assert configure_slow_calls() is None
+    assert get_journal() is None and _processors == []
+
+    journal = SlowCallJournal(60_000)
+    add_span_processor(journal)
+    with span("quick"):
+        pass
+    assert journal.recent() == []
+
+
+def test_read_journal_spans_rotated_files(tmp_path) -> None:
+    """Newest first across the live file and its numbered backups."""
+    path = tmp_path / "slow.jsonl"
+    journal = SlowCallJournal(0, path=path, max_bytes=600, backup_count=5)
+    add_span_processor(journal)
+    for i in range(12):
+        with span(f"call {i}"):
+            pass
+    journal.close()
+    assert list(tmp_path.glob("slow.jsonl.*"))
+    names = [e["name"] for e in read_journal(path, limit=5)]
+    assert names == [f"call {i}" for i in range(11, 6, -1)]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_journaled_and_listed_by_admin(mcp_client, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    """Over the threshold, a tool call lands in the ring buffer, the file and clawd_admin slow_calls."""
+    monkeypatch.setenv("OPENCLAW_SLOW_CALL_MS", "0.001")
+    monkeypatch.setenv("OPENCLAW_SLOW_CALL_PATH", str(tmp_path / "slow.jsonl"))
+    configure_slow_calls()
+
+    await mcp_client.call_tool("clawd_security", {"operation": "recommendations"})
+    data = extract_tool_result(await mcp_client.call_tool("clawd_admin", {"operation": "slow_calls"}))["data"]
+
+    (entry,) = data["entries"]
+    assert entry["tool"] == "clawd_security" and entry["operation"] == "recommendations"
+    assert entry["success"] is True and entry["result_bytes"] > 0
+    assert read_journal(tmp_path / "slow.jsonl")[-1]["trace_id"] == entry["trace_id"]
@@ -0,0 +1,110 @@
+"""Tests for request-scoped tracing and OTLP/JSON export."""
+
+import json
+import logging
+
+import httpx
+import pytest
+
+from openclaw_molt_mcp.logging_config import StructuredFileFormatter
+from openclaw_molt_mcp.tracing import TracingClient, configure_tracing, current_ids, span, subprocess_env
+
+
+@pytest.fixture
+def trace_file(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setenv("OPENCLAW_TRACE_EXPORT", "1")
+    monkeypatch.setenv("OPENCLAW_TRACE_EXPORT_PATH", str(path))
+    configure_tracing()
+    return path
+
+
+def _spans(path) -> list[list[dict]]:
+    """Spans per exported trace line."""
+    return [json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"] for line in path.read_text().splitlines()]
+
+
+def _record() -> logging.LogRecord:
+    return logging.LogRecord("t", logging.INFO, __file__, 1, "hello", None, None)
+
+
+def test_span_nesting_logs_and_subprocess_env() -> None:
+    """Children share the trace id; ids show up in log lines and TRACEPARENT; context resets."""
+    assert current_ids() is None and subprocess_env() is None
+    with span("outer") as outer:
+        with span("inner") as inner:
+            assert inner.trace_id == outer.trace_id and inner.parent_id == outer.span_id
+            payload = json.loads(StructuredFileFormatter().format(_record()))
+            assert (payload["trace_id"], payload["span_id"]) == (inner.trace_id, inner.span_id)
+            assert subprocess_env()["TRACEPARENT"] == f"00-{inner.trace_id}-{inner.span_id}-01"
+        assert current_ids() == (outer.trace_id, outer.span_id)
+    assert current_ids() is None
+    assert "trace_id" not in json.loads(StructuredFileFormatter().format(_record()))
+
+
+@pytest.mark.asyncio
+async def test_transport_propagates_traceparent_and_exports(trace_file) -> None:
+    """Each HTTP attempt is a client span under the caller's span and sends traceparent."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["traceparent"])
+        return httpx.Response(503 if len(seen) == 1 else 200, json={"ok": True})
+
+    async with TracingClient("gateway", transport=httpx.MockTransport(handler), base_url="http://gw") as client:
+        with span("tools/call clawd_sessions", kind="server") as root:
+            await client.post("/tools/invoke", json={})
+            await client.post("/tools/invoke", json={})
+
+    assert all(tp.split("-")[1] == root.trace_id for tp in seen)
+    (spans,) = _spans(trace_file)
+    by_name = {}
+    for s in spans:
+        by_name.setdefault(s["name"], []).append(s)
+    attempts = by_name["gateway POST /tools/invoke"]
+    assert [s["parentSpanId"] for s in attempts] == [root.span_id, root.span_id]
+    assert [s["status"]["code"] for s in attempts] == [2, 1] and attempts[0]["kind"] == 3
+    assert {"key": "http.status_code", "value": {"intValue": "503"}} in attempts[0]["attributes"]
+    assert [tp.split("-")[2] for tp in seen] == [s["spanId"] for s in attempts]
+    assert by_name["tools/call clawd_sessions"][0]["kind"] == 2
+
+
+@pytest.mark.asyncio
+async def test_client_keeps_env_proxies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tracing does not replace httpx's transports, so HTTP(S)_PROXY still routes requests."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    for name in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    async with TracingClient("moltbook") as client:
+        assert client._transport_for_url(httpx.URL("https://www.moltbook.com/api/v1/feed")) is not client._transport
+        assert client._transport_for_url(httpx.URL("http://127.0.0.1:18789/")) is client._transport
+
+
+@pytest.mark.asyncio
+async def test_tool_call_is_root_span(mcp_client, trace_file) -> None:
+    """The MCP middleware opens one root span per tool call, tagged with tool and operation."""
+    await mcp_client.call_tool("clawd_security", {"operation": "recommendations"})
+    (spans,) = _spans(trace_file)
+    (root,) = [s for s in spans if "parentSpanId" not in s]
+    assert root["name"] == "tools/call clawd_security"
+    attrs = {a["key"]: a["value"] for a in root["attributes"]}
+    assert attrs["tool"] == {"stringValue": "clawd_security"}
+    assert attrs["operation"] == {"stringValue": "recommendations"}
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+
+
+@pytest.mark.asyncio
+async def test_gateway_spans_join_tool_trace(mcp_client, trace_file, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Gateway request spans made inside a tool share its trace (connection refused here)."""
+    monkeypatch.setenv("OPENCLAW_GATEWAY_URL", "http://127.0.0.1:9")
+    monkeypatch.setenv("OPENCLAW_RETRY_MAX_ATTEMPTS", "2")
+    await mcp_client.call_tool("clawd_gateway", {"operation": "status"}, raise_on_error=False)
+    (spans,) = _spans(trace_file)
+    ids = {s["spanId"]: s for s in spans}
+    (root,) = [s for s in spans if "parentSpanId" not in s]
+    logical = [s for s in spans if s["name"] == "gateway sessions_list.json"]
+    attempts = [s for s in spans if s["name"] == "gateway POST /tools/invoke"]
+    assert root["status"]["code"] == 2
+    assert len(logical) == 1 and logical[0]["parentSpanId"] == root["spanId"]
+    assert len(attempts) == 2 and all(ids[a["parentSpanId"]] is logical[0] for a in attempts)
+    assert attempts[0]["status"]["message"] == "ConnectError"
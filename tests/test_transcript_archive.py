@@ -0,0 +1,115 @@
+"""Tests for the compressed transcript archive."""
+
+import gzip
+import json
+
+import pytest
+
+from openclaw_molt_mcp import transcript_archive
+from openclaw_molt_mcp.transcript_archive import BLOCK_MESSAGES, TranscriptArchive
+from openclaw_molt_mcp.transcript_store import TranscriptStore
+
+
+def _store(tmp_path, count: int) -> TranscriptStore:
+    store = TranscriptStore(tmp_path / "t.db")
+    store.append("agent:main", [{"id": f"m{i}", "role": "user", "content": f"hello {i} " * 20} for i in range(count)])
+    return store
+
+
+def test_export_is_incremental_and_gzip_readable(tmp_path) -> None:
+    store = _store(tmp_path, 600)
+    archive = TranscriptArchive(tmp_path / "archive", codec="gzip")
+
+    first = archive.export_from_store(store, "agent:main")
+    assert first["messages"] == 600
+    assert first["archived_through"] == 600
+    assert first["compressed_bytes"] < first["raw_bytes"]
+    assert archive.export_from_store(store, "agent:main")["messages"] == 0
+
+    # Blocks are independent gzip members; the segment still decompresses as one stream.
+    (segment,) = (tmp_path / "archive").glob("agent_main-*/seg-000000000001.ndjson.gz")
+    lines = gzip.decompress(segment.read_bytes()).splitlines()
+    assert len(lines) == 600
+    assert json.loads(lines[0])["id"] == "m0"
+
+    store.append("agent:main", [{"id": "m600", "role": "assistant", "content": "late"}])
+    second = archive.export_from_store(store, "agent:main")
+    assert second["messages"] == 1
+    assert len(archive.segments("agent:main")) == 2
+
+
+def test_read_ranges_across_blocks_and_segments(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _store(tmp_path, 600)
+    archive = TranscriptArchive(tmp_path / "archive", codec="gzip")
+    archive.export_from_store(store, "agent:main")
+    store.append("agent:main", [{"id": f"x{i}", "role": "user", "content": "x"} for i in range(3)])
+    archive.export_from_store(store, "agent:main")
+
+    decompressed: list[int] = []
+    real = transcript_archive._decompress
+    monkeypatch.setattr(
+        transcript_archive, "_decompress", lambda codec, data: decompressed.append(len(data)) or real(codec, data)
+    )
+
+    page = archive.read("agent:main", since=BLOCK_MESSAGES - 2, limit=4)
+    assert [m["seq"] for m in page["messages"]] == [255, 256, 257, 258]
+    assert [m["id"] for m in page["messages"]] == ["m254", "m255", "m256", "m257"]
+    assert len(decompressed) == 2
+    assert page["next_since"] == 258
+
+    tail = archive.read("agent:main", since=598, limit=10)
+    assert [m["id"] for m in tail["messages"]] == ["m598", "m599", "x0", "x1", "x2"]
+    assert tail["next_since"] is None
+    assert tail["archived_through"] == 603
+
+
+def test_session_dirs_never_collide(tmp_path) -> None:
+    """Keys that sanitize to the same name keep separate archives; dot-only keys are rejected."""
+    store = _store(tmp_path, 3)
+    store.append("agent_main", [{"id": "other", "role": "user", "content": "x"}])
+    archive = TranscriptArchive(tmp_path / "archive", codec="gzip")
+    assert archive.export_from_store(store, "agent:main")["messages"] == 3
+    assert archive.export_from_store(store, "agent_main")["messages"] == 1
+    assert [m["id"] for m in archive.read("agent_main")["messages"]] == ["other"]
+    for key in ("", ".", ".."):
+        with pytest.raises(ValueError):
+            archive.export_from_store(store, key)
+
+
+def test_interrupted_write_leaves_nothing_archived(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failure while writing a segment leaves no segment, index or temp file behind."""
+    store = _store(tmp_path, 300)
+    archive = TranscriptArchive(tmp_path / "archive", codec="gzip")
+    real = transcript_archive._compress
+    calls = 0
+
+    def flaky(codec: str, data: bytes) -> bytes:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise OSError("disk full")
+        return real(codec, data)
+
+    monkeypatch.setattr(transcript_archive, "_compress", flaky)
+    with pytest.raises(OSError):
+        archive.export_from_store(store, "agent:main")
+    assert archive.last_seq("agent:main") == 0
+    assert [p.name for p in (tmp_path / "archive").rglob("*") if p.is_file()] == []
+
+    monkeypatch.setattr(transcript_archive, "_compress", real)
+    assert archive.export_from_store(store, "agent:main")["archived_through"] == 300
+
+
+def test_zstd_requires_package(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(transcript_archive, "zstandard", None)
+    assert transcript_archive.default_codec() == "gzip"
+    with pytest.raises(ValueError):
+        TranscriptArchive(tmp_path, codec="zstd")
+
+
+@pytest.mark.skipif(transcript_archive.zstandard is None, reason="zstandard not installed")
+def test_zstd_round_trip(tmp_path) -> None:
+    store = _store(tmp_path, 300)
+    archive = TranscriptArchive(tmp_path / "archive", codec="zstd")
+    archive.export_from_store(store, "agent:main")
+    assert [m["seq"] for m in archive.read("agent:main", since=299)["messages"]] == [300]
@@ -0,0 +1,108 @@
+"""Tests for the local transcript store and incremental sync."""
+
+import sqlite3
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openclaw_molt_mcp.transcript_store import SCHEMA_VERSION, TranscriptStore, sync_session
+
+
+def _msg(i: int) -> dict:
+    return {"id": f"m{i}", "role": "user" if i % 2 else "assistant", "content": f"message {i}", "timestamp": 1000 + i}
+
+
+def _gateway(transcript: list[dict]) -> MagicMock:
+    """Fake client serving the tail `limit` messages of a transcript."""
+
+    async def tools_invoke(**kwargs):
+        limit = kwargs["args"].get("limit")
+        tail = transcript[-limit:] if limit else transcript
+        return {"success": True, "data": {"messages": list(tail)}}
+
+    client = MagicMock()
+    client.tools_invoke = AsyncMock(side_effect=tools_invoke)
+    return client
+
+
+def test_store_append_is_idempotent_and_pages(tmp_path) -> None:
+    store = TranscriptStore(tmp_path / "t.db")
+    assert store.append("main", [_msg(1), _msg(2), _msg(3)]) == 3
+    assert store.append("main", [_msg(3)]) == 0
+    page = store.page("main", since=1, limit=1, offset=0)
+    assert [m["seq"] for m in page["messages"]] == [2]
+    assert page["total"] == 2
+    assert page["next_offset"] == 1
+    assert store.cursor("main") == ("id:m3", 3)
+    assert store.page("other")["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_full_then_only_tail(tmp_path) -> None:
+    store = TranscriptStore(tmp_path / "t.db")
+    transcript = [_msg(i) for i in range(200)]
+    client = _gateway(transcript)
+
+    first = await sync_session(client, store, "main")
+    assert first["data"]["fetched"] == 200
+    assert "limit" not in client.tools_invoke.call_args.kwargs["args"]
+
+    transcript.extend(_msg(i) for i in range(200, 205))
+    second = await sync_session(client, store, "main")
+    assert second["data"] == {"fetched": 5, "requests": 1, "window": 50}
+    assert store.cursor("main")[1] == 205
+
+
+@pytest.mark.asyncio
+async def test_sync_grows_window_until_anchor_found(tmp_path) -> None:
+    store = TranscriptStore(tmp_path / "t.db")
+    transcript = [_msg(i) for i in range(10)]
+    client = _gateway(transcript)
+    await sync_session(client, store, "main")
+
+    transcript.extend(_msg(i) for i in range(10, 130))
+    result = await sync_session(client, store, "main")
+    assert result["data"]["fetched"] == 120
+    assert [c.kwargs["args"]["limit"] for c in client.tools_invoke.call_args_list[1:]] == [50, 200]
+    assert [m["id"] for m in store.page("main", since=128)["messages"]] == ["m128", "m129"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_messages_without_id_are_kept(tmp_path) -> None:
+    """Identical id-less turns are distinct messages; only the overlap with the store is skipped."""
+    store = TranscriptStore(tmp_path / "t.db")
+    transcript = [{"role": "user", "content": "ok"}, {"role": "assistant", "content": "done"}]
+    client = _gateway(transcript)
+    await sync_session(client, store, "main")
+
+    transcript.extend([{"role": "user", "content": "ok"}, {"role": "user", "content": "ok"}])
+    result = await sync_session(client, store, "main")
+    assert result["data"]["fetched"] == 2
+    assert [m["content"] for m in store.page("main")["messages"]] == ["ok", "done", "ok", "ok"]
+    assert (await sync_session(client, store, "main"))["data"]["fetched"] == 0
+
+
+def test_new_store_sets_schema_version(tmp_path) -> None:
+    """A fresh store is stamped with SCHEMA_VERSION so later versions can migrate it."""
+    path = tmp_path / "t.db"
+    TranscriptStore(path).close()
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION == 1
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_runs_sqlite_off_the_event_loop(tmp_path) -> None:
+    """sync_session must not block the event loop on SQLite calls."""
+    store = TranscriptStore(tmp_path / "t.db")
+    threads = set()
+    append = store.append
+
+    def recording_append(session_key, messages):
+        threads.add(threading.current_thread())
+        return append(session_key, messages)
+
+    store.append = recording_append
+    assert (await sync_session(_gateway([_msg(1), _msg(2)]), store, "main"))["data"]["fetched"] == 2
+    assert threads and threading.main_thread() not in threads
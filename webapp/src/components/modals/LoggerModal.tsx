@@ -1,7 +1,8 @@
-import { useCallback, useEffect } from "react";
+import { useCallback, useEffect, useState } from "react";
 import { X, RefreshCw, Trash2 } from "lucide-react";
 import { cn } from "../../utils/cn";
 import { useLog } from "../../context/LogContext";
+import { fetchSlowCalls, type SlowCallEntry } from "../../services/api";
 
 interface LoggerModalProps {
   isOpen: boolean;
@@ -37,6 +38,56 @@ function levelColor(level: string): string {
   }
 }
 
+function formatMs(ms: number): string {
+  return ms >= 1000 ? `${(ms / 1000).toFixed(2)} s` : `${ms.toFixed(0)} ms`;
+}
+
+function SlowCallItem({ call }: { call: SlowCallEntry }) {
+  return (
+    <li className="border-b border-border/50 py-1.5">
+      <div className="flex flex-wrap gap-x-2">
+        <span className="shrink-0 text-foreground-tertiary">
+          {formatTs(new Date(call.ts * 1000).toISOString())}
+        </span>
+        <span
+          className={cn(
+            "shrink-0 font-semibold",
+            call.success ? "text-amber-400" : "text-red-400"
+          )}
+        >
+          {formatMs(call.duration_ms)}
+        </span>
+        <span className="shrink-0 text-foreground-tertiary">[{call.source}]</span>
+        <span className="min-w-0 flex-1 break-all text-foreground-secondary">
+          {call.name}
+          {call.operation != null && ` ${call.operation}`}
+          {call.error != null && ` (${call.error})`}
+        </span>
+      </div>
+      {call.breakdown.length > 0 && (
+        <ul className="mt-1 space-y-0.5 pl-4 text-foreground-tertiary">
+          {call.breakdown.map((b, i) => (
+            <li key={i} className="flex flex-wrap gap-x-2">
+              <span className="shrink-0">+{formatMs(b.offset_ms)}</span>
+              <span className="shrink-0 text-foreground-secondary">
+                {formatMs(b.duration_ms)}
+              </span>
+              <span className="min-w-0 flex-1 break-all">
+                {b.name}
+                {b.http_status != null && ` ${b.http_status}`}
+                {b.response_bytes != null && ` ${b.response_bytes} B`}
+                {b.status != null && (
+                  <span className="text-red-400"> {b.status}</span>
+                )}
+              </span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </li>
+  );
+}
+
 export default function LoggerModal({ isOpen, onClose }: LoggerModalProps) {
   const {
     entries,
@@ -46,6 +97,21 @@ export default function LoggerModal({ isOpen, onClose }: LoggerModalProps) {
     logServerUrl,
     setLogServerUrl,
   } = useLog();
+  const [tab, setTab] = useState<"logs" | "slow">("logs");
+  const [slowCalls, setSlowCalls] = useState<SlowCallEntry[]>([]);
+  const [slowThreshold, setSlowThreshold] = useState<number | null>(null);
+  const [slowError, setSlowError] = useState<string | null>(null);
+
+  const loadSlowCalls = useCallback(async () => {
+    try {
+      const res = await fetchSlowCalls();
+      setSlowCalls(res.entries);
+      setSlowThreshold(res.threshold_ms);
+      setSlowError(null);
+    } catch (err) {
+      setSlowError(err instanceof Error ? err.message : String(err));
+    }
+  }, []);
 
   useEffect(() => {
     if (!isOpen) return;
@@ -55,8 +121,13 @@ export default function LoggerModal({ isOpen, onClose }: LoggerModalProps) {
   }, [isOpen, onClose]);
 
   const handleRefresh = useCallback(() => {
-    fetchLogs();
-  }, [fetchLogs]);
+    if (tab === "slow") loadSlowCalls();
+    else fetchLogs();
+  }, [tab, fetchLogs, loadSlowCalls]);
+
+  useEffect(() => {
+    if (isOpen && tab === "slow") loadSlowCalls();
+  }, [isOpen, tab, loadSlowCalls]);
 
   useEffect(() => {
     if (isOpen && logServerUrl) {
@@ -89,6 +160,21 @@ export default function LoggerModal({ isOpen, onClose }: LoggerModalProps) {
             Logger
           </h2>
           <div className="flex items-center gap-2">
+            {(["logs", "slow"] as const).map((t) => (
+              <button
+                key={t}
+                type="button"
+                onClick={() => setTab(t)}
+                className={cn(
+                  "rounded px-2 py-1 font-mono text-xs transition-colors",
+                  tab === t
+                    ? "bg-muted text-primary"
+                    : "text-foreground-secondary hover:text-foreground"
+                )}
+              >
+                {t === "logs" ? "Logs" : "Slow calls"}
+              </button>
+            ))}
             <input
               type="text"
               value={logServerUrl}
@@ -137,13 +223,34 @@ export default function LoggerModal({ isOpen, onClose }: LoggerModalProps) {
             </button>
           </div>
         </div>
-        {fetchError != null && (
+        {tab === "slow" && slowError != null && (
+          <div className="shrink-0 border-b border-border bg-muted/50 px-4 py-2 text-xs text-amber-400">
+            Server error: {slowError}
+          </div>
+        )}
+        {tab === "logs" && fetchError != null && (
           <div className="shrink-0 border-b border-border bg-muted/50 px-4 py-2 text-xs text-amber-400">
             Server error: {fetchError}. Ensure the webapp API (port 5181) is running, or set a custom log URL (e.g. http://127.0.0.1:8765/api/logs after running: python -m openclaw_molt_mcp.serve_logs).
           </div>
         )}
         <div className="flex-1 overflow-y-auto bg-background p-4 font-mono text-xs">
-          {entries.length === 0 ? (
+          {tab === "slow" ? (
+            slowCalls.length === 0 ? (
+              <p className="text-foreground-tertiary">
+                No slow calls
+                {slowThreshold != null && slowThreshold > 0
+                  ? ` over ${formatMs(slowThreshold)}`
+                  : " (journal off: OPENCLAW_SLOW_CALL_MS=0)"}
+                .
+              </p>
+            ) : (
+              <ul className="space-y-1">
+                {slowCalls.map((c) => (
+                  <SlowCallItem key={`${c.source}-${c.trace_id}`} call={c} />
+                ))}
+              </ul>
+            )
+          ) : entries.length === 0 ? (
             <p className="text-foreground-tertiary">
               No log entries. Logs are read from the API (same backend as the
               dashboard). Run the MCP server to generate entries, then click
@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { Zap, MessageSquare, Layers, Settings2, Send } from "lucide-react";
 import { cn } from "../utils/cn";
-import { askOpenClaw } from "../services/api";
+import { askOpenClaw, askOpenClawStream } from "../services/api";
 import { useLog } from "../context/LogContext";
 
 const cards = [
@@ -36,6 +36,7 @@ export default function Startpage() {
   const [askResponse, setAskResponse] = useState<string | null>(null);
   const [askLoading, setAskLoading] = useState(false);
   const [askError, setAskError] = useState<string | null>(null);
+  const [askStream, setAskStream] = useState(false);
   const { addLog } = useLog();
 
   async function handleAsk() {
@@ -45,8 +46,12 @@ export default function Startpage() {
     setAskError(null);
     setAskResponse(null);
     try {
-      const res = await askOpenClaw(msg);
-      setAskResponse(res.success ? res.message : res.error ?? res.message);
+      // Streaming runs a full agent turn (/hooks/agent); the default only wakes the agent (/hooks/wake).
+      const res = askStream
+        ? await askOpenClawStream(msg, (text) => setAskResponse(text))
+        : await askOpenClaw(msg);
+      const text = "text" in res ? res.text : "";
+      setAskResponse(res.success ? text || res.message : res.error ?? res.message);
       if (!res.success) {
         addLog({
           ts: new Date().toISOString(),
@@ -126,6 +131,18 @@ export default function Startpage() {
             <Send className="h-4 w-4" />
           </button>
         </div>
+        <label className="mt-2 flex items-center gap-2">
+          <input
+            type="checkbox"
+            checked={askStream}
+            onChange={(e) => setAskStream(e.target.checked)}
+            disabled={askLoading}
+            className="rounded border-border text-primary focus:ring-primary"
+          />
+          <span className="text-sm text-foreground-secondary">
+            Stream agent reply (runs a full agent turn via Gateway /hooks/agent instead of /hooks/wake)
+          </span>
+        </label>
         {askError && (
           <p className="mt-2 text-sm text-red-400">{askError}</p>
         )}
@@ -33,6 +33,53 @@ export async function askOpenClaw(message: string): Promise<AskResponse> {
   return res.json() as Promise<AskResponse>;
 }
 
+export interface AskStreamResult extends AskResponse {
+  text: string;
+  elapsed_ms: number;
+}
+
+/**
+ * Run an agent turn via /api/ask/stream (SSE over POST). onPartial receives the assistant
+ * text so far while the turn runs; resolves with the final result event.
+ */
+export async function askOpenClawStream(
+  message: string,
+  onPartial: (text: string) => void,
+  signal?: AbortSignal
+): Promise<AskStreamResult> {
+  const res = await fetch(apiUrl("/api/ask/stream"), {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+    body: JSON.stringify({ message }),
+    signal,
+  });
+  if (!res.ok || !res.body) {
+    const text = await res.text();
+    throw new Error(`Ask failed: ${res.status} ${text}`);
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep = buffer.indexOf("\n\n");
+    while (sep !== -1) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      sep = buffer.indexOf("\n\n");
+      const event = /^event: (.*)$/m.exec(block)?.[1];
+      const data = /^data: (.*)$/m.exec(block)?.[1];
+      if (!event || !data) continue;
+      const payload = JSON.parse(data);
+      if (event === "partial") onPartial(payload.text as string);
+      else if (event === "result") return payload as AskStreamResult;
+    }
+  }
+  throw new Error("Ask stream ended without a result");
+}
+
 export interface GatewayStatusResponse {
   success: boolean;
   message: string;
@@ -549,3 +596,45 @@ export async function insertMcpConfig(
   }
   return res.json() as Promise<McpConfigInsertResponse>;
 }
+
+export interface SlowCallBreakdownItem {
+  name: string;
+  offset_ms: number;
+  duration_ms: number;
+  http_status?: number;
+  request_bytes?: number;
+  response_bytes?: number;
+  exit_code?: number;
+  status?: string;
+}
+
+export interface SlowCallEntry {
+  ts: number;
+  trace_id: string;
+  name: string;
+  duration_ms: number;
+  success: boolean;
+  source: "mcp" | "webapp";
+  tool?: string;
+  operation?: string;
+  error?: string;
+  args?: Record<string, unknown>;
+  result_bytes?: number;
+  upstream_ms: number;
+  breakdown: SlowCallBreakdownItem[];
+}
+
+export interface SlowCallsResponse {
+  success: boolean;
+  entries: SlowCallEntry[];
+  threshold_ms: number;
+}
+
+export async function fetchSlowCalls(limit = 100): Promise<SlowCallsResponse> {
+  const res = await fetch(apiUrl(`/api/slow-calls?limit=${limit}`));
+  if (!res.ok) {
+    const text = await res.text();
+    throw new Error(`Slow calls failed: ${res.status} ${text}`);
+  }
+  return res.json() as Promise<SlowCallsResponse>;
+}
@@ -6,28 +6,40 @@ Run from repo root with PYTHONPATH=src:
 """
 
 import asyncio
+import contextlib
 import os
 import shutil
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-OLLAMA_BASE = os.environ.get("OLLAMA_BASE", "http://localhost:11434")
-WEBAPP_API_KEY = os.environ.get("WEBAPP_API_KEY", "")
-
 # Requires PYTHONPATH=src
+from openclaw_molt_mcp import jsoncodec
+from openclaw_molt_mcp.agent_stream import stream_agent_turn
 from openclaw_molt_mcp.config import Settings
 from openclaw_molt_mcp.gateway_client import GatewayClient
+from openclaw_molt_mcp.jobs import JobLimitError, get_job_registry
+from openclaw_molt_mcp.log_index import LogIndex
+from openclaw_molt_mcp.log_levels import LogLevelOverrides
 from openclaw_molt_mcp.logging_config import get_log_file_path
 from openclaw_molt_mcp.moltbook_client import MoltbookClient
+from openclaw_molt_mcp.moltbook_index import get_index, merge_results, search_local
+from openclaw_molt_mcp.profiling import ToolProfiler, list_profiles, profile_summary
+from openclaw_molt_mcp.resilience import breaker_states
 from openclaw_molt_mcp.serve_logs import tail_log_lines
+from openclaw_molt_mcp.slow_calls import configure_slow_calls, journal_path, read_journal
+from openclaw_molt_mcp.tools.agent import MAX_JOB_WAIT_SECONDS, run_agent_turn
+from openclaw_molt_mcp.tools.channels import broadcast, unified_inbox
 from openclaw_molt_mcp.tools.routing import _routing_config_fallback
 from openclaw_molt_mcp.tools.security import run_full_audit
-
+from openclaw_molt_mcp.tracing import configure_tracing, span
+from openclaw_molt_mcp.transcript_store import get_transcript_store, incremental_history
+from webapp_api.landing_page_service import generate_landing_page, sanitize_slug
+from webapp_api.mcp_config_insert import insert_into_config, list_clients
 from webapp_api.ollama_client import (
     load_preprompt,
     ollama_chat,
@@ -37,10 +49,23 @@ from webapp_api.ollama_client import (
     ollama_pull,
     ollama_tags,
 )
-from webapp_api.landing_page_service import generate_landing_page, sanitize_slug
-from webapp_api.mcp_config_insert import insert_into_config, list_clients
 
-app = FastAPI(title="openclaw-molt-mcp Webapp API", version="0.1.0")
+OLLAMA_BASE = os.environ.get("OLLAMA_BASE", "http://localhost:11434")
+WEBAPP_API_KEY = os.environ.get("WEBAPP_API_KEY", "")
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSON responses rendered by the shared codec (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return jsoncodec.dumpb(content)
+
+
+app = FastAPI(
+    title="openclaw-molt-mcp Webapp API",
+    version="0.1.0",
+    default_response_class=CodecJSONResponse,
+)
 
 # Serve generated landing pages via HTTP
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -59,6 +84,16 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def trace_middleware(request, call_next):
+    """Server span per API request; Gateway/Moltbook/Ollama calls made while handling it join its trace."""
+    attributes = {"http.method": request.method, "url.path": request.url.path}
+    with span(f"{request.method} {request.url.path}", kind="server", **attributes) as s:
+        response = await call_next(request)
+        s.set("http.status_code", response.status_code)
+        return response
+
+
 @app.middleware("http")
 async def api_key_middleware(request, call_next):
     """If WEBAPP_API_KEY is set, require X-API-Key on non-health endpoints. Local-only otherwise."""
@@ -74,6 +109,8 @@ async def api_key_middleware(request, call_next):
 
 
 settings = Settings()
+configure_tracing(settings)
+_slow_calls = configure_slow_calls(settings, process="webapp")
 
 
 class AskRequest(BaseModel):
@@ -159,7 +196,7 @@ async def health_aggregate():
     except Exception as e:
         results["log_server"] = {"ok": False, "message": str(e)}
 
-    return {"success": True, "checks": results}
+    return {"success": True, "checks": results, "breakers": breaker_states()}
 
 
 @app.get("/api/logs")
@@ -171,6 +208,92 @@ def api_logs(tail: int = 500):
     return {"entries": entries, "source": str(log_path)}
 
 
+_log_index = LogIndex(get_log_file_path(settings))
+
+
+@app.get("/api/logs/query")
+def api_logs_query(
+    level: str | None = None,
+    tool: str | None = None,
+    operation: str | None = None,
+    error_type: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int = 200,
+):
+    """Filter the MCP server log (current and rotated files) via the sidecar index; newest first.
+    level is a minimum; since/until are ISO-8601 (naive = UTC) or epoch seconds."""
+    try:
+        result = _log_index.query(level, tool, operation, error_type, since, until, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return {"success": True, **result, "source": str(_log_index.log_path)}
+
+
+def _profile_dir() -> Path:
+    return ToolProfiler.from_settings(settings).directory
+
+
+@app.get("/api/profiles")
+def api_profiles(limit: int = 50):
+    """Recent tool profiles written by the MCP server (enable via clawd_admin or OPENCLAW_PROFILE_TOOLS)."""
+    directory = _profile_dir()
+    return {"success": True, "profiles": list_profiles(directory, max(1, min(500, limit))), "directory": str(directory)}
+
+
+@app.get("/api/profiles/{name}")
+def api_profile_summary(name: str, limit: int = 30, sort: str = "cumulative"):
+    """Top functions of one profile (cumulative or tottime)."""
+    path = _profile_dir() / Path(name).name
+    if path.suffix != ".prof" or not path.is_file():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return {"success": True, "file": path.name, "functions": profile_summary(path, max(1, min(200, limit)), sort)}
+
+
+@app.get("/api/slow-calls")
+def api_slow_calls(limit: int = 100):
+    """Slow-call journal for the Logger modal: MCP server entries (journal file) and this API's own, newest first."""
+    limit = max(1, min(1000, limit))
+    entries = [{**e, "source": "mcp"} for e in read_journal(journal_path(settings), limit)]
+    if _slow_calls is not None:
+        entries += [{**e, "source": "webapp"} for e in _slow_calls.recent(limit)]
+    entries.sort(key=lambda e: e.get("ts", 0), reverse=True)
+    return {"success": True, "entries": entries[:limit], "threshold_ms": settings.slow_call_ms}
+
+
+class LogLevelRequest(BaseModel):
+    logger: str
+    level: str | None = None
+    ttl_seconds: float | None = None
+
+
+def _log_levels() -> LogLevelOverrides:
+    # Writes the MCP server's overrides file; the server picks changes up within a few seconds.
+    return LogLevelOverrides.from_settings(settings, apply=False)
+
+
+@app.get("/api/log-levels")
+def api_log_levels():
+    """Runtime log level overrides of the MCP server and when they revert."""
+    overrides = _log_levels()
+    overrides.sync()
+    return {"success": True, "overrides": overrides.status(), "default_ttl_seconds": overrides.default_ttl}
+
+
+@app.post("/api/log-levels")
+def api_set_log_level(req: LogLevelRequest):
+    """Set a logger's level in the MCP server for ttl_seconds (level null: revert now)."""
+    overrides = _log_levels()
+    if req.level is None:
+        overrides.clear(req.logger)
+    else:
+        try:
+            overrides.set(req.logger, req.level, req.ttl_seconds)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+    return {"success": True, "overrides": overrides.status()}
+
+
 @app.get("/api/openclaw/status")
 async def openclaw_status():
     """Detect if OpenClaw CLI is installed (openclaw --version). Returns cli_installed and optional version."""
@@ -214,6 +337,123 @@ async def ask(req: AskRequest):
         await client.close()
 
 
+class AskStreamRequest(BaseModel):
+    message: str
+    session_key: str = "main"
+    thinking: str | None = None
+    timeout_seconds: int | None = None
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {jsoncodec.dumps(data)}\n\n"
+
+
+@app.post("/api/ask/stream")
+async def ask_stream(req: AskStreamRequest):
+    """Run an agent turn (/hooks/agent, no delivery) and stream its output as server-sent events.
+
+    Events: `partial` ({text, delta, elapsed_ms}) while the agent writes, then one `result`
+    ({success, message, data, error, text, elapsed_ms}). Disconnecting cancels the turn.
+    """
+    if not req.message.strip():
+        raise HTTPException(status_code=400, detail="message required")
+
+    async def events():
+        client = GatewayClient(settings)
+        try:
+            async with contextlib.aclosing(
+                stream_agent_turn(
+                    client,
+                    req.message.strip(),
+                    session_key=req.session_key,
+                    thinking=req.thinking,
+                    timeout_seconds=req.timeout_seconds,
+                    poll_interval=settings.agent_stream_poll_interval,
+                )
+            ) as stream:
+                async for event in stream:
+                    if event["type"] == "partial":
+                        yield _sse("partial", {k: event[k] for k in ("text", "delta", "elapsed_ms")})
+                    else:
+                        result = event["result"]
+                        yield _sse(
+                            "result",
+                            {
+                                "success": result.get("success", False),
+                                "message": result.get("message", ""),
+                                "data": result.get("data"),
+                                "error": result.get("error"),
+                                "text": event["text"],
+                                "elapsed_ms": event["elapsed_ms"],
+                            },
+                        )
+        finally:
+            await client.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class AgentJobRequest(BaseModel):
+    message: str
+    session_key: str = "main"
+    thinking: str | None = None
+    timeout_seconds: int | None = None
+
+
+@app.post("/api/jobs")
+async def jobs_submit(req: AgentJobRequest):
+    """Start an isolated agent turn (run_agent) in the background. Returns job_id immediately."""
+    if not req.message.strip():
+        raise HTTPException(status_code=400, detail="message required")
+    try:
+        job = get_job_registry(settings).submit(
+            "run_agent",
+            lambda: run_agent_turn(settings, req.message.strip(), req.session_key, req.thinking, req.timeout_seconds),
+            meta={"session_key": req.session_key, "thinking": req.thinking, "timeout_seconds": req.timeout_seconds},
+        )
+    except JobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    return {"success": True, "data": job.to_dict()}
+
+
+@app.get("/api/jobs")
+def jobs_list():
+    """List jobs in this API process (newest first) with status counts."""
+    registry = get_job_registry(settings)
+    return {"success": True, "jobs": registry.list(), "counts": registry.counts()}
+
+
+@app.get("/api/jobs/{job_id}")
+def jobs_status(job_id: str):
+    """Job status without result payload."""
+    job = get_job_registry(settings).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return {"success": True, "data": job.to_dict()}
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def jobs_result(job_id: str, wait: float = 0):
+    """Job status plus result; waits up to `wait` seconds (max 300) for completion."""
+    job = await get_job_registry(settings).wait(job_id, max(0.0, min(wait, MAX_JOB_WAIT_SECONDS)))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return {"success": True, "data": job.to_dict(include_result=True)}
+
+
+@app.delete("/api/jobs/{job_id}")
+async def jobs_cancel(job_id: str):
+    """Cancel a queued or running job."""
+    job = await get_job_registry(settings).cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return {"success": True, "data": job.to_dict()}
+
+
 @app.get("/api/gateway/status")
 async def gateway_status():
     """Gateway reachability and sessions_list result."""
@@ -320,19 +560,34 @@ async def moltbook_feed(limit: int = 20):
     client = MoltbookClient(settings)
     try:
         result = await client.get("/feed", params={"limit": str(limit)})
+        if result.get("success"):
+            get_index().add_payload(result.get("data"))
         return result
     finally:
         await client.close()
 
 
 @app.get("/api/moltbook/search")
-async def moltbook_search(q: str = ""):
-    """Search Moltbook. Proxies to clawd_moltbook search."""
+async def moltbook_search(q: str = "", scope: str = "remote", fuzzy: bool = False, limit: int = 20):
+    """Search Moltbook. Proxies to clawd_moltbook search (scope: remote, local, merged)."""
     if not q.strip():
         return {"success": False, "message": "query required", "data": []}
+    if scope not in ("remote", "local", "merged"):
+        raise HTTPException(status_code=400, detail="scope must be remote, local or merged")
+    limit = max(1, min(100, limit))
+    if scope == "local":
+        return {"success": True, "message": "Local results", "data": search_local(q.strip(), limit, fuzzy)}
     client = MoltbookClient(settings)
     try:
         result = await client.get("/search", params={"q": q.strip()})
+        if result.get("success"):
+            get_index().add_payload(result.get("data"))
+        if scope == "merged":
+            data = search_local(q.strip(), limit, fuzzy)
+            remote_ok = bool(result.get("success"))
+            data["results"] = merge_results(data["results"], result.get("data") if remote_ok else None, limit)
+            data["remote_status"] = "ok" if remote_ok else "error"
+            return {"success": True, "message": "Merged results", "data": data}
         return result
     finally:
         await client.close()
@@ -549,6 +804,26 @@ class ChannelsRequest(BaseModel):
     args: dict | None = None
 
 
+class BroadcastTarget(BaseModel):
+    channel: str
+    to: str | None = None
+
+
+class BroadcastRequest(BaseModel):
+    targets: list[BroadcastTarget]
+    message: str
+    concurrency: int = 5
+    session_key: str = "main"
+
+
+class InboxRequest(BaseModel):
+    channels: list[str] | None = None
+    limit: int = 20
+    cursor: str | None = None
+    concurrency: int = 8
+    session_key: str = "main"
+
+
 class RoutingRequest(BaseModel):
     operation: str
     channel: str | None = None
@@ -589,6 +864,45 @@ async def channels_api(req: ChannelsRequest):
         await client.close()
 
 
+@app.post("/api/channels/broadcast")
+async def channels_broadcast(req: BroadcastRequest):
+    """Send one message to many (channel, to) targets concurrently; per-target results and timing."""
+    client = GatewayClient(settings)
+    try:
+        result = await broadcast(
+            client,
+            [t.model_dump() for t in req.targets],
+            req.message,
+            session_key=req.session_key,
+            concurrency=req.concurrency,
+        )
+    finally:
+        await client.close()
+    if not result.get("success") and "data" not in result:
+        raise HTTPException(status_code=400, detail=result["message"])
+    return result
+
+
+@app.post("/api/channels/inbox")
+async def channels_inbox(req: InboxRequest):
+    """Recent messages across channels, merged newest first; pass `next_cursor` back as `cursor`."""
+    client = GatewayClient(settings)
+    try:
+        result = await unified_inbox(
+            client,
+            req.channels,
+            limit=req.limit,
+            cursor=req.cursor,
+            session_key=req.session_key,
+            concurrency=req.concurrency,
+        )
+    finally:
+        await client.close()
+    if result.get("error") == "invalid_cursor":
+        raise HTTPException(status_code=400, detail=result["message"])
+    return result
+
+
 class LandingPageRequest(BaseModel):
     project_name: str
     hero_title: str = "The Next Big Thing"
@@ -689,6 +1003,10 @@ class SessionsRequest(BaseModel):
     operation: str
     session_key: str = "main"
     args: dict | None = None
+    incremental: bool = False
+    since: int = 0
+    limit: int = 50
+    offset: int = 0
 
 
 @app.post("/api/sessions")
@@ -707,6 +1025,16 @@ async def sessions_api(req: SessionsRequest):
     tool_name = tool_map[req.operation]
     client = GatewayClient(settings)
     try:
+        if req.operation == "history" and req.incremental:
+            return await incremental_history(
+                client,
+                get_transcript_store(settings),
+                req.session_key,
+                req.args,
+                since=req.since,
+                limit=req.limit,
+                offset=req.offset,
+            )
         result = await client.tools_invoke(
             tool=tool_name,
             action="json",
@@ -5,9 +5,15 @@ from pathlib import Path
 
 import httpx
 
+from openclaw_molt_mcp.adaptive_timeout import get_timeout_policy, timed_call
+from openclaw_molt_mcp.jsoncodec import response_json
+from openclaw_molt_mcp.tracing import TracingClient
+
 logger = logging.getLogger(__name__)
 
 OLLAMA_BASE = "http://localhost:11434"
+# Generation time depends on prompt and model size, so those endpoints keep a generous floor.
+GENERATION_FLOOR = 30.0
 PREPROMPT_PATH = Path(__file__).resolve().parent / "ollama_preprompt.txt"
 
 
@@ -21,8 +27,14 @@ def load_preprompt() -> str:
 async def ollama_health(base: str = OLLAMA_BASE) -> bool:
     """Check if Ollama is reachable."""
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            r = await client.get(f"{base.rstrip('/')}/api/tags")
+        async with TracingClient("ollama") as client:
+            r = await timed_call(
+                get_timeout_policy(),
+                "ollama",
+                "health",
+                lambda t: client.get(f"{base.rstrip('/')}/api/tags", timeout=t),
+                ceiling=3.0,
+            )
             return r.status_code == 200
     except Exception:
         return False
@@ -31,10 +43,16 @@ async def ollama_health(base: str = OLLAMA_BASE) -> bool:
 async def ollama_tags(base: str = OLLAMA_BASE) -> list[dict]:
     """List models. Returns list of { name, size, ... }."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(f"{base.rstrip('/')}/api/tags")
+        async with TracingClient("ollama") as client:
+            r = await timed_call(
+                get_timeout_policy(),
+                "ollama",
+                "tags",
+                lambda t: client.get(f"{base.rstrip('/')}/api/tags", timeout=t),
+                ceiling=10.0,
+            )
             r.raise_for_status()
-            data = r.json()
+            data = response_json(r)
             return data.get("models", [])
     except Exception as e:
         logger.warning("Ollama tags failed: %s", e)
@@ -53,10 +71,17 @@ async def ollama_generate(
     body: dict = {"model": model, "prompt": prompt, "stream": stream}
     if system:
         body["system"] = system
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        r = await client.post(url, json=body)
+    async with TracingClient("ollama") as client:
+        r = await timed_call(
+            get_timeout_policy(),
+            "ollama",
+            f"generate:{model}",
+            lambda t: client.post(url, json=body, timeout=t),
+            floor=GENERATION_FLOOR,
+            ceiling=120.0,
+        )
         r.raise_for_status()
-        return r.json()
+        return response_json(r)
 
 
 async def ollama_chat(
@@ -71,25 +96,38 @@ async def ollama_chat(
     body: dict = {"model": model, "messages": messages, "stream": stream}
     if system:
         body["system"] = system
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        r = await client.post(url, json=body)
+    async with TracingClient("ollama") as client:
+        r = await timed_call(
+            get_timeout_policy(),
+            "ollama",
+            f"chat:{model}",
+            lambda t: client.post(url, json=body, timeout=t),
+            floor=GENERATION_FLOOR,
+            ceiling=120.0,
+        )
         r.raise_for_status()
-        return r.json()
+        return response_json(r)
 
 
 async def ollama_pull(base: str, name: str) -> dict:
     """POST /api/pull. name: model name e.g. llama3.2."""
     url = f"{base.rstrip('/')}/api/pull"
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        r = await client.post(url, json={"name": name})
+    async with TracingClient("ollama") as client:
+        # Pull duration is dominated by model size, not server latency: fixed ceiling only.
+        r = await client.post(url, json={"name": name}, timeout=httpx.Timeout(600.0, connect=5.0))
         r.raise_for_status()
-        return r.json()
+        return response_json(r)
 
 
 async def ollama_delete(base: str, name: str) -> dict:
     """DELETE /api/delete. name: model name."""
     url = f"{base.rstrip('/')}/api/delete"
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        r = await client.delete(url, json={"name": name})
+    async with TracingClient("ollama") as client:
+        r = await timed_call(
+            get_timeout_policy(),
+            "ollama",
+            "delete",
+            lambda t: client.request("DELETE", url, json={"name": name}, timeout=t),
+        )
         r.raise_for_status()
-        return r.json() if r.content else {}
+        return response_json(r) if r.content else {}